@@ -0,0 +1,4 @@
+"""Offline end-to-end benchmarks with deterministic fakes of every external service
+
+Run with ``python -m benchmarks --help``.
+"""
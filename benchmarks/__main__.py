@@ -0,0 +1,132 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Settings refuse to load without API keys; the fakes never use them
+for key in ("SERPER_API_KEY", "EXA_API_KEY", "ANTHROPIC_API_KEY", "GROQ_API_KEY"):
+    os.environ.setdefault(key, "benchmark")
+
+from benchmarks.fakes import FaultProfile, configure, install_fakes, service_stats
+from benchmarks.scenarios import SCENARIOS
+from seoranker.utils.logger import setup_logger
+
+# Created before scenarios chdir so the shared log file stays in ./logs
+logger = setup_logger(__name__)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Default per-call latency (seconds) and generation speed (tokens/s) per service
+DEFAULT_LATENCY = {
+    "serper": (0.4, 0),
+    "exa": (0.8, 0),
+    "anthropic": (0.6, 80),
+    "groq": (0.15, 500),
+    "local": (0.5, 30),
+    "shopify": (0.3, 0),
+}
+
+def build_profiles(args: argparse.Namespace) -> Dict[str, FaultProfile]:
+    """Fault profile per service, scaled by --latency-scale"""
+    profiles = {}
+    for i, (name, (latency, tokens_per_second)) in enumerate(DEFAULT_LATENCY.items()):
+        profiles[name] = FaultProfile(
+            latency=latency * args.latency_scale,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            seed=args.seed + i,
+            tokens_per_second=tokens_per_second / args.latency_scale if args.latency_scale else 0
+        )
+    return profiles
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).parent
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+def run_scenario(name: str, args: argparse.Namespace) -> Dict:
+    """Run one scenario in a scratch working directory with fresh fakes"""
+    configure(build_profiles(args))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix=f"seoranker-bench-{name}-") as workdir:
+        os.chdir(workdir)
+        Path("logs").mkdir()
+        try:
+            output = io.StringIO()
+            with install_fakes(skip_pacing=args.skip_pacing, rate_scale=args.latency_scale), contextlib.redirect_stdout(output):
+                result = SCENARIOS[name](
+                    args.items,
+                    blog_provider=args.blog_provider,
+                    social_provider=args.social_provider
+                )
+        finally:
+            os.chdir(cwd)
+    result["services"] = {k: v for k, v in service_stats().items() if v["calls"]}
+    return result
+
+def print_result(result: Dict, previous: Optional[Dict] = None):
+    latency = result["latency_ms"]
+    line = (
+        f"{result['scenario']:<18} {result['succeeded']}/{result['items']} ok  "
+        f"{result['throughput_per_s']:.2f}/s  "
+        f"p50 {latency.get('p50', 0):.0f}ms  p95 {latency.get('p95', 0):.0f}ms  p99 {latency.get('p99', 0):.0f}ms"
+    )
+    if previous:
+        before = previous["throughput_per_s"]
+        change = (result["throughput_per_s"] - before) / before * 100 if before else 0.0
+        line += f"  (throughput {change:+.1f}% vs {before:.2f}/s)"
+    print(line)
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline pipeline benchmarks")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+                        help="Scenario to run (default: all)")
+    parser.add_argument("--items", type=int, default=10, help="Keywords/articles per scenario")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiply every fake service latency (and divide provider rate limits)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Latency jitter as a fraction")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Injected failure rate per call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--blog-provider", choices=["anthropic", "groq", "local"], default="anthropic")
+    parser.add_argument("--social-provider", choices=["anthropic", "groq", "local"], default="groq")
+    parser.add_argument("--skip-pacing", action="store_true",
+                        help="Skip the pipeline's fixed sleeps between API calls")
+    parser.add_argument("--compare", type=Path, help="Earlier results file to compare against")
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = {r["scenario"]: r for r in json.load(f)["scenarios"]}
+
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        logger.info(f"Running benchmark scenario: {name}")
+        result = run_scenario(name, args)
+        print_result(result, previous.get(name))
+        results.append(result)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "scenarios": results
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {output}")
+
+if __name__ == "__main__":
+    main()
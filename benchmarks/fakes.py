@@ -0,0 +1,497 @@
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional
+from unittest import mock
+
+# Captured before any patching so fake latency is never skipped
+_sleep = time.sleep
+# FakeLocalSession.post takes a ``json`` argument like requests does
+_json_dumps = json.dumps
+
+class FakeServiceError(ConnectionError):
+    """Injected failure from a fake service"""
+    pass
+
+class FaultProfile:
+    """Latency and failure injection for one fake service
+
+    Delays are ``latency`` seconds +/- ``jitter`` (as a fraction), drawn from a
+    seeded generator so runs with the same seed see the same sequence.
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.2, failure_rate: float = 0.0,
+                 seed: int = 0, tokens_per_second: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.tokens_per_second = tokens_per_second
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def _draw(self, output_tokens: int = 0):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency * (1 + self.jitter * (2 * self._random.random() - 1))
+            fail = self._random.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        if self.tokens_per_second and output_tokens:
+            delay += output_tokens / self.tokens_per_second
+        return max(delay, 0.0), fail
+
+    def wait(self, name: str, output_tokens: int = 0):
+        """Sleep for one call, raising if a failure is injected"""
+        delay, fail = self._draw(output_tokens)
+        _sleep(delay)
+        if fail:
+            raise FakeServiceError(f"Injected {name} failure")
+
+    async def await_(self, name: str, output_tokens: int = 0):
+        delay, fail = self._draw(output_tokens)
+        await asyncio.sleep(delay)
+        if fail:
+            raise FakeServiceError(f"Injected {name} failure")
+
+    def stats(self) -> Dict:
+        return {"calls": self.calls, "injected_failures": self.failures}
+
+def text_seed(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+# ---------------------------------------------------------------------------
+# Content
+# ---------------------------------------------------------------------------
+
+WORDS = (
+    "coffee roast aroma brew grind espresso flavor bean origin acidity body "
+    "crema extraction water temperature ratio filter robusta arabica blend"
+).split()
+
+def paragraph(seed: int, words: int = 60) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def fake_blog_response(prompt: str) -> str:
+    """Well-formed <metadata>/<content> blog response for a prompt"""
+    match = re.search(r'Primary keyword: (.+)', prompt)
+    keyword = match.group(1).strip() if match else "coffee"
+    seed = text_seed(prompt)
+    sections = []
+    for i in range(5):
+        paragraphs = "".join(f"<p>{paragraph(seed + i * 10 + j)}</p>" for j in range(2))
+        sections.append(f"<h2>{keyword.title()} section {i + 1}</h2>{paragraphs}")
+    return (
+        "<metadata>\n"
+        f"title: The Complete Guide to {keyword.title()}\n"
+        f"meta_description: Everything you need to know about {keyword}.\n"
+        "</metadata>\n"
+        "<content>\n"
+        f"<h1>The Complete Guide to {keyword.title()}</h1>"
+        + "".join(sections) +
+        "\n</content>"
+    )
+
+def fake_unstructured_response(prompt: str) -> str:
+    """Markdown article a provider returns when the prompt doesn't ask for <metadata>/<content>"""
+    match = re.search(r'Primary keyword: (.+)', prompt)
+    keyword = match.group(1).strip() if match else "coffee"
+    seed = text_seed(prompt)
+    sections = "\n\n".join(
+        f"## {keyword.title()} section {i + 1}\n\n{paragraph(seed + i * 10)}" for i in range(5)
+    )
+    return f"# The Complete Guide to {keyword.title()}\n\n{sections}"
+
+def fake_response(prompt: str) -> str:
+    """Route a prompt to the response shape the pipeline expects"""
+    if '"relevant_links"' in prompt:
+        return json.dumps({"relevant_links": []})
+    if '"instagram": "string"' in prompt:
+        seed = text_seed(prompt)
+        return json.dumps({
+            "linkedin": paragraph(seed, 80) + "\n#Coffee #BestiaBrisk",
+            "twitter": [f"[{i}/5] {paragraph(seed + i, 25)}" for i in range(1, 6)],
+            "instagram": paragraph(seed + 7, 60) + "\nLink in bio. #Coffee #BestiaBrisk"
+        })
+    if "Instagram" in prompt:
+        return paragraph(text_seed(prompt), 60) + "\nLink in bio. #Coffee #BestiaBrisk"
+    if "LinkedIn" in prompt:
+        return paragraph(text_seed(prompt), 80) + "\n#Coffee #BestiaBrisk"
+    if "Twitter" in prompt:
+        return "\n".join(f"[{i}/5] {paragraph(text_seed(prompt) + i, 25)}" for i in range(1, 6))
+    # Like a real model, only follow the output contract when the prompt states it
+    if "<metadata>" in prompt:
+        return fake_blog_response(prompt)
+    return fake_unstructured_response(prompt)
+
+def _token_count(text: str) -> int:
+    return max(len(text) // 4, 1)
+
+def _chunks(text: str, size: int = 64) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+def _prompt_from_messages(messages: List[Dict]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content", "")
+        if isinstance(content, list):
+            parts.extend(block.get("text", "") for block in content)
+        else:
+            parts.append(content)
+    return "".join(parts)
+
+# ---------------------------------------------------------------------------
+# Serper and Exa
+# ---------------------------------------------------------------------------
+
+class FakeSerperConnection:
+    """Stand-in for ``http.client.HTTPSConnection`` to google.serper.dev"""
+
+    profile = FaultProfile()
+
+    def __init__(self, host: str, *args, **kwargs):
+        self.host = host
+        self._body = None
+
+    def request(self, method: str, path: str, body: str = None, headers: Dict = None):
+        self._body = json.loads(body or "{}")
+
+    def getresponse(self):
+        query = self._body.get("q", "")
+        self.profile.wait("serper")
+        slug = _slug(query)
+        data = {
+            "organic": [{
+                "title": f"How to choose {query}: guide {i}",
+                "link": f"https://example.com/{slug}/guide-{i}",
+                "snippet": paragraph(text_seed(query) + i, 20)
+            } for i in range(8)],
+            "peopleAlsoAsk": [{
+                "question": f"What is the best {query} {i}?",
+                "title": f"Answer {i}",
+                "link": f"https://answers.example.com/{slug}/{i}",
+                "snippet": paragraph(text_seed(query) + 100 + i, 15)
+            } for i in range(3)]
+        }
+        return SimpleNamespace(read=lambda: json.dumps(data).encode("utf-8"), status=200)
+
+    def close(self):
+        pass
+
+class FakeExa:
+    """Stand-in for ``exa_py.Exa``"""
+
+    profile = FaultProfile()
+
+    def __init__(self, api_key: str = None):
+        pass
+
+    def get_contents(self, urls: List[str], text: bool = True):
+        self.profile.wait("exa")
+        results = [SimpleNamespace(
+            url=url,
+            title=f"Article at {url.rsplit('/', 1)[-1]}",
+            text="\n\n".join(paragraph(text_seed(url) + i, 120) for i in range(12)),
+            publishedDate="2024-01-01",
+            author="Fake Author"
+        ) for url in urls]
+        return SimpleNamespace(results=results)
+
+# ---------------------------------------------------------------------------
+# LLM providers
+# ---------------------------------------------------------------------------
+
+class _FakeAnthropicStream:
+    def __init__(self, text: str, usage, profile: FaultProfile):
+        self._text = text
+        self._usage = usage
+        self._profile = profile
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self) -> Iterator[str]:
+        chunks = list(_chunks(self._text))
+        for chunk in chunks:
+            _sleep(self._profile.latency / max(len(chunks), 1))
+            yield chunk
+
+    def get_final_message(self):
+        return SimpleNamespace(usage=self._usage, content=[SimpleNamespace(text=self._text)])
+
+    @property
+    def current_message_snapshot(self):
+        """Message as of message_start: input counts known, output not yet"""
+        usage = SimpleNamespace(**{**vars(self._usage), "output_tokens": 1})
+        return SimpleNamespace(usage=usage)
+
+class FakeAnthropicClient:
+    """Stand-in for ``anthropic.Anthropic`` and ``AsyncAnthropic`` message calls"""
+
+    profile = FaultProfile(latency=0.5, tokens_per_second=2000)
+
+    def __init__(self, is_async: bool = False):
+        self.messages = SimpleNamespace(
+            create=self._acreate if is_async else self._create,
+            stream=self._stream
+        )
+
+    @staticmethod
+    def _message(kwargs: Dict):
+        prompt = _prompt_from_messages(kwargs["messages"])
+        text = fake_response(prompt)
+        usage = SimpleNamespace(
+            input_tokens=_token_count(prompt),
+            output_tokens=_token_count(text),
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=0
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+    def _create(self, **kwargs):
+        message = self._message(kwargs)
+        self.profile.wait("anthropic", message.usage.output_tokens)
+        return message
+
+    async def _acreate(self, **kwargs):
+        message = self._message(kwargs)
+        await self.profile.await_("anthropic", message.usage.output_tokens)
+        return message
+
+    def _stream(self, **kwargs):
+        message = self._message(kwargs)
+        self.profile.wait("anthropic")
+        return _FakeAnthropicStream(message.content[0].text, message.usage, self.profile)
+
+class _FakeGroqStream:
+    def __init__(self, text: str, usage):
+        self._chunks = list(_chunks(text))
+        self._usage = usage
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))], x_groq=None)
+        yield SimpleNamespace(choices=[], x_groq=SimpleNamespace(usage=self._usage))
+
+    def close(self):
+        pass
+
+class FakeGroqClient:
+    """Stand-in for ``groq.Groq`` and ``AsyncGroq`` chat completions"""
+
+    profile = FaultProfile(latency=0.2, tokens_per_second=5000)
+
+    def __init__(self, is_async: bool = False):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(
+            create=self._acreate if is_async else self._create
+        ))
+
+    @staticmethod
+    def _completion(kwargs: Dict):
+        prompt = _prompt_from_messages(kwargs["messages"])
+        text = fake_response(prompt)
+        usage = SimpleNamespace(
+            prompt_tokens=_token_count(prompt),
+            completion_tokens=_token_count(text),
+            prompt_tokens_details=None
+        )
+        return text, usage
+
+    def _create(self, stream: bool = False, **kwargs):
+        text, usage = self._completion(kwargs)
+        self.profile.wait("groq", usage.completion_tokens)
+        if stream:
+            return _FakeGroqStream(text, usage)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+            usage=usage
+        )
+
+    async def _acreate(self, **kwargs):
+        text, usage = self._completion(kwargs)
+        await self.profile.await_("groq", usage.completion_tokens)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+            usage=usage
+        )
+
+class _FakeLocalResponse:
+    def __init__(self, data: Dict, status_code: int = 200, events: Optional[List[str]] = None):
+        self._data = data
+        self.status_code = status_code
+        self._events = events or []
+
+    def raise_for_status(self):
+        pass
+
+    def json(self) -> Dict:
+        return self._data
+
+    def iter_lines(self, decode_unicode: bool = True) -> Iterator[str]:
+        yield from self._events
+
+    def close(self):
+        pass
+
+def _local_completion(payload: Dict) -> Dict:
+    prompt = _prompt_from_messages(payload["messages"])
+    text = fake_response(prompt)
+    return {
+        "choices": [{"message": {"content": text}}],
+        "usage": {"prompt_tokens": _token_count(prompt), "completion_tokens": _token_count(text)}
+    }
+
+class FakeLocalSession:
+    """Stand-in for the ``requests.Session`` LocalLLM posts to"""
+
+    profile = FaultProfile(latency=1.0, tokens_per_second=400)
+
+    def get(self, url: str, timeout=None):
+        return _FakeLocalResponse({"data": []})
+
+    def post(self, url: str, json: Dict = None, timeout=None, stream: bool = False):
+        data = _local_completion(json)
+        self.profile.wait("local", data["usage"]["completion_tokens"])
+        if not stream:
+            return _FakeLocalResponse(data)
+
+        text = data["choices"][0]["message"]["content"]
+        events = [
+            "data: " + _json_dumps({"choices": [{"delta": {"content": chunk}}]})
+            for chunk in _chunks(text)
+        ]
+        events.append("data: " + _json_dumps({"choices": [], "usage": data["usage"]}))
+        events.append("data: [DONE]")
+        return _FakeLocalResponse(data, events=events)
+
+class FakeLocalAsyncClient:
+    """Stand-in for the ``httpx.AsyncClient`` LocalLLM uses for async calls"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def post(self, url: str, json: Dict = None):
+        data = _local_completion(json)
+        await FakeLocalSession.profile.await_("local", data["usage"]["completion_tokens"])
+        return _FakeLocalResponse(data)
+
+# ---------------------------------------------------------------------------
+# Shopify
+# ---------------------------------------------------------------------------
+
+class FakeShopify:
+    """Stand-in for the Shopify Admin GraphQL endpoint"""
+
+    profile = FaultProfile(latency=0.3)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.articles = 0
+
+    def post(self, url: str, json: Dict = None, headers: Dict = None, **kwargs):
+        self.profile.wait("shopify")
+        query = (json or {}).get("query", "")
+        if "GetBlogs" in query:
+            data = {"data": {"blogs": {"edges": [{"node": {"id": "gid://shopify/Blog/1", "title": "Helpful Blogs"}}]}}}
+        elif "articleCreate" in query:
+            with self._lock:
+                self.articles += 1
+                article_id = self.articles
+            title = re.search(r'title: "((?:[^"\\]|\\.)*)"', query)
+            data = {"data": {"articleCreate": {
+                "article": {
+                    "id": f"gid://shopify/Article/{article_id}",
+                    "title": title.group(1) if title else "",
+                    "handle": f"article-{article_id}"
+                },
+                "userErrors": []
+            }}}
+        else:
+            data = {"data": {}}
+        return _FakeLocalResponse(data)
+
+# ---------------------------------------------------------------------------
+# Installation
+# ---------------------------------------------------------------------------
+
+def configure(profiles: Dict[str, FaultProfile]):
+    """Set the fault profile of each fake service by name"""
+    targets = {
+        "serper": FakeSerperConnection,
+        "exa": FakeExa,
+        "anthropic": FakeAnthropicClient,
+        "groq": FakeGroqClient,
+        "local": FakeLocalSession,
+        "shopify": FakeShopify,
+    }
+    for name, profile in profiles.items():
+        targets[name].profile = profile
+
+def service_stats() -> Dict[str, Dict]:
+    """Calls and injected failures per fake service"""
+    return {
+        "serper": FakeSerperConnection.profile.stats(),
+        "exa": FakeExa.profile.stats(),
+        "anthropic": FakeAnthropicClient.profile.stats(),
+        "groq": FakeGroqClient.profile.stats(),
+        "local": FakeLocalSession.profile.stats(),
+        "shopify": FakeShopify.profile.stats(),
+    }
+
+@contextmanager
+def install_fakes(skip_pacing: bool = False, rate_scale: float = 1.0) -> Iterator[FakeShopify]:
+    """Patch every external client the pipeline uses with its fake
+
+    Provider request-rate limits are multiplied by ``1 / rate_scale`` so they
+    shrink along with the fake latencies; a scale of 0 disables them.
+    """
+    from seoranker.config.settings import LLM_RATE_LIMITS
+    from seoranker.llm.anthropic_llm import AnthropicLLM
+    from seoranker.llm.groq_llm import GroqLLM
+    from seoranker.llm.local_llm import LocalLLM
+
+    shopify = FakeShopify()
+    sync_anthropic, async_anthropic = FakeAnthropicClient(), FakeAnthropicClient(is_async=True)
+    sync_groq, async_groq = FakeGroqClient(), FakeGroqClient(is_async=True)
+    local_session = FakeLocalSession()
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("http.client.HTTPSConnection", FakeSerperConnection))
+        stack.enter_context(mock.patch("seoranker.tools.exa_search.Exa", FakeExa))
+        stack.enter_context(mock.patch.object(AnthropicLLM, "client", property(lambda self: sync_anthropic)))
+        stack.enter_context(mock.patch.object(AnthropicLLM, "async_client", property(lambda self: async_anthropic)))
+        stack.enter_context(mock.patch.object(GroqLLM, "client", property(lambda self: sync_groq)))
+        stack.enter_context(mock.patch.object(GroqLLM, "async_client", property(lambda self: async_groq)))
+        stack.enter_context(mock.patch.object(LocalLLM, "session", property(lambda self: local_session)))
+        stack.enter_context(mock.patch("httpx.AsyncClient", FakeLocalAsyncClient))
+        stack.enter_context(mock.patch("seoranker.shopify.requests.post", shopify.post))
+        stack.enter_context(mock.patch.dict(LLM_RATE_LIMITS, {
+            provider: per_minute / rate_scale if rate_scale else 0
+            for provider, per_minute in LLM_RATE_LIMITS.items()
+        }))
+        if skip_pacing:
+            # The pipeline's fixed pauses between API calls
+            stack.enter_context(mock.patch("seoranker.tools.exa_search.time.sleep", lambda seconds: None))
+        yield shopify
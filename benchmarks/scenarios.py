@@ -0,0 +1,226 @@
+import asyncio
+import csv
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from benchmarks.fakes import FakeAnthropicClient, FaultProfile, fake_blog_response, paragraph, text_seed
+
+def percentiles(latencies: List[float]) -> Dict:
+    """p50/p95/p99/max/mean of latencies in milliseconds"""
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def rank(pct: float) -> float:
+        return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+    return {
+        "p50": round(rank(50), 2),
+        "p95": round(rank(95), 2),
+        "p99": round(rank(99), 2),
+        "max": round(ordered[-1], 2),
+        "mean": round(sum(ordered) / len(ordered), 2)
+    }
+
+def _result(name: str, items: int, latencies: List[float], succeeded: int, wall: float, **extra) -> Dict:
+    return {
+        "scenario": name,
+        "items": items,
+        "succeeded": succeeded,
+        "failed": items - succeeded,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(items / wall, 3) if wall else 0.0,
+        "latency_ms": percentiles(latencies),
+        **extra
+    }
+
+def _timed(func: Callable, latencies: List[float]) -> Callable:
+    """Wrap a call so each invocation's latency is recorded"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - start) * 1000)
+    return wrapper
+
+def keywords_for(count: int) -> List[str]:
+    bases = ["robusta coffee", "cold brew", "espresso roast", "arabica beans", "french press", "pour over"]
+    return [f"{bases[i % len(bases)]} {i}" for i in range(count)]
+
+def write_model_config(blog_provider: str, social_provider: str):
+    """Write config/models.json for the providers under test"""
+    models = {"anthropic": "claude-3-sonnet-20240229", "groq": "mixtral-8x7b-32768", "local": "llama-3.2-3b-instruct"}
+    config = {
+        "blog": {"provider": blog_provider, "model": models[blog_provider], "fallback": [
+            {"provider": p, "model": models[p]} for p in ("groq", "local") if p != blog_provider
+        ]},
+        "social": {"provider": social_provider, "model": models[social_provider], "fallback": {
+            "provider": "local", "model": models["local"]
+        }}
+    }
+    Path("config").mkdir(exist_ok=True)
+    with open("config/models.json", 'w') as f:
+        json.dump(config, f, indent=2)
+
+def seed_knowledge_base(keywords: List[str], sources_per_keyword: int = 3):
+    """Write content, suggestions and product databases for keywords"""
+    kb = Path("knowledge_base")
+    kb.mkdir(exist_ok=True)
+    from seoranker.tools.outline import OUTLINE_FIELDS, outline_row
+
+    with open(kb / "content_database.csv", 'w', newline='', encoding='utf-8') as f, \
+            open(kb / "source_outlines.csv", 'w', newline='', encoding='utf-8') as outlines:
+        writer = csv.writer(f)
+        writer.writerow(["keyword", "url", "title", "content"])
+        outline_writer = csv.DictWriter(outlines, fieldnames=OUTLINE_FIELDS)
+        outline_writer.writeheader()
+        for keyword in keywords:
+            for i in range(sources_per_keyword):
+                text = "\n\n".join(
+                    f"Section {j} of {keyword}\n{paragraph(text_seed(f'{keyword}-{i}-{j}'), 120)}" for j in range(12)
+                )
+                writer.writerow([keyword, f"https://example.com/{i}", f"{keyword} guide {i}", text])
+                outline_writer.writerow(outline_row(keyword, f"https://example.com/{i}", text))
+    with open(kb / "suggestions_database.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["source_keyword", "question", "title", "url"])
+        for keyword in keywords:
+            for i in range(3):
+                writer.writerow([keyword, f"What is {keyword} {i}?", f"Answer {i}", f"https://answers.example.com/{i}"])
+    with open(kb / "products.json", 'w', encoding='utf-8') as f:
+        json.dump({"products": [
+            {"name": f"Bestia Brisk Blend {i}", "description": paragraph(i, 30)} for i in range(20)
+        ]}, f)
+
+def seed_output(keywords: List[str]):
+    """Write generated-blog HTML files for keywords"""
+    output = Path("output")
+    output.mkdir(exist_ok=True)
+    for keyword in keywords:
+        response = fake_blog_response(f"Primary keyword: {keyword}")
+        body = response.split("<content>")[1].split("</content>")[0]
+        safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword.lower())
+        with open(output / f"{safe_keyword}.html", 'w', encoding='utf-8') as f:
+            f.write(
+                f'<!DOCTYPE html><html><head><meta name="description" content="About {keyword}">'
+                f'<title>Guide to {keyword}</title></head><body>{body}</body></html>'
+            )
+
+def kb_build(count: int, **options) -> Dict:
+    """Gather Serper results and Exa pages for new keywords"""
+    from seoranker.tools.exa_search import ExaSearchTool
+
+    keywords = keywords_for(count)
+    tool = ExaSearchTool()
+    latencies = []
+    succeeded = 0
+
+    start = time.perf_counter()
+    for keyword in keywords:
+        started = time.perf_counter()
+        results = tool.gather_content_insights(keyword)
+        latencies.append((time.perf_counter() - started) * 1000)
+        succeeded += bool(results)
+    wall = time.perf_counter() - start
+
+    return _result("kb_build", len(keywords), latencies, succeeded, wall)
+
+def batch_generation(count: int, blog_provider: str = "anthropic", social_provider: str = "groq", **options) -> Dict:
+    """Generate blogs and social posts for pending keywords as generate_content_batch does"""
+    keywords = keywords_for(count)
+    write_model_config(blog_provider, social_provider)
+    seed_knowledge_base(keywords)
+
+    from seoranker.content.blog_generator import BlogGenerator
+    from seoranker.main import _agenerate_batch
+
+    blog_generator = BlogGenerator()
+    latencies = []
+    agenerate_blog = blog_generator.agenerate_blog
+
+    async def timed(keyword: str) -> Dict:
+        started = time.perf_counter()
+        try:
+            return await agenerate_blog(keyword)
+        finally:
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    blog_generator.agenerate_blog = timed
+
+    start = time.perf_counter()
+    results = asyncio.run(_agenerate_batch(blog_generator, keywords))
+    wall = time.perf_counter() - start
+
+    succeeded = sum(1 for r in results if r.get("status") == "success")
+    return _result("batch_generation", len(keywords), latencies, succeeded, wall,
+                   blog_provider=blog_provider, social_provider=social_provider)
+
+def blog_fallback(count: int, social_provider: str = "groq", **options) -> Dict:
+    """Generate blogs with the primary provider down, so every blog comes from the fallback chain"""
+    # run_scenario configures fresh profiles before the next scenario
+    FakeAnthropicClient.profile = FaultProfile(latency=FakeAnthropicClient.profile.latency, failure_rate=1.0)
+    result = batch_generation(count, blog_provider="anthropic", social_provider=social_provider)
+    result["scenario"] = "blog_fallback"
+    return result
+
+def archive_update(count: int, **options) -> Dict:
+    """Rebuild the blog archive from generated HTML files"""
+    from seoranker.utils.archive_manager import ArchiveManager
+
+    keywords = keywords_for(count)
+    seed_output(keywords)
+    Path("knowledge_base").mkdir(exist_ok=True)
+
+    manager = ArchiveManager()
+    latencies = []
+    manager.extract_metadata_from_html = _timed(manager.extract_metadata_from_html, latencies)
+
+    start = time.perf_counter()
+    summary = manager.update_archive() or {}
+    wall = time.perf_counter() - start
+
+    return _result("archive_update", len(keywords), latencies, summary.get("new", 0), wall)
+
+def publish(count: int, **options) -> Dict:
+    """Publish draft archive entries to Shopify"""
+    from seoranker.utils.archive_manager import ArchiveManager
+
+    keywords = keywords_for(count)
+    seed_output(keywords)
+    Path("knowledge_base").mkdir(exist_ok=True)
+    ArchiveManager().update_archive()
+
+    os.environ.setdefault("SHOPIFY_STORE", "benchmark.myshopify.com")
+    os.environ.setdefault("SHOPIFY_ACCESS_TOKEN", "benchmark")
+    from seoranker.shopify import ShopifyPublisher
+
+    publisher = ShopifyPublisher()
+    latencies = []
+    published = []
+    create_article = _timed(publisher.create_article, latencies)
+
+    def record(entry: Dict):
+        article = create_article(entry)
+        if article:
+            published.append(article)
+        return article
+
+    publisher.create_article = record
+
+    start = time.perf_counter()
+    publisher.publish_draft_articles()
+    wall = time.perf_counter() - start
+
+    return _result("publish", len(keywords), latencies, len(published), wall)
+
+SCENARIOS = {
+    "kb_build": kb_build,
+    "batch_generation": batch_generation,
+    "blog_fallback": blog_fallback,
+    "archive_update": archive_update,
+    "publish": publish,
+}
@@ -5,10 +5,20 @@ from seoranker.utils.logger import setup_logger
 from seoranker.agents.research_agent import ContentResearchAgent
 from seoranker.utils.content_handler import ContentHandler
 from seoranker.config.brand_config import BrandConfig
-from typing import Optional
+from seoranker.config.settings import ARTICLE_CONCURRENCY
+from collections import Counter
+from typing import Dict, Optional
 
 logger = setup_logger(__name__)
 
+VARIATION_PROMPTS = [
+    "Focus on beginner's guide and fundamentals",
+    "Emphasize advanced techniques and expert tips",
+    "Concentrate on latest trends and innovations",
+    "Highlight practical applications and real-world examples",
+    "Deep dive into specific aspects and detailed analysis"
+]
+
 def load_brand_config(config_path: str = "config/brand.json") -> Optional[BrandConfig]:
     """Load brand configuration from JSON file"""
     try:
@@ -20,6 +30,24 @@ def load_brand_config(config_path: str = "config/brand.json") -> Optional[BrandC
         logger.warning(f"Could not load brand config: {e}")
     return None
 
+def print_result(record: Dict, completed: int, total: int):
+    """Print one finished article as a single block so concurrent output doesn't interleave"""
+    header = f"\n--- Article {completed}/{total}: {record['keyword']} (Variation {record['variation']}) ---"
+    if "error" in record:
+        print(f"{header}\n✗ {record['error']}")
+        return
+    
+    lines = [
+        header,
+        "=== Content Generated Successfully ===",
+        f"Title: {record['title']}",
+        f"Focus: {record['focus']}",
+        f"Sources Used: {record['sources_used']}",
+        "Files Generated:"
+    ]
+    lines.extend(f"- {content_type.title()}: {file_path}" for content_type, file_path in record["files"].items())
+    print("\n".join(lines))
+
 async def main():
     # Get number of keywords with validation
     while True:
@@ -64,87 +92,85 @@ async def main():
     agent = ContentResearchAgent(brand_config=brand_config)
     content_handler = ContentHandler()
     
+    # Get number of articles generated at once
+    concurrency = input(f"How many articles at once? (default {ARTICLE_CONCURRENCY}) ").strip()
+    try:
+        concurrency = max(1, int(concurrency)) if concurrency else ARTICLE_CONCURRENCY
+    except ValueError:
+        print(f"Invalid number, using {ARTICLE_CONCURRENCY}")
+        concurrency = ARTICLE_CONCURRENCY
+    
     # Track success and failures
     results = {
         "successful": [],
         "failed": []
     }
     
-    # Generate content for each keyword and variation
     total_articles = num_keywords * variations_per_keyword
-    current_article = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    remaining = Counter(keyword for keyword in keywords for _ in range(variations_per_keyword))
+    completed = 0
     
-    for keyword in keywords:
-        print(f"\n=== Generating Articles for Topic: {keyword} ===")
+    async def generate_variation(index: int, keyword: str, variation: int) -> Dict:
+        """Generate and save one variation, returning its success or failure record"""
+        nonlocal completed
+        record = {"keyword": keyword, "variation": variation + 1}
         
-        for variation in range(variations_per_keyword):
-            current_article += 1
+        async with semaphore:
+            # Research the next topic while this one's variations are written
+            if index + 1 < len(keywords):
+                agent.prefetch(keywords[index + 1])
+            
+            # Add variation context to make each version unique
+            variation_context = VARIATION_PROMPTS[variation % len(VARIATION_PROMPTS)]
             try:
-                print(f"\n--- Generating Variation {variation + 1}/{variations_per_keyword} ---")
-                print(f"Progress: Article {current_article}/{total_articles}")
-                
-                # Add variation context to make each version unique
-                variation_prompts = [
-                    "Focus on beginner's guide and fundamentals",
-                    "Emphasize advanced techniques and expert tips",
-                    "Concentrate on latest trends and innovations",
-                    "Highlight practical applications and real-world examples",
-                    "Deep dive into specific aspects and detailed analysis"
-                ]
-                
-                variation_context = variation_prompts[variation % len(variation_prompts)]
-                
-                # Execute content generation with variation
                 result = await agent.execute(keyword, variation_context)
                 
                 if "error" in result:
-                    print(f"Error generating content: {result['error']}")
-                    results["failed"].append({
-                        "keyword": keyword,
-                        "variation": variation + 1,
-                        "error": result["error"]
-                    })
-                    continue
-                
-                # Save generated content with variation number
-                save_result = content_handler.save_content(
-                    keyword=f"{keyword}_v{variation + 1}",
-                    content=result
-                )
-                
-                if "error" in save_result:
-                    print(f"Error saving content: {save_result['error']}")
-                    results["failed"].append({
-                        "keyword": keyword,
-                        "variation": variation + 1,
-                        "error": save_result["error"]
-                    })
-                    continue
-                
-                # Display results
-                print("\n=== Content Generated Successfully ===")
-                print(f"Title: {save_result['title']}")
-                print(f"Keyword: {keyword} (Variation {variation + 1})")
-                print(f"Focus: {variation_context}")
-                print(f"Sources Used: {result['sources_used']}")
-                print("\nFiles Generated:")
-                for content_type, file_path in save_result['files'].items():
-                    print(f"- {content_type.title()}: {file_path}")
-                
-                results["successful"].append({
-                    "keyword": keyword,
-                    "variation": variation + 1,
-                    "title": save_result["title"],
-                    "directory": save_result["content_dir"]
-                })
-                
+                    record["error"] = f"Error generating content: {result['error']}"
+                else:
+                    # Save generated content with variation number
+                    save_result = await asyncio.to_thread(
+                        content_handler.save_content,
+                        keyword=f"{keyword}_v{variation + 1}",
+                        content=result
+                    )
+                    if "error" in save_result:
+                        record["error"] = f"Error saving content: {save_result['error']}"
+                    else:
+                        record.update({
+                            "title": save_result["title"],
+                            "directory": save_result["content_dir"],
+                            "focus": variation_context,
+                            "sources_used": result["sources_used"],
+                            "files": save_result["files"]
+                        })
+                        
             except Exception as e:
                 logger.error(f"Unexpected error processing {keyword} variation {variation + 1}: {str(e)}")
-                results["failed"].append({
-                    "keyword": keyword,
-                    "variation": variation + 1,
-                    "error": str(e)
-                })
+                record["error"] = str(e)
+        
+        remaining[keyword] -= 1
+        if not remaining[keyword]:
+            agent.release_research(keyword)
+        
+        completed += 1
+        print_result(record, completed, total_articles)
+        return record
+    
+    print(f"\nGenerating {total_articles} articles, {concurrency} at a time...")
+    agent.prefetch(keywords[0])
+    records = await asyncio.gather(*(
+        generate_variation(index, keyword, variation)
+        for index, keyword in enumerate(keywords)
+        for variation in range(variations_per_keyword)
+    ))
+    
+    for record in records:
+        if "error" in record:
+            results["failed"].append(record)
+        else:
+            results["successful"].append(record)
     
     # Show final summary
     print("\n=== Generation Summary ===")
@@ -0,0 +1,79 @@
+import argparse
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Imports run by each run.sh menu action
+ACTIONS = {
+    "generate": "from seoranker.main import generate_content",
+    "generate_batch": "from seoranker.main import generate_content_batch",
+    "update_archive": "from seoranker.main import update_archive",
+    "publish": "from seoranker.main import publish_to_shopify",
+    "add_keywords": "from seoranker.main import add_new_keywords",
+}
+
+IMPORT_TIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\| (.+)$')
+
+def measure(statement: str) -> Tuple[float, List[Tuple[int, int, str]], str]:
+    """Run a statement with -X importtime and return wall ms, import rows and errors"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    rows = []
+    errors = []
+    for line in proc.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            rows.append((int(match.group(1)), int(match.group(2)), match.group(3).rstrip()))
+        elif line.strip() and not line.startswith("import time:"):
+            errors.append(line)
+
+    return wall_ms, rows, "\n".join(errors) if proc.returncode else ""
+
+def report(name: str, wall_ms: float, rows: List[Tuple[int, int, str]], top: int) -> Dict:
+    """Print total import time and the slowest imports for one action"""
+    # Top-level packages have no leading indentation in the package column
+    total_us = sum(cumulative for _, cumulative, package in rows if not package.startswith(" "))
+    print(f"\n=== {name} ===")
+    print(f"Process wall time: {wall_ms:.0f} ms")
+    print(f"Total import time: {total_us / 1000:.0f} ms")
+
+    print(f"Slowest {top} imports (cumulative):")
+    for self_us, cumulative, package in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {package.strip()}")
+
+    return {"wall_ms": wall_ms, "import_ms": total_us / 1000}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure startup import time of run.sh actions")
+    parser.add_argument("--action", choices=sorted(ACTIONS), action="append",
+                        help="Action to measure (default: all)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--target-ms", type=float, default=None,
+                        help="Fail if any action's wall time exceeds this many ms")
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.action or list(ACTIONS):
+        wall_ms, rows, error = measure(ACTIONS[name])
+        if error:
+            print(f"\n=== {name} ===\nImport failed:\n{error}")
+            failed = True
+            continue
+
+        result = report(name, wall_ms, rows, args.top)
+        if args.target_ms is not None and result["wall_ms"] > args.target_ms:
+            print(f"Over target: {result['wall_ms']:.0f} ms > {args.target_ms:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
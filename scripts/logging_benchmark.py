@@ -0,0 +1,115 @@
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from seoranker.utils.logger import setup_logger, LogPayload
+
+# Modules that log during one blog generation
+MODULES = [
+    "seoranker.main",
+    "seoranker.content.blog_generator",
+    "seoranker.content.social_generator",
+    "seoranker.content.content_archive",
+    "seoranker.content.prompt_budget",
+    "seoranker.llm.anthropic_llm",
+    "seoranker.llm.groq_llm",
+    "seoranker.tools.exa_search",
+]
+
+def sample_payloads() -> dict:
+    """Build payloads the size of a typical generation"""
+    organic = [{
+        "title": f"Result {i} about trail running shoes",
+        "link": f"https://example.com/article-{i}",
+        "snippet": "Lightweight cushioning and grip for technical terrain. " * 4
+    } for i in range(10)]
+    questions = [{"question": f"Question {i}?", "snippet": "Answer text. " * 10} for i in range(8)]
+    return {
+        "serp": {"organic": organic, "peopleAlsoAsk": questions},
+        "prompt": "Source passage about running shoes and training. " * 1000,
+        "response": "<p>Generated blog paragraph about running shoes.</p>\n" * 400,
+    }
+
+def legacy_loggers(log_path: Path) -> list:
+    """Reproduce the old setup: one console and one FileHandler per module logger"""
+    loggers = []
+    for name in MODULES:
+        logger = logging.getLogger(f"legacy.{name}")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        console_handler = logging.StreamHandler(open(log_path.with_suffix(".console"), "a"))
+        console_handler.setLevel(logging.INFO)
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        loggers.append(logger)
+    return loggers
+
+def run_legacy(loggers: list, payloads: dict):
+    """One generation's worth of eager, f-string formatted logging"""
+    main, blog, social, archive, budget, claude, groq, search = loggers
+    search.debug(f"Searching for keyword: trail running shoes")
+    search.debug(json.dumps(payloads["serp"], indent=2))
+    for i in range(40):
+        blog.debug(f"- Source {i}: {payloads['serp']['organic'][i % 10]['title']}")
+    blog.debug(f"{payloads['prompt']}")
+    claude.debug(f"\n=== Claude Prompt ===\nLength: {len(payloads['prompt'])}\n{payloads['prompt'][:500]}")
+    groq.debug(f"\n=== Groq Prompt ===\nLength: {len(payloads['prompt'])}\nPrompt:\n{payloads['prompt']}")
+    blog.debug(payloads["response"])
+    budget.debug(f"Prompt tokens for 'trail running shoes': sources=6000, questions=800")
+    social.debug(f"- Blog title: Trail Running Shoes")
+    archive.debug(f"Added archive entry for trail running shoes")
+    main.debug(f"✓ Generated blog: trail running shoes")
+
+def run_queued(loggers: list, payloads: dict):
+    """The same log calls through the shared queue with lazy payloads"""
+    main, blog, social, archive, budget, claude, groq, search = loggers
+    search.debug("Searching for keyword: %s", "trail running shoes")
+    search.debug("\nParsed Response:\n%s", LogPayload(payloads["serp"]))
+    for i in range(40):
+        blog.debug("- Source %d: %s", i, payloads['serp']['organic'][i % 10]['title'])
+    blog.debug("\nFull Prompt:\n%s", LogPayload(payloads["prompt"]))
+    claude.debug("\n=== Claude Prompt ===\nLength: %d\n%s", len(payloads["prompt"]), payloads["prompt"][:500])
+    groq.debug("\n=== Groq Prompt ===\nLength: %d\nPrompt:\n%s", len(payloads["prompt"]), LogPayload(payloads["prompt"]))
+    blog.debug("%s", LogPayload(payloads["response"]))
+    budget.debug("Prompt tokens for '%s': sources=6000, questions=800", "trail running shoes")
+    social.debug("- Blog title: %s", "Trail Running Shoes")
+    archive.debug("Added archive entry for %s", "trail running shoes")
+    main.debug("✓ Generated blog: %s", "trail running shoes")
+
+def measure(run, loggers: list, payloads: dict, iterations: int) -> float:
+    """Mean caller-thread milliseconds per generation"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run(loggers, payloads)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure logging overhead per blog generation")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = sample_payloads()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = legacy_loggers(Path(tmp) / "legacy.log")
+        legacy_ms = measure(run_legacy, legacy, payloads, args.iterations)
+        for logger in legacy:
+            for handler in logger.handlers:
+                handler.close()
+
+    queued = [setup_logger(f"benchmark.{name}") for name in MODULES]
+    queued_ms = measure(run_queued, queued, payloads, args.iterations)
+
+    print(f"Logging overhead per generation ({args.iterations} runs)")
+    print(f"  legacy (per-module FileHandler, eager): {legacy_ms:.3f} ms")
+    print(f"  queued (shared listener, lazy payloads): {queued_ms:.3f} ms")
+    if queued_ms:
+        print(f"  speedup: {legacy_ms / queued_ms:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,14 @@ from seoranker.agents.base_agent import BaseAgent
 from seoranker.tools.exa_search import ExaSearchTool
 from seoranker.utils.logger import setup_logger
 from datetime import datetime
-import re
 from seoranker.config.brand_config import BrandConfig
+from seoranker.config.model_config import ModelProvider
+from seoranker.config.settings import STREAM_GENERATION, RESEARCH_SOURCE_TOKEN_BUDGET
+from seoranker.content.prompt_budget import PromptBudgeter
+from seoranker.llm.anthropic_llm import AnthropicLLM
+from seoranker.tools.summarizer import summarize
+from seoranker.agents.section_parser import SectionParser
+from seoranker.llm.concurrency import provider_slot
 import asyncio
 
 logger = setup_logger(__name__)
@@ -54,10 +60,13 @@ Please generate both the SEO blog post and social media versions, maintaining co
 class ContentResearchAgent(BaseAgent):
     """Agent for researching and generating content"""
     
-    def __init__(self, brand_config: Optional[BrandConfig] = None):
+    def __init__(self, brand_config: Optional[BrandConfig] = None, stream: bool = STREAM_GENERATION):
         super().__init__()
+        self.stream = stream
         self.search_tool = ExaSearchTool()
         self.brand_config = brand_config
+        # Research tasks per normalized keyword, shared by every variation
+        self._research: Dict[str, asyncio.Task] = {}
         self.prompt = PromptTemplate(
             input_variables=["keyword", "articles", "brand_context"],
             template=CONTENT_TEMPLATE
@@ -70,51 +79,9 @@ class ContentResearchAgent(BaseAgent):
             if hasattr(content, 'content'):
                 content = content.content
             
-            sections = content.split("\n\n")
-            parsed = {
-                "blog_post": "",
-                "linkedin_post": "",
-                "twitter_thread": "",
-                "hashtags": ""
-            }
-            
-            current_section = None
-            blog_started = False
-            
-            for section in sections:
-                section = section.strip()
-                if not section:
-                    continue
-                    
-                # Check for section markers
-                if "SEO Blog Post:" in section or "Title:" in section:
-                    current_section = "blog_post"
-                    blog_started = True
-                    parsed[current_section] = section + "\n\n"  # Include the title line
-                    continue
-                elif "LinkedIn Post" in section:
-                    current_section = "linkedin_post"
-                    continue
-                elif "Twitter Thread" in section:
-                    current_section = "twitter_thread"
-                    continue
-                elif "Key Hashtags:" in section:
-                    current_section = "hashtags"
-                    continue
-                
-                # Add content to current section if we have one
-                if current_section:
-                    parsed[current_section] += section + "\n\n"
-            
-            # Clean up any empty sections
-            parsed = {k: v.strip() for k, v in parsed.items()}
-            
-            # Ensure blog post starts with a title
-            if parsed["blog_post"] and not any(marker in parsed["blog_post"].split('\n')[0] 
-                                             for marker in ["SEO Blog Post:", "Title:", "# "]):
-                parsed["blog_post"] = f"# {parsed['blog_post']}"
-            
-            return parsed
+            parser = SectionParser()
+            parser.feed(content)
+            return parser.close()
             
         except Exception as e:
             logger.error(f"Error parsing content: {str(e)}")
@@ -125,6 +92,24 @@ class ContentResearchAgent(BaseAgent):
                 "hashtags": ""
             }
     
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        """Text of a streamed message chunk (plain string or content blocks)"""
+        content = getattr(chunk, "content", chunk)
+        if isinstance(content, str):
+            return content
+        return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+    
+    async def _generate_sections(self, prompt: str) -> Dict[str, str]:
+        """Run the LLM and split its output into sections, parsing as it streams"""
+        if not self.stream:
+            return self._parse_generated_content(await self.llm.ainvoke(prompt))
+        
+        parser = SectionParser()
+        async for chunk in self.llm.astream(prompt):
+            parser.feed(self._chunk_text(chunk))
+        return parser.close()
+    
     def _format_brand_context(self) -> str:
         """Format brand configuration into prompt context"""
         if not self.brand_config:
@@ -164,24 +149,73 @@ Brand Description: {self.brand_config.description}
 Tone of Voice: {self.brand_config.tone_of_voice}
 """
     
+    @staticmethod
+    def _research_key(keyword: str) -> str:
+        return keyword.lower().strip()
+    
+    def prefetch(self, keyword: str) -> asyncio.Task:
+        """Start researching keyword in the background unless already started"""
+        key = self._research_key(keyword)
+        task = self._research.get(key)
+        if task is None:
+            logger.info(f"Researching: {keyword}")
+            task = asyncio.ensure_future(
+                asyncio.to_thread(self.search_tool.gather_content_insights, keyword)
+            )
+            self._research[key] = task
+        return task
+    
+    async def research(self, keyword: str) -> List[Dict[str, Any]]:
+        """Get content insights for keyword, running the search only once per keyword"""
+        key = self._research_key(keyword)
+        task = self.prefetch(keyword)
+        try:
+            # Shield so one cancelled caller doesn't cancel research others share
+            return await asyncio.shield(task)
+        except Exception:
+            # Let a later call retry instead of caching the failure
+            if self._research.get(key) is task:
+                del self._research[key]
+            raise
+    
+    def release_research(self, keyword: str):
+        """Drop a keyword's cached research once its variations are done"""
+        self._research.pop(self._research_key(keyword), None)
+    
+    @staticmethod
+    def _count_tokens(text: str) -> int:
+        return int(len(text) / AnthropicLLM.chars_per_token) + 1 if text else 0
+    
+    def _fit_sources(self, content_pieces: List[Dict[str, Any]]) -> List[Dict]:
+        """Take as many of each source's key sentences as the source budget allows"""
+        # Pages already in the database come back without key sentences
+        sources = [{
+            "title": piece.get("title", ""),
+            "url": piece.get("metadata", {}).get("url", ""),
+            "key_sentences": (
+                piece["key_sentences"] if piece.get("key_sentences") is not None
+                else summarize(piece.get("content", ""))
+            )
+        } for piece in content_pieces]
+        budgeter = PromptBudgeter(self._count_tokens, RESEARCH_SOURCE_TOKEN_BUDGET, {})
+        return budgeter.fit_key_sentences(sources, RESEARCH_SOURCE_TOKEN_BUDGET)
+    
     async def execute(self, keyword: str, variation_context: str = "") -> Dict[str, Any]:
         """Execute content generation"""
         try:
-            # Add small delay between requests to avoid rate limits
-            await asyncio.sleep(2)
-            
-            # Gather content insights
-            content_pieces = self.search_tool.gather_content_insights(keyword)
+            # Gather content insights (shared across variations of a keyword)
+            content_pieces = await self.research(keyword)
             
             if not content_pieces:
                 return {"error": "No content insights found"}
             
-            # Format articles for content generation
+            # Format articles for content generation from their top-ranked sentences
+            excerpts = self._fit_sources(content_pieces)
             articles_text = "\n\n".join([
                 f"Content {i+1} ({piece['type']}):\n"
                 f"Title: {piece['title']}\n"
-                f"Content: {piece['content'][:500]}..."
-                for i, piece in enumerate(content_pieces)
+                f"Content: {excerpt['content']}"
+                for i, (piece, excerpt) in enumerate(zip(content_pieces, excerpts))
             ])
             
             brand_context = self._format_brand_context()
@@ -191,20 +225,19 @@ Tone of Voice: {self.brand_config.tone_of_voice}
             if variation_context:
                 prompt_with_variation += f"\nVariation Focus: {variation_context}"
             
-            # Generate article using LLM with variation context
-            generated_content = await self.llm.ainvoke(
-                PromptTemplate(
-                    input_variables=["keyword", "articles", "brand_context"],
-                    template=prompt_with_variation
-                ).format(
-                    keyword=keyword,
-                    articles=articles_text,
-                    brand_context=brand_context
-                )
+            prompt = PromptTemplate(
+                input_variables=["keyword", "articles", "brand_context"],
+                template=prompt_with_variation
+            ).format(
+                keyword=keyword,
+                articles=articles_text,
+                brand_context=brand_context
             )
             
-            # Parse the generated content
-            parsed_content = self._parse_generated_content(generated_content)
+            # Generate article using LLM with variation context; the shared
+            # Anthropic slot applies LLM_CONCURRENCY and LLM_RATE_LIMITS
+            async with provider_slot(ModelProvider.ANTHROPIC.value):
+                parsed_content = await self._generate_sections(prompt)
             
             return {
                 "keyword": keyword,
@@ -0,0 +1,112 @@
+import re
+from typing import Dict, List, Optional
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SECTIONS = ("blog_post", "linkedin_post", "twitter_thread", "hashtags")
+
+# A section marker is only recognized on the first line of a paragraph, after
+# optional markdown decoration ("## ", "**", "2. "), so a marker phrase used
+# inside running text stays content.
+_DECORATION = r"^[ \t]*(?:#+(?!#)[ \t]*|\d+[.)][ \t]*|[-*][ \t]+|\*\*|__)*[ \t]*"
+_HEADER = re.compile(
+    _DECORATION + r"(?:(?P<blog>SEO Blog Post)|(?P<linkedin>LinkedIn Post)|"
+    r"(?P<twitter>Twitter Thread)|(?P<hashtags>Key Hashtags))\b[^:\n]*(?::(?P<rest>.*))?$",
+    re.IGNORECASE
+)
+_TITLE = re.compile(_DECORATION + r"Title:", re.IGNORECASE)
+_HEADER_SECTIONS = {
+    "blog": "blog_post",
+    "linkedin": "linkedin_post",
+    "twitter": "twitter_thread",
+    "hashtags": "hashtags"
+}
+
+class SectionParser:
+    """Single-pass parser splitting research agent output into its four sections
+
+    Text is fed in chunks as it streams in and handled a line at a time, so
+    the whole response is never rescanned. Marker lines ("LinkedIn Post",
+    "Twitter Thread", "Key Hashtags", "SEO Blog Post") switch sections and are
+    dropped, keeping any text after a colon on the same line; a "Title:" line
+    opens the blog post and is kept. Text before the first marker is ignored.
+    """
+
+    def __init__(self):
+        self._lines: Dict[str, List[str]] = {name: [] for name in SECTIONS}
+        self._section: Optional[str] = None
+        self._partial: List[str] = []  # pieces of the current, unterminated line
+        self._paragraph_start = True
+        self._blank_pending = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of text"""
+        if not chunk:
+            return
+
+        lines = chunk.split("\n")
+        self._partial.append(lines[0])
+        if len(lines) == 1:
+            return
+
+        self._line("".join(self._partial))
+        for line in lines[1:-1]:
+            self._line(line)
+        self._partial = [lines[-1]]
+
+    def _line(self, line: str) -> None:
+        if not line.strip():
+            self._paragraph_start = True
+            self._blank_pending = True
+            return
+
+        starts_paragraph = self._paragraph_start
+        self._paragraph_start = False
+
+        if starts_paragraph:
+            header = _HEADER.match(line)
+            if header:
+                name = next(group for group in _HEADER_SECTIONS if header.group(group))
+                self._switch(_HEADER_SECTIONS[name])
+                # Keep content sharing the marker's line ("Key Hashtags: #coffee")
+                line = (header.group("rest") or "").strip().strip("*_").strip()
+                if not line:
+                    return
+            if self._section != "blog_post" and _TITLE.match(line):
+                self._section = "blog_post"
+                self._blank_pending = False
+
+        if self._section is None:
+            return
+
+        lines = self._lines[self._section]
+        if self._blank_pending and lines:
+            lines.append("")
+        self._blank_pending = False
+        lines.append(line.rstrip())
+
+    def _switch(self, section: str) -> None:
+        self._section = section
+        # Separate from earlier text if the section is entered again
+        self._blank_pending = True
+        # A header's own line can be followed directly by content
+        self._paragraph_start = True
+
+    def close(self) -> Dict[str, str]:
+        """Finish parsing and return the four sections"""
+        if self._partial:
+            self._line("".join(self._partial))
+            self._partial = []
+
+        parsed = {name: "\n".join(lines).strip() for name, lines in self._lines.items()}
+
+        # Ensure blog post starts with a title
+        first_line = parsed["blog_post"].split("\n", 1)[0]
+        if parsed["blog_post"] and not (_TITLE.match(first_line) or first_line.lstrip().startswith("#")):
+            parsed["blog_post"] = f"# {parsed['blog_post']}"
+
+        logger.debug(
+            "Parsed sections: " + ", ".join(f"{name}={len(text)} chars" for name, text in parsed.items())
+        )
+        return parsed
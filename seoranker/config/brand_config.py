@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
 class ToneGuidelines(BaseModel):
@@ -38,7 +38,7 @@ class BrandConfig(BaseModel):
     target_audience: str = "general"
     key_values: List[str] = Field(default_factory=list)
     website: Optional[str] = None
-    products: List[Dict[str, str]] = Field(default_factory=list)
+    products: List[Dict[str, Any]] = Field(default_factory=list)  # name, description, url, details
     style_guide: StyleGuide = Field(default_factory=StyleGuide)
     brand_story: Optional[BrandStory] = Field(default_factory=BrandStory)
     cta_templates: List[str] = Field(default_factory=list)
@@ -54,10 +54,15 @@ class ModelConfig:
         return self.config[task.value]
     
     def update_model_config(self, task: TaskType, provider: ModelProvider, model: str):
+        fallback = self.config.get(task.value, {}).get("fallback")
         self.config[task.value] = {
             "provider": provider.value,
             "model": model
         }
         
+        # Keep the configured fallback chain
+        if fallback:
+            self.config[task.value]["fallback"] = fallback
+        
         with open(self.config_file, 'w') as f:
             json.dump(self.config, f, indent=2)
\ No newline at end of file
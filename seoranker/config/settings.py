@@ -30,13 +30,99 @@ DEFAULT_MODEL = "claude-3-sonnet-20240229"
 MAX_TOKENS = 4096
 TEMPERATURE = 0.7
 
+# Prompt Budget Configuration
+BLOG_PROMPT_TOKEN_BUDGET = 12000  # Input tokens for the full blog prompt
+BLOG_PROMPT_SECTION_SHARES = {  # Share of the budget left after the fixed template
+    "sources": 0.6,
+    "questions": 0.15,
+    "links": 0.1,
+    "products": 0.15
+}
+RESEARCH_SOURCE_TOKEN_BUDGET = 3000  # Key-sentence tokens across all sources in the research agent prompt
+PRODUCT_PROMPT_TOP_K = 3  # Most relevant catalog products offered to the blog prompt
+
+# Streaming Configuration
+STREAM_GENERATION = True
+STREAM_METADATA_TOKEN_LIMIT = 200  # Abort if <metadata> hasn't opened by then
+
+# Concurrency Configuration
+LLM_CONCURRENCY = {  # Max in-flight requests per provider
+    "anthropic": 4,
+    "groq": 8,
+    "local": 2
+}
+LLM_RATE_LIMITS = {  # Max request starts per minute per provider; missing or 0 means unlimited
+    "anthropic": 50,
+    "groq": 30
+}
+BATCH_CONCURRENCY = 3  # Default workers used by generate_content_batch
+SOCIAL_WORKERS = 4  # Threads shared by synchronous social post generation
+ARTICLE_CONCURRENCY = 3  # Articles generated at once by scripts/generate_article.py
+BATCH_POLL_INTERVAL = 60  # seconds between provider batch status checks
+
+# Pipeline Queue Configuration
+PIPELINE_DB_PATH = "knowledge_base/pipeline.db"
+PIPELINE_STAGES = ["research", "blog", "social", "archive", "publish"]  # In order; a job advances one stage at a time
+PIPELINE_LEASE_SECONDS = 600  # A job whose worker stops renewing its lease is picked up again
+PIPELINE_MAX_ATTEMPTS = 5  # Attempts per stage before the job is dead-lettered
+PIPELINE_BACKOFF_BASE = 30  # seconds before the first retry; doubles every attempt
+PIPELINE_BACKOFF_MAX = 3600  # seconds
+PIPELINE_POLL_INTERVAL = 5  # seconds an idle worker waits before polling again
+
+# Social Generation Configuration
+SOCIAL_PLATFORMS = ["linkedin", "twitter", "instagram"]
+SOCIAL_COMBINED_GENERATION = True  # One JSON call for all platforms; per-platform calls only for failed fields
+
+# Usage Metering Configuration
+LLM_PRICES = {  # USD per million tokens; models not listed are metered at zero cost
+    "claude-3-5-sonnet-20241022": {"input": 3.0, "output": 15.0, "cache_write": 3.75, "cache_read": 0.3},
+    "claude-3-sonnet-20240229": {"input": 3.0, "output": 15.0, "cache_write": 3.75, "cache_read": 0.3},
+    "claude-3-opus-20240229": {"input": 15.0, "output": 75.0, "cache_write": 18.75, "cache_read": 1.5},
+    "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25, "cache_write": 0.3, "cache_read": 0.03},
+    "mixtral-8x7b-32768": {"input": 0.24, "output": 0.24},
+    "llama-3.1-70b-versatile": {"input": 0.59, "output": 0.79},
+    "llama-3.1-8b-instant": {"input": 0.05, "output": 0.08},
+    "llama-3.2-3b-instruct": {"input": 0.0, "output": 0.0},  # Local
+}
+BATCH_PRICE_DISCOUNT = 0.5  # Batch API requests are billed at half price
+USAGE_REPORT_DIR = "logs/usage"
+
+# Routing Configuration (fallback chain in config/models.json)
+ROUTER_WINDOW = 20  # Calls kept per provider for rolling stats
+ROUTER_MIN_CALLS = 4  # Calls needed before the error rate can open the circuit
+ROUTER_ERROR_THRESHOLD = 0.5  # Rolling error rate that opens the circuit
+ROUTER_COOLDOWN = 60  # seconds before an open circuit allows a trial call
+ROUTER_SLOW_LATENCY = 90  # seconds; slower providers are tried after healthy ones
+
+# Local LLM Configuration
+LOCAL_LLM_BASE_URLS = [  # Comma-separated OpenAI-compatible servers to balance across
+    url.strip() for url in os.getenv("LOCAL_LLM_BASE_URLS", "http://localhost:1234/v1").split(",")
+    if url.strip()
+]
+LOCAL_LLM_CONNECT_TIMEOUT = 5  # seconds
+LOCAL_LLM_READ_TIMEOUT = 600  # seconds; long generations stream slowly on CPU
+LOCAL_LLM_POOL_SIZE = 4  # Keep-alive connections per server
+LOCAL_LLM_RETRY_AFTER = 30  # seconds an unreachable server is skipped
+
+# Content Storage Configuration
+CONTENT_BUNDLE_MODE = os.getenv("CONTENT_BUNDLE_MODE", "false").lower() == "true"  # Append to JSONL bundles instead of per-article files
+CONTENT_BUNDLE_DIR = "generated_content/bundles"  # One segment per run plus index.jsonl
+GENERATION_MANIFEST_PATH = "knowledge_base/generation_manifest.csv"  # Generated blog per keyword; last row wins
+
 # Search Configuration
 MAX_SEARCH_RESULTS = 5
 SEARCH_TIMEOUT = 30  # seconds
 
 # Logging Configuration
-LOG_LEVEL = "DEBUG"
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s' 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")  # File log level; console always shows INFO
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = "logs/debug.log"
+LOG_MAX_BYTES = 10 * 1024 * 1024  # Rotate the file log at 10MB
+LOG_BACKUP_COUNT = 5
+LOG_PAYLOAD_LIMIT = 2000  # chars of a prompt/response/API payload kept in the log
+LOG_PAYLOAD_SAMPLE_RATE = 0.02  # Fraction of payloads logged in full
+TRACE_SPANS = os.getenv("TRACE_SPANS", "true").lower() == "true"  # Record per-stage timing spans
+SPANS_FILE = "logs/spans.jsonl"
 
 # Add to existing settings
 CONTENT_DB_PATH = "knowledge_base/content_database.csv" 
\ No newline at end of file
@@ -0,0 +1,166 @@
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+from seoranker.content.blog_generator import BlogGenerator
+from seoranker.config.model_config import TaskType
+from seoranker.llm.metering import usage_context
+from seoranker.config.settings import BATCH_POLL_INTERVAL
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class BatchBlogGenerator:
+    """Generate blogs through the blog LLM's batch interface
+
+    Submissions are persisted to ``knowledge_base/batch_jobs.json`` so a restarted
+    process can collect batches that are still in flight.
+    """
+
+    def __init__(self, blog_generator: BlogGenerator, poll_interval: int = BATCH_POLL_INTERVAL):
+        self.blog_generator = blog_generator
+        self.llm = blog_generator.blog_llm
+        self.poll_interval = poll_interval
+        self.store_path = Path("knowledge_base/batch_jobs.json")
+
+    def _load_batches(self) -> List[Dict]:
+        """Load persisted batch records"""
+        if not self.store_path.exists():
+            return []
+        with open(self.store_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("batches", [])
+
+    def _save_batches(self, batches: List[Dict]):
+        """Persist batch records"""
+        self.store_path.parent.mkdir(exist_ok=True)
+        with open(self.store_path, 'w', encoding='utf-8') as f:
+            json.dump({"batches": batches}, f, indent=2)
+
+    def _update_batch(self, batch: Dict):
+        """Replace a persisted batch record by id"""
+        batches = [b for b in self._load_batches() if b["id"] != batch["id"]]
+        batches.append(batch)
+        self._save_batches(batches)
+
+    def pending_batches(self) -> List[Dict]:
+        """Get batches that have not been fully collected"""
+        return [b for b in self._load_batches() if b.get("status") != "collected"]
+
+    def in_flight_keywords(self) -> set:
+        """Get keywords belonging to batches that are still pending"""
+        keywords = set()
+        for batch in self.pending_batches():
+            collected = set(batch.get("collected", []))
+            keywords.update(
+                keyword.lower() for custom_id, keyword in batch["keywords"].items()
+                if custom_id not in collected
+            )
+        return keywords
+
+    def submit(self, keywords: List[str]) -> Dict:
+        """Build prompts for keywords and submit them as one batch"""
+        prompts = {}
+        custom_ids = {}
+
+        for i, keyword in enumerate(keywords, 1):
+            # Provider custom ids must be short and alphanumeric
+            custom_id = f"kw-{i}"
+            try:
+                prompts[custom_id] = self.blog_generator._prepare_blog_prompt(keyword)
+                custom_ids[custom_id] = keyword
+            except Exception as e:
+                logger.error(f"Error building prompt for {keyword}: {str(e)}")
+
+        if not prompts:
+            raise ValueError("No prompts could be built for batch submission")
+
+        batch = self.llm.submit_batch(prompts)
+        batch.update({
+            "model": self.llm.get_model_name(),
+            "keywords": custom_ids,
+            "collected": [],
+            "status": "submitted",
+            "submitted_at": datetime.now().isoformat()
+        })
+        self._update_batch(batch)
+
+        logger.info(f"Submitted batch {batch['id']} for {len(custom_ids)} keywords")
+        return batch
+
+    def _process_result(self, keyword: str, text: str) -> Dict:
+        """Run extraction, validation and saving on one batch result"""
+        try:
+            metadata = self.blog_generator._extract_metadata(text)
+            content_dict = self.blog_generator._build_content_dict(metadata)
+            social = self.blog_generator.social_generator.submit_all(content_dict)
+            saved_files = self.blog_generator._save_content_files(keyword, content_dict)
+            return self.blog_generator._archive_blog(keyword, content_dict, saved_files, social)
+
+        except Exception as e:
+            logger.error(f"Error processing batch result for {keyword}: {str(e)}")
+            return {
+                "keyword": keyword,
+                "error": str(e),
+                "status": "failed"
+            }
+
+    def collect(self, batch: Dict) -> List[Dict]:
+        """Poll a batch until it ends, then process results as they arrive"""
+        logger.info(f"Waiting for batch {batch['id']}...")
+        while self.llm.get_batch_status(batch) != "ended":
+            time.sleep(self.poll_interval)
+
+        # Skip requests a previous process already saved
+        collected = set(batch.get("collected", []))
+        if "prompts" in batch:
+            batch = {
+                **batch,
+                "prompts": {k: v for k, v in batch["prompts"].items() if k not in collected}
+            }
+
+        results = []
+        # Social calls inside _process_result re-tag their own usage
+        with usage_context(task=TaskType.BLOG.value):
+            for custom_id, text, error in self.llm.iter_batch_results(batch):
+                if custom_id in collected or custom_id not in batch["keywords"]:
+                    continue
+
+                keyword = batch["keywords"][custom_id]
+                if error:
+                    logger.error(f"Batch request failed for {keyword}: {error}")
+                    result = {"keyword": keyword, "error": error, "status": "failed"}
+                else:
+                    with usage_context(keyword=keyword):
+                        result = self._process_result(keyword, text)
+
+                print(f"{'✓' if result['status'] == 'success' else '✗'} {keyword}")
+                results.append(result)
+
+                # Record progress so a restart resumes after this request
+                collected.add(custom_id)
+                batch["collected"] = sorted(collected)
+                self._update_batch(batch)
+
+        batch["status"] = "collected"
+        batch.pop("prompts", None)
+        self._update_batch(batch)
+
+        return results
+
+    def run(self, keywords: List[str]) -> List[Dict]:
+        """Collect in-flight batches, then submit and collect remaining keywords"""
+        results = []
+
+        in_flight = self.in_flight_keywords()
+        for batch in self.pending_batches():
+            print(f"\nResuming batch {batch['id']}")
+            results.extend(self.collect(batch))
+
+        remaining = [k for k in keywords if k.lower() not in in_flight]
+        if remaining:
+            batch = self.submit(remaining)
+            print(f"\nSubmitted batch {batch['id']} ({len(batch['keywords'])} keywords)")
+            results.extend(self.collect(batch))
+
+        return results
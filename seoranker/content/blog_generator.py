@@ -1,39 +1,93 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+import asyncio
 import csv
 import json
-from groq import Groq
-from seoranker.utils.logger import setup_logger
-from seoranker.config.settings import GROQ_API_KEY
+import os
+import threading
+from seoranker.utils.logger import setup_logger, LogPayload
+from seoranker.utils.tracing import span
+from seoranker.config.settings import (
+    STREAM_GENERATION,
+    STREAM_METADATA_TOKEN_LIMIT,
+    BLOG_PROMPT_TOKEN_BUDGET,
+    BLOG_PROMPT_SECTION_SHARES,
+    PRODUCT_PROMPT_TOP_K
+)
 from seoranker.content.content_archive import ContentArchive
+from seoranker.content.manifest import GenerationManifest, output_filename
+from seoranker.content.product_index import ProductIndex
+from seoranker.tools.outline import OUTLINE_DB_PATH, format_outline
+from seoranker.tools.summarizer import SUMMARY_DB_PATH, summarize
 from datetime import datetime
-from seoranker.llm.anthropic_llm import AnthropicLLM
-from seoranker.llm.groq_llm import GroqLLM
 import re
-from seoranker.content.social_generator import SocialGenerator
+from seoranker.content.social_generator import SocialGenerator, SocialFuture
 from seoranker.config.model_config import ModelConfig, TaskType
 from seoranker.llm.model_factory import ModelFactory
+from seoranker.llm.base import finish_stream
+from seoranker.llm.metering import usage_context
 from seoranker.templates.blog_prompt import BlogPromptTemplate
+from seoranker.content.stream_parser import BlogStreamParser, MalformedOutputError
+from seoranker.content.prompt_budget import PromptBudgeter
 
 logger = setup_logger(__name__)
 
+HTML_FOOT = "\n</body>\n</html>"
+
 class BlogGenerator:
     """Generate SEO-optimized blog content for Shopify"""
     
-    def __init__(self):
-        config = ModelConfig()
-        blog_config = config.get_model_config(TaskType.BLOG)
+    def __init__(self, stream: bool = STREAM_GENERATION):
+        self.model_config = ModelConfig()
+        blog_config = self.model_config.get_model_config(TaskType.BLOG)
         self.blog_llm = ModelFactory.create_llm(blog_config)
-        self.social_llm = GroqLLM()     # Use Groq for social content
-        self.groq = Groq(api_key=GROQ_API_KEY)
         self.content_db_path = Path("knowledge_base/content_database.csv")
         self.suggestions_db_path = Path("knowledge_base/suggestions_database.csv")
         self.product_db_path = Path("knowledge_base/products.json")
+        self.outline_db_path = OUTLINE_DB_PATH
+        self.summary_db_path = SUMMARY_DB_PATH
+        self.product_index = ProductIndex(self.product_db_path)
         self.content_archive = ContentArchive()
-        self.blog_archive_path = self.content_archive.blog_archive_path
-        self.social_archive_path = self.content_archive.social_archive_path
-        self.social_generator = SocialGenerator()
+        self.manifest = GenerationManifest()
+        self._social_generator = None
+        self.stream = stream
+        # Reference databases parsed once and shared by concurrent generations
+        self._db_cache = {}
+        self._db_lock = threading.Lock()
+    
+    @property
+    def social_generator(self) -> SocialGenerator:
+        """Social generator, created on first use with the shared model config"""
+        if self._social_generator is None:
+            self._social_generator = SocialGenerator(config=self.model_config)
+        return self._social_generator
+    
+    @property
+    def social_llm(self):
+        """Social task LLM from the routing config, shared with the social generator"""
+        return self.social_generator.llm
         
+    def _read_database(self, path: Path, loader) -> object:
+        """Parse a reference database once, reparsing only when the file changes"""
+        mtime = path.stat().st_mtime
+        with self._db_lock:
+            cached = self._db_cache.get(path)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, loader(path))
+                self._db_cache[path] = cached
+            return cached[1]
+    
+    @staticmethod
+    def _group_rows(key_field: str):
+        """CSV loader grouping rows by their lowercased key field"""
+        def load(path: Path) -> Dict[str, List[Dict]]:
+            grouped = {}
+            with open(path, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    grouped.setdefault(row[key_field].lower(), []).append(row)
+            return grouped
+        return load
+    
     def _load_reference_content(self, keyword: str) -> Dict:
         """Load relevant content from databases"""
         content = {
@@ -45,38 +99,42 @@ class BlogGenerator:
         
         try:
             # Get top 3 reference articles
-            with open(self.content_db_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['keyword'].lower() == keyword.lower():
-                        content["main_sources"].append({
-                            "url": row["url"],
-                            "title": row["title"],
-                            "content": row["content"]
-                        })
-                        if len(content["main_sources"]) >= 3:
-                            break
+            sources = self._read_database(self.content_db_path, self._group_rows("keyword"))
+            content["main_sources"] = [
+                {"url": row["url"], "title": row["title"], "content": row["content"]}
+                for row in sources.get(keyword.lower(), [])[:3]
+            ]
+            
+            # Attach outlines computed at ingest
+            if self.outline_db_path.exists():
+                outlines = self._read_database(self.outline_db_path, self._group_rows("keyword"))
+                by_url = {row["url"]: row["outline"] for row in outlines.get(keyword.lower(), [])}
+                for source in content["main_sources"]:
+                    source["outline"] = json.loads(by_url.get(source["url"]) or "[]")
+            
+            # Attach key sentences ranked at ingest; pages ingested before
+            # summaries existed are ranked now (see tools/summarizer backfill)
+            summaries = {}
+            if self.summary_db_path.exists():
+                summaries = self._read_database(self.summary_db_path, self._group_rows("keyword"))
+            by_url = {row["url"]: row["key_sentences"] for row in summaries.get(keyword.lower(), [])}
+            for source in content["main_sources"]:
+                stored = by_url.get(source["url"])
+                source["key_sentences"] = json.loads(stored) if stored else summarize(source["content"])
             
             # Get relevant questions
-            with open(self.suggestions_db_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row['source_keyword'].lower() == keyword.lower():
-                        content["questions"].append({
-                            "question": row["question"],
-                            "title": row["title"],
-                            "url": row["url"]
-                        })
+            suggestions = self._read_database(self.suggestions_db_path, self._group_rows("source_keyword"))
+            content["questions"] = [
+                {"question": row["question"], "title": row["title"], "url": row["url"]}
+                for row in suggestions.get(keyword.lower(), [])
+            ]
             
             # Get related blog posts using ContentArchive
             related = self.content_archive.get_related_content(keyword, limit=3)
             content["related_blogs"] = related.get("blogs", [])
             
-            # Get relevant products
-            if self.product_db_path.exists():
-                with open(self.product_db_path, 'r', encoding='utf-8') as f:
-                    products = json.load(f)
-                    content["products"] = products.get("products", [])
+            # Get the most relevant products rather than the whole catalog
+            content["products"] = self.product_index.top(keyword, PRODUCT_PROMPT_TOP_K)
                 
             return content
             
@@ -89,38 +147,55 @@ class BlogGenerator:
         # Get relevant internal links
         internal_links = self._get_relevant_internal_links(keyword)
         
-        # Extract H2 structure from reference articles
+        # Reference structures from the outlines stored at ingest
         h2_analysis = "Reference Article Structures:\n"
         for idx, source in enumerate(content["main_sources"], 1):
-            article_content = source.get("content", "")
-            h2_tags = re.findall(r'<h2[^>]*>(.*?)</h2>', article_content, re.IGNORECASE | re.DOTALL)
-            if h2_tags:
-                h2_analysis += f"\nArticle {idx} Structure:\n"
-                for h2 in h2_tags:
-                    h2_analysis += f"- {h2.strip()}\n"
+            outline = format_outline(source.get("outline", []))
+            if outline:
+                h2_analysis += f"\nArticle {idx} Structure:\n{outline}\n"
         
-        # Add Bestia Brisk product info
-        bestia_product = {
-            "name": "Bestia Brisk Original Instant Coffee",
-            "url": "https://bestiabrisk.com/products/bestia-brisk-original-instant-coffee",
-            "details": {
-                "origin": "Coorg (Single Origin)",
-                "grade": "AAA",
-                "blend": "60% Arabica, 40% Robusta",
-                "roast": "Light Roast (Slow Roasted)",
-                "production": "Small Batch",
-                "type": "Instant Coffee (Granule)"
-            }
-        }
+        # Fit each section into its share of the token budget
+        budgeter = PromptBudgeter(
+            self.blog_llm.count_tokens,
+            BLOG_PROMPT_TOKEN_BUDGET,
+            BLOG_PROMPT_SECTION_SHARES
+        )
+        fixed_prompt = BlogPromptTemplate.format_prompt(
+            keyword=keyword,
+            h2_analysis=h2_analysis,
+            product_info="",
+            questions="",
+            internal_links="",
+            sources=""
+        )
+        budgeter.usage["template"] = self.blog_llm.count_tokens(fixed_prompt)
+        budgets = budgeter.section_budgets(budgeter.usage["template"])
+        
+        products = budgeter.fit_items(content["products"], keyword, budgets["products"], ["name", "description"])
+        product_info = budgeter.record("products", json.dumps(products, indent=2))
+        
+        questions = budgeter.fit_items(content["questions"], keyword, budgets["questions"], ["question", "title"])
+        questions_text = budgeter.record("questions", json.dumps(questions, indent=2))
         
-        return BlogPromptTemplate.format_prompt(
+        links = budgeter.fit_items(internal_links["relevant_links"], keyword, budgets["links"], ["title", "context"])
+        links_text = budgeter.record("links", json.dumps(links, indent=2))
+        
+        # Budget the smaller sections didn't use goes to sources
+        leftover = sum(max(budgets[name] - budgeter.usage[name], 0) for name in ("products", "questions", "links"))
+        sources = budgeter.fit_key_sentences(content["main_sources"], budgets["sources"] + leftover)
+        sources_text = budgeter.record("sources", json.dumps(sources, indent=2))
+        
+        prompt = BlogPromptTemplate.format_prompt(
             keyword=keyword,
             h2_analysis=h2_analysis,
-            product_info=json.dumps([bestia_product], indent=2),
-            questions=json.dumps(content["questions"], indent=2),
-            internal_links=json.dumps(internal_links["relevant_links"], indent=2),
-            sources=json.dumps(content["main_sources"], indent=2)
+            product_info=product_info,
+            questions=questions_text,
+            internal_links=links_text,
+            sources=sources_text
         )
+        budgeter.log_usage(keyword, prompt)
+        
+        return prompt
 
     def _extract_metadata(self, content: str) -> Dict:
         """Extract metadata and content from Claude's response"""
@@ -199,19 +274,80 @@ class BlogGenerator:
             logger.error(f"Error validating content: {str(e)}")
             return False
 
-    def _save_content_files(self, keyword: str, content: Dict) -> Dict:
-        """Save content to files"""
+    def _blog_file_path(self, keyword: str) -> Path:
+        """Get HTML output path for keyword, creating the output directory"""
+        output_dir = Path("output")
+        output_dir.mkdir(exist_ok=True)
+        
+        return output_dir / output_filename(keyword)
+
+    def _stream_blog_content(self, keyword: str, prompt: str, on_metadata: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Stream blog generation, parsing metadata and writing the HTML file as it arrives
+        
+        ``on_metadata`` is called with the title and meta description as soon
+        as they are parsed, while the body is still streaming. The finished
+        HTML is left in ``partial_file`` for ``_save_content_files`` to move
+        into place; it is removed if the stream fails.
+        """
+        partial_file = self._blog_file_path(keyword).with_suffix(".html.part")
+        extra_on_metadata = on_metadata
+        body_start = None
+        
+        stream = self.blog_llm.stream_content(prompt)
         try:
-            # Create output directory
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
+            with open(partial_file, 'w', encoding='utf-8') as sink:
+                def on_metadata(metadata: Dict):
+                    nonlocal body_start
+                    logger.info(f"Title: {metadata['title']}")
+                    logger.debug(f"Meta Description: {metadata['meta_description']}")
+                    sink.write(self._html_head(metadata))
+                    body_start = sink.tell()
+                    if extra_on_metadata:
+                        extra_on_metadata(metadata)
+                
+                parser = BlogStreamParser(
+                    body_sink=sink,
+                    on_metadata=on_metadata,
+                    max_preamble_tokens=STREAM_METADATA_TOKEN_LIMIT
+                )
+                for chunk in stream:
+                    try:
+                        parser.feed(chunk)
+                    except MalformedOutputError as e:
+                        # Raised back out through the stream so a routing LLM
+                        # counts the provider's output as a failure
+                        stream.throw(e)
+                    if parser.done:
+                        break
+                metadata = parser.close()
+                finish_stream(stream)
+                
+                # Cleanup usually only trims the end of the streamed body
+                body = metadata["blog_content"]
+                if parser.streamed_body.startswith(body):
+                    sink.seek(body_start + len(body.encode('utf-8')))
+                else:
+                    sink.seek(body_start)
+                    sink.write(body)
+                sink.truncate()
+                sink.write(HTML_FOOT)
+            
+            metadata["partial_file"] = partial_file
+            return metadata
             
-            # Sanitize keyword for filename
-            safe_keyword = "".join(c if c.isalnum() else "_" for c in keyword.lower())
-            blog_file = output_dir / f"{safe_keyword}.html"
+        except BaseException:
+            if partial_file.exists():
+                partial_file.unlink()
+            raise
             
-            # Generate complete HTML
-            html_content = f"""<!DOCTYPE html>
+        finally:
+            # Closing the stream stops token spend on early abort
+            stream.close()
+
+    @staticmethod
+    def _html_head(content: Dict) -> str:
+        """HTML document up to the blog body"""
+        return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -219,23 +355,40 @@ class BlogGenerator:
     <title>{content['title']}</title>
 </head>
 <body>
-    {content['blog_content']}
-</body>
-</html>"""
-            
-            # Save HTML file
+    """
+
+    def _write_blog_html(self, keyword: str, content: Dict, partial_file: Optional[Path] = None) -> Tuple[Path, str]:
+        """Write blog post HTML file; returns its path and HTML
+        
+        A ``partial_file`` already written by streaming is moved into place
+        instead of writing the HTML again.
+        """
+        blog_file = self._blog_file_path(keyword)
+        
+        # Generate complete HTML
+        html_content = self._html_head(content) + content['blog_content'] + HTML_FOOT
+        
+        # Save HTML file
+        if partial_file is not None:
+            os.replace(partial_file, blog_file)
+        else:
             with open(blog_file, 'w', encoding='utf-8') as f:
                 f.write(html_content)
-            
-            logger.debug(f"✓ Saved blog post to: {blog_file}")
-            
-            # Generate social content versions
-            social_content = self.social_generator.generate_all(content)
+        
+        logger.debug(f"✓ Saved blog post to: {blog_file}")
+        return blog_file, html_content
+
+    def _save_content_files(self, keyword: str, content: Dict, partial_file: Optional[Path] = None) -> Dict:
+        """Save blog HTML; social versions are attached once they finish"""
+        try:
+            blog_file, html_content = self._write_blog_html(keyword, content, partial_file)
+            self.manifest.record(keyword, blog_file.absolute(), html_content)
             
             return {
                 "blog": str(blog_file.absolute()),  # Use absolute path
-                "linkedin": social_content.get("linkedin", ""),
-                "twitter": social_content.get("twitter", ""),
+                "linkedin": "",
+                "twitter": "",
+                "instagram": "",
                 "status": "draft"
             }
             
@@ -243,48 +396,128 @@ class BlogGenerator:
             logger.error(f"Error saving content files: {str(e)}")
             return None
 
+    def _prepare_blog_prompt(self, keyword: str) -> str:
+        """Load reference content and build the blog prompt (stages 1-2)"""
+        # 1. Load reference content
+        logger.debug("\n1. LOADING REFERENCE CONTENT")
+        logger.debug("-" * 30)
+        with span("load_references"):
+            content = self._load_reference_content(keyword)
+        
+        # Debug content sources
+        logger.debug("\nMain Sources:")
+        for src in content["main_sources"]:
+            logger.debug(f"- {src['title']}")
+            logger.debug(f"  URL: {src['url']}")
+        
+        logger.debug("\nQuestions to Address:")
+        for q in content["questions"]:
+            logger.debug(f"- {q['question']}")
+        
+        logger.debug("\nRelated Blogs:")
+        for blog in content["related_blogs"]:
+            logger.debug(f"- {blog.get('title', 'No title')}")
+        
+        logger.debug("\nProducts to Reference:")
+        for product in content["products"]:
+            logger.debug(f"- {product.get('name', 'No name')}")
+        
+        # 2. Generate prompt
+        logger.debug("\n2. GENERATING PROMPT")
+        logger.debug("-" * 30)
+        with span("build_prompt") as stage:
+            prompt = self._generate_blog_prompt(keyword, content)
+            stage.add_bytes(received=prompt)
+        logger.debug("\nPrompt Structure:")
+        logger.debug(f"- Total length: {len(prompt)} chars")
+        logger.debug(f"- Keyword: {keyword}")
+        logger.debug(f"- Sources: {len(content['main_sources'])}")
+        logger.debug(f"- Questions: {len(content['questions'])}")
+        logger.debug(f"- Products: {len(content['products'])}")
+        logger.debug("\nFull Prompt:\n%s", LogPayload(prompt))
+        
+        return prompt
+
+    def _build_content_dict(self, metadata: Dict) -> Dict:
+        """Structure extracted metadata and validate it (stage 5)"""
+        logger.debug("Extracted Metadata:")
+        logger.debug(f"- Title: {metadata.get('title', 'No title')}")
+        logger.debug(f"- Meta Description: {metadata.get('meta_description', 'No meta')}")
+        logger.debug(f"- HTML Content Length: {len(metadata.get('html_content', ''))}")
+        
+        # Structure content
+        content_dict = {
+            "blog_content": metadata["blog_content"],
+            "meta_description": metadata["meta_description"],
+            "title": metadata["title"],
+            "internal_links": [],
+            "external_links": []
+        }
+        
+        # 5. Validate content
+        logger.debug("\n5. VALIDATING CONTENT")
+        logger.debug("-" * 30)
+        with span("validate"):
+            validation_result = self._validate_content(content_dict)
+        logger.debug(f"Validation Result: {'✓ Passed' if validation_result else '✗ Failed'}")
+        
+        if not validation_result:
+            raise ValueError("Generated content failed validation")
+        
+        return content_dict
+
+    def _attach_social(self, content_dict: Dict, saved_files: Dict, social_content: Dict):
+        """Add finished social versions to the saved files and content"""
+        saved_files["linkedin"] = social_content.get("linkedin", "")
+        saved_files["twitter"] = social_content.get("twitter", "")
+        saved_files["instagram"] = social_content.get("instagram", "")
+        content_dict.update({
+            "linkedin_content": saved_files["linkedin"],
+            "twitter_thread": saved_files["twitter"],
+            "instagram_caption": saved_files["instagram"]
+        })
+
+    def _archive_blog(self, keyword: str, content_dict: Dict, saved_files: Dict,
+                      social: Optional[SocialFuture] = None) -> Dict:
+        """Save generated blog to archive and build the result (stage 7)
+        
+        ``social`` is a pending ``SocialGenerator.submit_all`` result; it is
+        collected after archiving so both overlap.
+        """
+        logger.debug("\n7. SAVING TO ARCHIVE")
+        logger.debug("-" * 30)
+        content_dict["files"] = saved_files
+        with span("archive"):
+            archive_result = self._save_to_archive(keyword, content_dict)
+        logger.debug(f"✓ Archive save result: {archive_result}")
+        
+        if social is not None:
+            with span("await_social"):
+                social_content = social.result()
+            self._attach_social(content_dict, saved_files, social_content)
+        
+        return {
+            "keyword": keyword,
+            "content": content_dict,
+            "status": "success",
+            "blog_id": archive_result.get("blog_id"),
+            "files": saved_files
+        }
+
     def generate_blog(self, keyword: str) -> Dict:
         """Generate complete blog post"""
+        with span("generate_blog", keyword=keyword) as run, usage_context(keyword=keyword):
+            result = self._generate_blog(keyword)
+            run.attrs["result"] = result["status"]
+            return result
+
+    def _generate_blog(self, keyword: str) -> Dict:
         try:
             logger.debug(f"\n{'='*50}")
             logger.debug(f"Starting blog generation for: {keyword}")
             logger.debug(f"{'='*50}")
             
-            # 1. Load reference content
-            logger.debug("\n1. LOADING REFERENCE CONTENT")
-            logger.debug("-" * 30)
-            content = self._load_reference_content(keyword)
-            
-            # Debug content sources
-            logger.debug("\nMain Sources:")
-            for src in content["main_sources"]:
-                logger.debug(f"- {src['title']}")
-                logger.debug(f"  URL: {src['url']}")
-            
-            logger.debug("\nQuestions to Address:")
-            for q in content["questions"]:
-                logger.debug(f"- {q['question']}")
-            
-            logger.debug("\nRelated Blogs:")
-            for blog in content["related_blogs"]:
-                logger.debug(f"- {blog.get('title', 'No title')}")
-            
-            logger.debug("\nProducts to Reference:")
-            for product in content["products"]:
-                logger.debug(f"- {product.get('name', 'No name')}")
-            
-            # 2. Generate prompt
-            logger.debug("\n2. GENERATING PROMPT")
-            logger.debug("-" * 30)
-            prompt = self._generate_blog_prompt(keyword, content)
-            logger.debug("\nPrompt Structure:")
-            logger.debug(f"- Total length: {len(prompt)} chars")
-            logger.debug(f"- Keyword: {keyword}")
-            logger.debug(f"- Sources: {len(content['main_sources'])}")
-            logger.debug(f"- Questions: {len(content['questions'])}")
-            logger.debug(f"- Products: {len(content['products'])}")
-            logger.debug("\nFull Prompt:")
-            logger.debug(f"{prompt}")
+            prompt = self._prepare_blog_prompt(keyword)
             
             # 3. Generate content
             logger.debug("\n3. GENERATING CONTENT")
@@ -292,63 +525,115 @@ class BlogGenerator:
             logger.debug(f"Using model: {self.blog_llm.get_model_name()}")
             logger.debug(f"Max tokens: {self.blog_llm.max_tokens_limit}")
             
-            blog_content = self.blog_llm.generate_content(prompt)
-            
-            # Debug generated content
-            logger.debug("\nGenerated Content:")
-            logger.debug(f"- Length: {len(blog_content)} chars")
-            logger.debug("- First 200 chars:")
-            logger.debug(blog_content)
+            # Social posts only need the title and meta description, so they
+            # start as soon as those are known and run alongside the rest
+            social = None
+            
+            def start_social(metadata: Dict):
+                nonlocal social
+                social = self.social_generator.submit_all(metadata)
+            
+            try:
+                if self.stream:
+                    # 4. Extract metadata while the response streams in
+                    logger.debug("\n4. EXTRACTING METADATA (streaming)")
+                    logger.debug("-" * 30)
+                    with span("generate_stream", model=self.blog_llm.get_model_name()) as stage, \
+                            usage_context(task=TaskType.BLOG.value):
+                        metadata = self._stream_blog_content(keyword, prompt, on_metadata=start_social)
+                        stage.add_bytes(sent=prompt, received=metadata.get("blog_content"))
+                else:
+                    with span("generate", model=self.blog_llm.get_model_name()) as stage, \
+                            usage_context(task=TaskType.BLOG.value):
+                        blog_content = self.blog_llm.generate_content(prompt)
+                        stage.add_bytes(sent=prompt, received=blog_content)
+                
+                    # Debug generated content
+                    logger.debug("\nGenerated Content:")
+                    logger.debug("- Length: %d chars", len(blog_content))
+                    logger.debug("%s", LogPayload(blog_content))
+                
+                    # 4. Extract metadata
+                    logger.debug("\n4. EXTRACTING METADATA")
+                    logger.debug("-" * 30)
+                    with span("extract"):
+                        metadata = self._extract_metadata(blog_content)
+            
+                partial_file = metadata.get("partial_file")
+                try:
+                    content_dict = self._build_content_dict(metadata)
+                    if social is None:
+                        start_social(content_dict)
+                
+                    # Save content files
+                    logger.debug("\n6. SAVING CONTENT FILES")
+                    logger.debug("-" * 30)
+                    with span("save_files"):
+                        saved_files = self._save_content_files(keyword, content_dict, partial_file)
+                finally:
+                    # A streamed file that failed validation never becomes output
+                    if partial_file is not None and partial_file.exists():
+                        partial_file.unlink()
+                
+                return self._archive_blog(keyword, content_dict, saved_files, social)
+            except BaseException:
+                # Don't leave social calls running for a blog that wasn't saved
+                if social is not None:
+                    social.cancel()
+                raise
             
-            # 4. Extract metadata
-            logger.debug("\n4. EXTRACTING METADATA")
-            logger.debug("-" * 30)
-            metadata = self._extract_metadata(blog_content)
-            logger.debug("Extracted Metadata:")
-            logger.debug(f"- Title: {metadata.get('title', 'No title')}")
-            logger.debug(f"- Meta Description: {metadata.get('meta_description', 'No meta')}")
-            logger.debug(f"- HTML Content Length: {len(metadata.get('html_content', ''))}")
-            
-            # Structure content
-            content_dict = {
-                "blog_content": metadata["blog_content"],
-                "meta_description": metadata["meta_description"],
-                "title": metadata["title"],
-                "internal_links": [],
-                "external_links": []
+        except Exception as e:
+            logger.error(f"Error generating blog: {str(e)}", exc_info=True)
+            return {
+                "keyword": keyword,
+                "error": str(e),
+                "status": "failed"
             }
+
+    async def agenerate_blog(self, keyword: str) -> Dict:
+        """Generate complete blog post without blocking the event loop
+        
+        LLM calls use the providers' async clients; file and CSV work runs in threads.
+        """
+        with span("generate_blog", keyword=keyword, mode="async") as run, usage_context(keyword=keyword):
+            result = await self._agenerate_blog(keyword)
+            run.attrs["result"] = result["status"]
+            return result
+
+    async def _agenerate_blog(self, keyword: str) -> Dict:
+        try:
+            logger.debug(f"\nStarting async blog generation for: {keyword}")
             
-            # 5. Validate content
-            logger.debug("\n5. VALIDATING CONTENT")
-            logger.debug("-" * 30)
-            validation_result = self._validate_content(content_dict)
-            logger.debug(f"Validation Result: {'✓ Passed' if validation_result else '✗ Failed'}")
+            prompt = await asyncio.to_thread(self._prepare_blog_prompt, keyword)
             
-            if not validation_result:
-                raise ValueError("Generated content failed validation")
+            # 3. Generate content
+            with span("generate", model=self.blog_llm.get_model_name()) as stage, \
+                    usage_context(task=TaskType.BLOG.value):
+                blog_content = await self.blog_llm.agenerate_content(prompt)
+                stage.add_bytes(sent=prompt, received=blog_content)
             
-            # Save content files
-            logger.debug("\n6. SAVING CONTENT FILES")
-            logger.debug("-" * 30)
-            saved_files = self._save_content_files(keyword, content_dict)
+            # 4. Extract metadata
+            with span("extract"):
+                metadata = self._extract_metadata(blog_content)
             
-            # Save to archive
-            logger.debug("\n7. SAVING TO ARCHIVE")
-            logger.debug("-" * 30)
-            content_dict.update({
-                "linkedin_content": saved_files.get("linkedin"),
-                "twitter_thread": saved_files.get("twitter")
-            })
-            archive_result = self._save_to_archive(keyword, content_dict)
-            logger.debug(f"✓ Archive save result: {archive_result}")
+            # Social posts run while the HTML is written and archived
+            social_task = asyncio.create_task(self.social_generator.agenerate_all(metadata))
+            try:
+                content_dict = self._build_content_dict(metadata)
+                
+                # 6. Save blog HTML
+                with span("save_files"):
+                    saved_files = await asyncio.to_thread(self._save_content_files, keyword, content_dict)
+                
+                result = await asyncio.to_thread(self._archive_blog, keyword, content_dict, saved_files)
+                with span("await_social"):
+                    social_content = await social_task
+            except BaseException:
+                social_task.cancel()
+                raise
             
-            return {
-                "keyword": keyword,
-                "content": content_dict,
-                "status": "success",
-                "blog_id": archive_result.get("blog_id"),
-                "files": saved_files
-            }
+            self._attach_social(content_dict, saved_files, social_content)
+            return result
             
         except Exception as e:
             logger.error(f"Error generating blog: {str(e)}", exc_info=True)
@@ -384,14 +669,14 @@ class BlogGenerator:
             } 
 
     def _get_relevant_internal_links(self, keyword: str) -> Dict:
-        """Get relevant internal links using Groq LLM"""
+        """Get relevant internal links using the social task LLM"""
         try:
             # Get existing blog posts from archive
-            with open(self.blog_archive_path, 'r') as f:
-                archive = json.load(f)
-                existing_blogs = archive.get("blogs", [])
+            existing_blogs = self.content_archive.get_all_entries()
+            if not existing_blogs:
+                return {"relevant_links": []}
             
-            # Create prompt for Groq
+            # Create prompt for link selection
             prompt = f"""
 Given the keyword "{keyword}", analyze these blog posts and return the 3 most relevant ones 
 that should be linked in our new blog post about {keyword}.
@@ -414,8 +699,11 @@ Return only the JSON response in this format:
     ]
 }}
 """
-            # Use Groq for quick analysis
-            response = self.social_llm.generate_content(prompt)
+            # Use the fast social model for quick analysis
+            with span("llm.internal_links", model=self.social_llm.get_model_name()) as call, \
+                    usage_context(task="internal_links"):
+                response = self.social_llm.generate_content(prompt)
+                call.add_bytes(sent=prompt, received=response)
             relevant_links = json.loads(response)
             
             logger.debug("\nRelevant Internal Links:")
@@ -1,19 +1,25 @@
 import csv
-import logging
+import re
 from pathlib import Path
 from typing import Dict, Optional
-from bs4 import BeautifulSoup
+from seoranker.utils.logger import setup_logger
+from seoranker.utils.storage import CSVStore
 
-logger = logging.getLogger(__name__)
+logger = setup_logger(__name__)
+
+ARCHIVE_FIELDS = ['keyword', 'title', 'meta_description', 'file_path', 'status', 'word_count', 'body']
 
 class ContentArchive:
     def __init__(self):
         self.archive_path = Path("knowledge_base/blog_archive.csv")
         self.archive_path.parent.mkdir(exist_ok=True)
+        self.store = CSVStore(self.archive_path, ARCHIVE_FIELDS)
 
     def _extract_body_content(self, html_content: str) -> str:
         """Extract clean body content from HTML"""
         try:
+            from bs4 import BeautifulSoup
+            
             soup = BeautifulSoup(html_content, 'html.parser')
             body = soup.find('body')
             
@@ -34,22 +40,11 @@ class ContentArchive:
     def add_entry(self, entry: Dict) -> bool:
         """Add new entry to archive"""
         try:
-            # Prepare headers and entry
-            headers = ['keyword', 'title', 'meta_description', 'file_path', 'status', 'word_count', 'body']
-            
             # Extract clean body content
             entry['body'] = self._extract_body_content(entry['body'])
             
-            # Create file with headers if it doesn't exist
-            if not self.archive_path.exists():
-                with open(self.archive_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=headers)
-                    writer.writeheader()
-            
-            # Append entry
-            with open(self.archive_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writerow(entry)
+            # Header is written with the first row if the file is new
+            self.store.append_rows([entry])
                 
             logger.info(f"Added entry for keyword: {entry['keyword']}")
             return True
@@ -58,6 +53,57 @@ class ContentArchive:
             logger.error(f"Error adding archive entry: {str(e)}")
             return False
             
+    def save_content(self, content: Dict) -> Dict:
+        """Archive a generated blog as a draft from its saved HTML file"""
+        try:
+            html_path = Path(content.get("file_path", ""))
+            body = ""
+            if content.get("file_path") and html_path.exists():
+                with open(html_path, 'r', encoding='utf-8') as f:
+                    body = f.read()
+            
+            entry = {
+                "keyword": content["keyword"],
+                "title": content["title"],
+                "meta_description": content["meta_description"],
+                "file_path": content.get("file_path", ""),
+                "status": "draft",
+                "word_count": len(re.sub(r'<[^>]+>', ' ', body).split()),
+                "body": body
+            }
+            if not self.add_entry(entry):
+                return {"status": "error", "error": "Could not add archive entry"}
+            
+            return {
+                "status": "success",
+                "blog_id": html_path.stem or content["keyword"]
+            }
+            
+        except Exception as e:
+            logger.error(f"Error saving content to archive: {str(e)}")
+            return {"status": "error", "error": str(e)}
+
+    def get_related_content(self, keyword: str, limit: int = 3) -> Dict:
+        """Get archived blogs sharing the most words with keyword"""
+        terms = set(re.findall(r'[a-z0-9]+', keyword.lower()))
+        scored = []
+        for entry in self.get_all_entries():
+            if entry.get("keyword", "").lower() == keyword.lower():
+                continue
+            text = f"{entry.get('keyword', '')} {entry.get('title', '')}".lower()
+            overlap = len(terms & set(re.findall(r'[a-z0-9]+', text)))
+            if overlap:
+                scored.append((overlap, entry))
+        
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return {
+            "blogs": [{
+                "title": entry.get("title", ""),
+                "meta_description": entry.get("meta_description", ""),
+                "file_path": entry.get("file_path", "")
+            } for _, entry in scored[:limit]]
+        }
+            
     def get_entry(self, keyword: str) -> Optional[Dict]:
         """Get entry by keyword"""
         try:
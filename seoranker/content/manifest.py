@@ -0,0 +1,89 @@
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List
+from seoranker.config.settings import GENERATION_MANIFEST_PATH
+from seoranker.utils.storage import CSVStore
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MANIFEST_FIELDS = ['keyword', 'path', 'content_hash', 'generated_at', 'status']
+
+def output_filename(keyword: str) -> str:
+    """HTML file name for a keyword: every non-alphanumeric character becomes '_'"""
+    return "".join(c if c.isalnum() else "_" for c in keyword.lower()) + ".html"
+
+def normalize_keyword(keyword: str) -> str:
+    return keyword.lower().strip()
+
+class GenerationManifest:
+    """Record of generated blogs: keyword -> output path, content hash, timestamp, status
+
+    Stored as an append-only CSV where the last row for a keyword wins, so
+    concurrent generators only ever append. Pending keywords are a set
+    difference against the manifest rather than a scan of ``output/``.
+    """
+
+    def __init__(self, path: str = GENERATION_MANIFEST_PATH):
+        self.path = Path(path)
+        self.store = CSVStore(self.path, MANIFEST_FIELDS)
+        self._entries: Dict[str, Dict] = {}
+        self._stamp = None
+
+    def record(self, keyword: str, path: Path, content: str, status: str = "generated") -> Dict:
+        """Add or replace the entry for keyword"""
+        entry = {
+            "keyword": normalize_keyword(keyword),
+            "path": str(path),
+            "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            "generated_at": datetime.now().isoformat(),
+            "status": status
+        }
+        self.store.append_rows([entry])
+        logger.debug(f"Manifest: {entry['keyword']} -> {entry['path']} ({status})")
+        return entry
+
+    def entries(self) -> Dict[str, Dict]:
+        """Latest entry per keyword, reloaded only when the file changes"""
+        if not self.path.exists():
+            return {}
+        stat = self.path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._entries = {row["keyword"]: row for row in self.store.read_rows()}
+            self._stamp = stamp
+        return self._entries
+
+    def generated_keywords(self) -> set:
+        """Normalized keywords with generated content"""
+        return {keyword for keyword, entry in self.entries().items() if entry["status"] == "generated"}
+
+    def pending(self, keywords: Iterable[str]) -> List[str]:
+        """Keywords without generated content, in the given order"""
+        done = self.generated_keywords()
+        return [keyword for keyword in keywords if normalize_keyword(keyword) not in done]
+
+    def backfill(self, keywords: Iterable[str], output_dir: Path = Path("output")) -> int:
+        """Record HTML files written before the manifest existed
+
+        Checks only the expected file for each keyword, so it is a stat per
+        keyword rather than a directory scan.
+        """
+        known = self.entries()
+        rows = []
+        for keyword in keywords:
+            html_file = output_dir / output_filename(keyword)
+            if normalize_keyword(keyword) in known or not html_file.exists():
+                continue
+            rows.append({
+                "keyword": normalize_keyword(keyword),
+                "path": str(html_file.absolute()),
+                "content_hash": hashlib.sha256(html_file.read_bytes()).hexdigest(),
+                "generated_at": datetime.fromtimestamp(html_file.stat().st_mtime).isoformat(),
+                "status": "generated"
+            })
+        added = self.store.append_rows(rows, unique=("keyword",))
+        if added:
+            logger.info(f"Added {added} existing output files to the generation manifest")
+        return added
@@ -0,0 +1,121 @@
+import json
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from seoranker.config.settings import PRODUCT_PROMPT_TOP_K
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+NAME_WEIGHT = 2  # Name terms count as if repeated this many times
+
+_WORD = re.compile(r'[a-z0-9]+')
+_SUFFIXES = ('ing', 'ers', 'ies', 'es', 'ed', 'er', 's')
+
+def _stem(term: str) -> str:
+    """Strip common English suffixes so 'roasted' matches 'roast' and 'beans' matches 'bean'"""
+    for suffix in _SUFFIXES:
+        if len(term) > len(suffix) + 2 and term.endswith(suffix):
+            return term[:-len(suffix)] + ('y' if suffix == 'ies' else '')
+    return term
+
+def _terms(text: str) -> List[str]:
+    return [_stem(term) for term in _WORD.findall(text.lower())]
+
+def _flatten(value) -> str:
+    """Text of a product field, including nested details and tag lists"""
+    if isinstance(value, dict):
+        return " ".join(_flatten(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten(v) for v in value)
+    return str(value)
+
+class ProductIndex:
+    """Product catalog ranked against keywords with BM25
+
+    The catalog is parsed and indexed once, and rebuilt only when the file
+    changes. Falls back to the products in the brand config when the catalog
+    file does not exist. With no matching product, the first catalog entry is
+    returned so prompts still reference the flagship.
+    """
+
+    def __init__(self, path: Path, fallback_path: Optional[Path] = Path("config/brand.json")):
+        self.path = Path(path)
+        self.fallback_path = Path(fallback_path) if fallback_path else None
+        self._lock = threading.Lock()
+        self._stamp = None
+        self.products: List[Dict] = []
+        self._postings: Dict[str, List] = {}
+        self._lengths: List[int] = []
+        self._average_length = 0.0
+
+    def _source(self) -> Optional[Path]:
+        if self.path.exists():
+            return self.path
+        if self.fallback_path and self.fallback_path.exists():
+            return self.fallback_path
+        return None
+
+    def _build(self, path: Path):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.products = json.load(f).get("products", [])
+
+        self._postings = {}
+        self._lengths = []
+        for index, product in enumerate(self.products):
+            fields = {k: v for k, v in product.items() if k not in ("name", "url", "image")}
+            terms = _terms(str(product.get("name", ""))) * NAME_WEIGHT + _terms(_flatten(fields))
+            counts: Dict[str, int] = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, count in counts.items():
+                self._postings.setdefault(term, []).append((index, count))
+            self._lengths.append(len(terms))
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        logger.debug(f"Indexed {len(self.products)} products from {path}")
+
+    def _refresh(self):
+        """Rebuild the index if the catalog file changed since it was built"""
+        path = self._source()
+        if path is None:
+            self.products, self._postings, self._stamp = [], {}, None
+            return
+        stat = path.stat()
+        stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._build(path)
+            self._stamp = stamp
+
+    def _scores(self, keyword: str) -> Dict[int, float]:
+        """BM25 score per product index, for products sharing a term with keyword"""
+        count = len(self.products)
+        scores: Dict[int, float] = {}
+        for term in set(_terms(keyword)):
+            postings = self._postings.get(term, [])
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for index, frequency in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[index] / self._average_length)
+                scores[index] = scores.get(index, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return scores
+
+    def top(self, keyword: str, k: int = PRODUCT_PROMPT_TOP_K) -> List[Dict]:
+        """The k products most relevant to keyword, best first"""
+        try:
+            with self._lock:
+                self._refresh()
+                if not self.products:
+                    return []
+                scores = self._scores(keyword)
+                if not scores:
+                    return self.products[:1]
+                ranked = sorted(scores, key=lambda index: (-scores[index], index))[:k]
+                return [self.products[index] for index in ranked]
+        except Exception as e:
+            logger.error(f"Error ranking products for '{keyword}': {str(e)}")
+            return []
@@ -0,0 +1,110 @@
+import re
+from typing import Callable, Dict, List, Optional
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+WORD = re.compile(r'[a-z0-9]+')
+
+class PromptBudgeter:
+    """Fit prompt sections into per-section token budgets
+
+    Each section (sources, questions, links, products) gets a share of the budget
+    left after the fixed template. Items are ranked by keyword relevance and
+    sources are filled with their key sentences ranked at ingest. Budget unused
+    by the smaller sections rolls over to sources.
+    """
+
+    def __init__(
+        self,
+        count_tokens: Callable[[str], int],
+        total_budget: int,
+        shares: Dict[str, float]
+    ):
+        self.count_tokens = count_tokens
+        self.total_budget = total_budget
+        self.shares = shares
+        self.usage: Dict[str, int] = {}
+
+    @staticmethod
+    def _terms(text: str) -> set:
+        return set(WORD.findall(text.lower()))
+
+    def _relevance(self, text: str, keyword_terms: set) -> float:
+        """Score text by keyword term coverage and density"""
+        terms = WORD.findall(text.lower())
+        if not terms or not keyword_terms:
+            return 0.0
+        hits = sum(1 for term in terms if term in keyword_terms)
+        coverage = len(keyword_terms & set(terms)) / len(keyword_terms)
+        return coverage + hits / len(terms)
+
+    def section_budgets(self, fixed_tokens: int) -> Dict[str, int]:
+        """Split the budget left after the fixed template between sections"""
+        available = max(self.total_budget - fixed_tokens, 0)
+        return {name: int(available * share) for name, share in self.shares.items()}
+
+    def fit_items(self, items: List[Dict], keyword: str, budget: int, fields: List[str]) -> List[Dict]:
+        """Keep the most relevant whole items that fit the budget, in original order"""
+        keyword_terms = self._terms(keyword)
+        ranked = sorted(
+            enumerate(items),
+            key=lambda pair: self._relevance(" ".join(str(pair[1].get(f, "")) for f in fields), keyword_terms),
+            reverse=True
+        )
+
+        chosen = []
+        used = 0
+        for index, item in ranked:
+            cost = self.count_tokens(" ".join(f"{k}: {v}" for k, v in item.items()))
+            if used + cost > budget:
+                continue
+            chosen.append((index, item))
+            used += cost
+
+        return [item for _, item in sorted(chosen, key=lambda pair: pair[0])]
+
+    def fit_key_sentences(self, sources: List[Dict], budget: int) -> List[Dict]:
+        """Fill the budget with each source's top-ranked key sentences
+
+        Sources carry ``key_sentences`` as (position, sentence) pairs, most
+        central first. Sources take turns by rank so each is represented;
+        chosen sentences are put back in page order.
+        """
+        if not sources:
+            return []
+
+        # Reserve room for each source's title and url
+        header_cost = sum(self.count_tokens(f"{s.get('title', '')} {s.get('url', '')}") for s in sources)
+        remaining = budget - header_cost
+
+        selected = {i: [] for i in range(len(sources))}
+        depth = max((len(s.get("key_sentences", [])) for s in sources), default=0)
+        for rank in range(depth):
+            for source_index, source in enumerate(sources):
+                ranked = source.get("key_sentences", [])
+                if rank >= len(ranked):
+                    continue
+                position, sentence = ranked[rank]
+                cost = self.count_tokens(sentence)
+                if cost <= remaining:
+                    selected[source_index].append((position, sentence))
+                    remaining -= cost
+
+        return [{
+            "url": source.get("url", ""),
+            "title": source.get("title", ""),
+            "content": " ".join(text for _, text in sorted(selected[i]))
+        } for i, source in enumerate(sources)]
+
+    def record(self, section: str, text: str) -> str:
+        """Record the token count of a rendered section"""
+        self.usage[section] = self.count_tokens(text)
+        return text
+
+    def log_usage(self, keyword: str, total_prompt: Optional[str] = None):
+        """Log final token counts per section"""
+        if total_prompt is not None:
+            self.usage["total"] = self.count_tokens(total_prompt)
+        counts = ", ".join(f"{name}={tokens}" for name, tokens in self.usage.items())
+        logger.info(f"Prompt tokens for '{keyword}' (budget {self.total_budget}): {counts}")
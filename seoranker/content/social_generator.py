@@ -1,22 +1,81 @@
-from typing import Dict
+import asyncio
+import contextvars
+import json
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from seoranker.config.settings import SOCIAL_WORKERS, SOCIAL_COMBINED_GENERATION, SOCIAL_PLATFORMS
 from seoranker.config.model_config import ModelConfig, TaskType
+from seoranker.config.brand_config import SocialMediaVoice
 from seoranker.llm.model_factory import ModelFactory
 from seoranker.utils.logger import setup_logger
+from seoranker.utils.tracing import span
+from seoranker.llm.metering import usage_context
 
 logger = setup_logger(__name__)
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _social_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all synchronous social generations"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=SOCIAL_WORKERS, thread_name_prefix="social")
+        return _executor
+
+# Character limits checked on combined output before accepting a field
+PLATFORM_LIMITS = {"linkedin": 1300, "twitter": 280, "instagram": 2200}
+DEFAULT_PLATFORM_LIMIT = 2200  # For platforms in SOCIAL_PLATFORMS without their own limit
+
+class SocialFuture:
+    """Social versions being generated in the background by ``submit_all``
+    
+    ``combined`` is the pending single-call result; platforms it fails to
+    produce are generated with per-platform calls when ``result`` is read.
+    """
+    
+    def __init__(self, generator: "SocialGenerator", blog_content: Dict,
+                 futures: Dict[str, Future], combined: Optional[Future] = None):
+        self.generator = generator
+        self.blog_content = blog_content
+        self.futures = futures
+        self.combined = combined
+    
+    def result(self, timeout: Optional[float] = None) -> Dict:
+        """Wait for every platform and return its content"""
+        content = {}
+        if self.combined is not None:
+            content = self.combined.result(timeout)
+            missing = [p for p in SOCIAL_PLATFORMS if p not in content and p not in self.futures]
+            self.futures.update({
+                platform: self.generator._submit_platform(platform, self.blog_content)
+                for platform in missing
+            })
+        content.update({platform: future.result(timeout) for platform, future in self.futures.items()})
+        return content
+    
+    def cancel(self):
+        """Drop platform calls still queued; calls already running finish unread"""
+        for future in [self.combined, *self.futures.values()]:
+            if future is not None:
+                future.cancel()
+
 class SocialGenerator:
     """Generate social media content from blog posts"""
     
-    def __init__(self):
-        config = ModelConfig()
+    def __init__(self, config: Optional[ModelConfig] = None):
+        config = config or ModelConfig()
         social_config = config.get_model_config(TaskType.SOCIAL)
         self.llm = ModelFactory.create_llm(social_config)
+        self.voice = SocialMediaVoice()
+        self.combined = SOCIAL_COMBINED_GENERATION
     
-    def generate_linkedin_post(self, blog_content: Dict) -> str:
-        """Generate LinkedIn post from blog content"""
-        try:
-            prompt = f"""
+    def _linkedin_prompt(self, blog_content: Dict) -> str:
+        """Build LinkedIn post prompt"""
+        return f"""
 Create a professional LinkedIn post about this blog post.
 
 Blog Details:
@@ -44,16 +103,10 @@ Example Format:
 [Link]
 [Hashtags]
 """
-            return self.llm.generate_content(prompt)
-            
-        except Exception as e:
-            logger.error(f"Error generating LinkedIn post: {str(e)}")
-            return ""
     
-    def generate_twitter_thread(self, blog_content: Dict) -> str:
-        """Generate Twitter thread from blog content"""
-        try:
-            prompt = f"""
+    def _twitter_prompt(self, blog_content: Dict) -> str:
+        """Build Twitter thread prompt"""
+        return f"""
 Create an engaging Twitter thread about this blog post.
 
 Blog Details:
@@ -82,31 +135,225 @@ Example Structure:
 [4/5] Expert Tip/Benefit
 [5/5] CTA + Link
 """
-            return self.llm.generate_content(prompt)
+    
+    def _instagram_prompt(self, blog_content: Dict) -> str:
+        """Build Instagram caption prompt"""
+        return f"""
+Create an Instagram caption about this blog post.
+
+Blog Details:
+- Title: {blog_content['title']}
+- Topic: {blog_content['meta_description']}
+
+Brand Voice:
+- {self.voice.instagram}
+- Premium positioning
+- Sensory, lifestyle-focused language
+
+Requirements:
+- 2-3 short paragraphs with line breaks
+- Open with a hook in the first line
+- 5-10 relevant hashtags at the end (e.g., #PremiumCoffee #BestiaBrisk)
+- Mention "link in bio" instead of a URL
+- Max 2200 characters
+"""
+    
+    def _combined_prompt(self, blog_content: Dict) -> str:
+        """Build one prompt asking for every platform as a JSON object"""
+        return f"""
+Create social media posts for every platform below about this blog post.
+
+Blog Details:
+- Title: {blog_content['title']}
+- Topic: {blog_content['meta_description']}
+
+Brand Voice:
+- Premium quality and luxury experience
+- Target audience: Ambitious professionals and coffee enthusiasts
+- Highlight Bestia Brisk's unique value proposition
+
+Platforms:
+- linkedin ({self.voice.linkedin}): 1-2 engaging paragraphs, 2-3 hashtags, link to blog,
+  clear call-to-action, max 1300 characters
+- twitter ({self.voice.twitter}): thread of 5-7 tweets, each max 280 characters and starting
+  with its number as [1/5], hashtags, link to blog in the last tweet, strong call-to-action
+- instagram ({self.voice.instagram}): caption of 2-3 short paragraphs, hook in the first line,
+  5-10 hashtags at the end, say "link in bio" instead of a URL, max 2200 characters
+
+Return only a JSON object matching this schema, with no other text:
+{{
+    "linkedin": "string",
+    "twitter": ["string", "..."],
+    "instagram": "string"
+}}
+"""
+    
+    def _platform_prompt(self, platform: str, blog_content: Dict) -> str:
+        prompts = {
+            "linkedin": self._linkedin_prompt,
+            "twitter": self._twitter_prompt,
+            "instagram": self._instagram_prompt
+        }
+        return prompts[platform](blog_content)
+    
+    @staticmethod
+    def _parse_field(platform: str, value) -> Optional[str]:
+        """Validate one platform's field from combined output"""
+        limit = PLATFORM_LIMITS.get(platform, DEFAULT_PLATFORM_LIMIT)
+        if platform == "twitter":
+            if not isinstance(value, list) or not value:
+                return None
+            tweets = [t.strip() for t in value if isinstance(t, str) and t.strip()]
+            if len(tweets) != len(value) or any(len(t) > limit for t in tweets):
+                return None
+            return "\n\n".join(tweets)
+        if not isinstance(value, str) or not value.strip() or len(value) > limit:
+            return None
+        return value.strip()
+    
+    def _parse_combined(self, response: str) -> Dict:
+        """Parse combined output into the platforms whose fields are valid"""
+        # Tolerate code fences or stray text around the object
+        match = re.search(r"\{.*\}", response or "", re.DOTALL)
+        try:
+            data = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            logger.warning("Combined social output was not a JSON object; using per-platform calls")
+            return {}
+        
+        content = {}
+        for platform in SOCIAL_PLATFORMS:
+            value = self._parse_field(platform, data.get(platform))
+            if value is None:
+                logger.warning(f"Combined social output has no valid {platform} field; regenerating it")
+            else:
+                content[platform] = value
+        return content
+    
+    def _generate_platform(self, platform: str, blog_content: Dict) -> str:
+        """Generate one platform's post with its own prompt"""
+        try:
+            prompt = self._platform_prompt(platform, blog_content)
+            with span("llm.social", platform=platform, model=self.llm.get_model_name()) as call, \
+                    usage_context(task=TaskType.SOCIAL.value):
+                content = self.llm.generate_content(prompt)
+                call.add_bytes(sent=prompt, received=content)
+            return content
             
         except Exception as e:
-            logger.error(f"Error generating Twitter thread: {str(e)}")
+            logger.error(f"Error generating {platform} post: {str(e)}")
             return ""
     
+    async def _agenerate_platform(self, platform: str, blog_content: Dict) -> str:
+        """Generate one platform's post with its own prompt asynchronously"""
+        try:
+            prompt = self._platform_prompt(platform, blog_content)
+            with span("llm.social", platform=platform, model=self.llm.get_model_name()) as call, \
+                    usage_context(task=TaskType.SOCIAL.value):
+                content = await self.llm.agenerate_content(prompt)
+                call.add_bytes(sent=prompt, received=content)
+            return content
+            
+        except Exception as e:
+            logger.error(f"Error generating {platform} post: {str(e)}")
+            return ""
+    
+    def generate_combined(self, blog_content: Dict) -> Dict:
+        """Generate every platform in one call; returns only fields that parsed"""
+        try:
+            prompt = self._combined_prompt(blog_content)
+            with span("llm.social", platform="combined", model=self.llm.get_model_name()) as call, \
+                    usage_context(task=TaskType.SOCIAL.value):
+                response = self.llm.generate_content(prompt)
+                call.add_bytes(sent=prompt, received=response)
+            return self._parse_combined(response)
+            
+        except Exception as e:
+            logger.error(f"Error generating combined social content: {str(e)}")
+            return {}
+    
+    async def agenerate_combined(self, blog_content: Dict) -> Dict:
+        """Generate every platform in one call asynchronously; returns only fields that parsed"""
+        try:
+            prompt = self._combined_prompt(blog_content)
+            with span("llm.social", platform="combined", model=self.llm.get_model_name()) as call, \
+                    usage_context(task=TaskType.SOCIAL.value):
+                response = await self.llm.agenerate_content(prompt)
+                call.add_bytes(sent=prompt, received=response)
+            return self._parse_combined(response)
+            
+        except Exception as e:
+            logger.error(f"Error generating combined social content: {str(e)}")
+            return {}
+    
+    def generate_linkedin_post(self, blog_content: Dict) -> str:
+        """Generate LinkedIn post from blog content"""
+        return self._generate_platform("linkedin", blog_content)
+    
+    def generate_twitter_thread(self, blog_content: Dict) -> str:
+        """Generate Twitter thread from blog content"""
+        return self._generate_platform("twitter", blog_content)
+    
+    def generate_instagram_caption(self, blog_content: Dict) -> str:
+        """Generate Instagram caption from blog content"""
+        return self._generate_platform("instagram", blog_content)
+    
+    async def agenerate_linkedin_post(self, blog_content: Dict) -> str:
+        """Generate LinkedIn post from blog content asynchronously"""
+        return await self._agenerate_platform("linkedin", blog_content)
+    
+    async def agenerate_twitter_thread(self, blog_content: Dict) -> str:
+        """Generate Twitter thread from blog content asynchronously"""
+        return await self._agenerate_platform("twitter", blog_content)
+    
+    def _submit(self, func: Callable, *args) -> Future:
+        # Each call gets its own context copy so spans and usage tags follow it
+        context = contextvars.copy_context()
+        return _social_executor().submit(context.run, func, *args)
+    
+    def _submit_platform(self, platform: str, blog_content: Dict) -> Future:
+        return self._submit(self._generate_platform, platform, blog_content)
+    
+    def submit_all(self, blog_content: Dict) -> SocialFuture:
+        """Start generating every platform in the background
+        
+        Only the title and meta description are needed, so callers can start
+        this as soon as metadata is known and collect the result later. In
+        combined mode one call covers all platforms; otherwise each platform
+        runs concurrently.
+        """
+        logger.debug(f"Starting social media content for: {blog_content['title']}")
+        if self.combined:
+            return SocialFuture(self, blog_content, {}, self._submit(self.generate_combined, blog_content))
+        return SocialFuture(self, blog_content, {
+            platform: self._submit_platform(platform, blog_content) for platform in SOCIAL_PLATFORMS
+        })
+    
     def generate_all(self, blog_content: Dict) -> Dict:
         """Generate all social media versions"""
         try:
             logger.debug("\nGenerating social media content:")
             logger.debug(f"- Blog title: {blog_content['title']}")
+            return self.submit_all(blog_content).result()
             
-            # Generate LinkedIn post
-            logger.debug("Generating LinkedIn post...")
-            linkedin_content = self.generate_linkedin_post(blog_content)
-            
-            # Generate Twitter thread
-            logger.debug("Generating Twitter thread...")
-            twitter_content = self.generate_twitter_thread(blog_content)
+        except Exception as e:
+            logger.error(f"Error generating social content: {str(e)}")
+            return {}
+    
+    async def agenerate_all(self, blog_content: Dict) -> Dict:
+        """Generate all social media versions without blocking the event loop"""
+        try:
+            logger.debug("\nGenerating social media content (async):")
+            logger.debug(f"- Blog title: {blog_content['title']}")
             
-            return {
-                "linkedin": linkedin_content,
-                "twitter": twitter_content
-            }
+            content = await self.agenerate_combined(blog_content) if self.combined else {}
+            missing = [p for p in SOCIAL_PLATFORMS if p not in content]
+            results = await asyncio.gather(*(self._agenerate_platform(p, blog_content) for p in missing))
+            content.update(zip(missing, results))
+            return content
             
         except Exception as e:
             logger.error(f"Error generating social content: {str(e)}")
-            return {} 
\ No newline at end of file
+            return {}
@@ -0,0 +1,153 @@
+import re
+from typing import Callable, Dict, Optional, TextIO
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Rough chars-per-token ratio used to bound the preamble before <metadata>
+CHARS_PER_TOKEN = 4
+
+class MalformedOutputError(ValueError):
+    """Raised when a streamed response does not follow the <metadata>/<content> structure"""
+    pass
+
+class BlogStreamParser:
+    """Incrementally parse <metadata> and <content> sections from a streamed response
+
+    Title and meta description are emitted through ``on_metadata`` as soon as
+    ``</metadata>`` closes, and body text is written to ``body_sink`` as it arrives.
+    """
+
+    METADATA_OPEN = "<metadata>"
+    METADATA_CLOSE = "</metadata>"
+    CONTENT_OPEN = "<content>"
+    CONTENT_CLOSE = "</content>"
+
+    def __init__(
+        self,
+        body_sink: Optional[TextIO] = None,
+        on_metadata: Optional[Callable[[Dict], None]] = None,
+        max_preamble_tokens: int = 200
+    ):
+        self.body_sink = body_sink
+        self.on_metadata = on_metadata
+        self.max_preamble_chars = max_preamble_tokens * CHARS_PER_TOKEN
+        self.metadata: Dict = {}
+        self._state = "preamble"  # preamble -> metadata -> between -> content -> done
+        self._buffer = ""
+        self._consumed = 0  # chars consumed while waiting for an opening tag
+        self._body_parts = []
+
+    @property
+    def done(self) -> bool:
+        """Whether </content> has been seen"""
+        return self._state == "done"
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of streamed text"""
+        if self.done or not chunk:
+            return
+
+        self._buffer += chunk
+        self._consumed += len(chunk)
+
+        # Each step either advances the state or waits for more text
+        while self._step():
+            pass
+
+    def _step(self) -> bool:
+        if self._state == "preamble":
+            return self._wait_for(self.METADATA_OPEN, "metadata", "No <metadata> section")
+
+        if self._state == "metadata":
+            end = self._buffer.find(self.METADATA_CLOSE)
+            if end == -1:
+                return False
+            self._parse_metadata(self._buffer[:end])
+            self._buffer = self._buffer[end + len(self.METADATA_CLOSE):]
+            self._consumed = len(self._buffer)
+            self._state = "between"
+            return True
+
+        if self._state == "between":
+            return self._wait_for(self.CONTENT_OPEN, "content", "No <content> section")
+
+        if self._state == "content":
+            end = self._buffer.find(self.CONTENT_CLOSE)
+            if end != -1:
+                self._write_body(self._buffer[:end])
+                self._buffer = ""
+                self._state = "done"
+                return False
+
+            # Hold back enough text to catch a closing tag split across chunks
+            safe = len(self._buffer) - (len(self.CONTENT_CLOSE) - 1)
+            if safe > 0:
+                self._write_body(self._buffer[:safe])
+                self._buffer = self._buffer[safe:]
+            return False
+
+        return False
+
+    def _wait_for(self, tag: str, next_state: str, error: str) -> bool:
+        """Skip text until ``tag`` opens, aborting if it takes too long"""
+        start = self._buffer.find(tag)
+        if start != -1:
+            self._buffer = self._buffer[start + len(tag):]
+            if next_state == "content":
+                self._buffer = self._buffer.lstrip()
+            self._consumed = len(self._buffer)
+            self._state = next_state
+            return True
+
+        if self._consumed > self.max_preamble_chars:
+            raise MalformedOutputError(
+                f"{error} within the first {self.max_preamble_chars // CHARS_PER_TOKEN} tokens"
+            )
+
+        # Keep only a possible partial tag at the end of the buffer
+        self._buffer = self._buffer[-(len(tag) - 1):]
+        return False
+
+    def _parse_metadata(self, metadata_text: str) -> None:
+        title_match = re.search(r'title:\s*(.*?)(?:\n|$)', metadata_text)
+        meta_desc_match = re.search(r'meta_description:\s*(.*?)(?:\n|$)', metadata_text)
+
+        self.metadata = {
+            "title": title_match.group(1).strip() if title_match else "",
+            "meta_description": meta_desc_match.group(1).strip() if meta_desc_match else ""
+        }
+        logger.debug(f"Streamed metadata ready: {self.metadata['title']}")
+
+        if self.on_metadata:
+            self.on_metadata(dict(self.metadata))
+
+    def _write_body(self, text: str) -> None:
+        if not text:
+            return
+        self._body_parts.append(text)
+        if self.body_sink:
+            self.body_sink.write(text)
+            self.body_sink.flush()
+
+    @property
+    def streamed_body(self) -> str:
+        """Body text written to ``body_sink`` so far, before final cleanup"""
+        return "".join(self._body_parts)
+
+    def close(self) -> Dict:
+        """Finish parsing and return metadata in the same shape as ``_extract_metadata``"""
+        if self._state in ("preamble", "metadata"):
+            raise MalformedOutputError("No metadata section found")
+        if self._state != "done":
+            raise MalformedOutputError("No content section found")
+
+        blog_content = "".join(self._body_parts).strip()
+
+        # Remove any suggested image placements appended inside the content
+        blog_content = blog_content.split('Suggested Image Placements')[0].strip()
+
+        return {
+            **self.metadata,
+            "blog_content": blog_content
+        }
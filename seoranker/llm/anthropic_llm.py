@@ -1,6 +1,10 @@
-from anthropic import Anthropic
-from seoranker.llm.base import BaseLLM
+import logging
+import time
+from types import SimpleNamespace
+from typing import Dict, Iterator, Optional, Tuple
+from seoranker.llm.base import BaseLLM, PrefixedPrompt
 from seoranker.config.settings import ANTHROPIC_API_KEY
+from seoranker.config.model_config import ModelProvider
 from seoranker.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -8,66 +12,199 @@ logger = setup_logger(__name__)
 class AnthropicLLM(BaseLLM):
     """Anthropic LLM implementation"""
     
+    provider = ModelProvider.ANTHROPIC.value
+    chars_per_token = 3.5  # Claude tokenizer averages ~3.5 chars/token on English prose
+    
     def __init__(self):
-        self.client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        self._client = None
+        self._async_client = None
         self.model = "claude-3-sonnet-20240229"
         self._max_tokens_limit = 4096  # Claude-3-Sonnet's actual limit
     
+    @property
+    def client(self):
+        """Sync client, created (and the SDK imported) on first use"""
+        if self._client is None:
+            from anthropic import Anthropic
+            self._client = Anthropic(api_key=ANTHROPIC_API_KEY)
+        return self._client
+    
+    @property
+    def async_client(self):
+        """Async client, created (and the SDK imported) on first use"""
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+        return self._async_client
+    
+    def _message_content(self, prompt: str):
+        """Build user message content, marking a static prefix for prompt caching"""
+        if not (isinstance(prompt, PrefixedPrompt) and prompt.prefix):
+            return prompt
+        
+        # The static prefix forms the cached block; the text sent is
+        # identical to the unsplit prompt
+        return [
+            {
+                "type": "text",
+                "text": prompt.prefix,
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": prompt.suffix
+            }
+        ]
+    
+    def _report_usage(self, usage, latency: float = 0.0, batch: bool = False, keyword: Optional[str] = None):
+        """Log and meter token usage, including prompt cache writes and reads"""
+        if usage is None:
+            return
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        logger.info(
+            f"Claude usage: input={usage.input_tokens} output={usage.output_tokens} "
+            f"cache_write={cache_write} cache_read={cache_read}"
+        )
+        self._record_usage(
+            usage.input_tokens,
+            usage.output_tokens,
+            cache_write_tokens=cache_write,
+            cache_read_tokens=cache_read,
+            latency=latency,
+            batch=batch,
+            keyword=keyword
+        )
+    
+    def _request_kwargs(self, prompt: str, max_tokens: int = None) -> Dict:
+        """Build message arguments shared by sync, async and streaming calls"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n=== Claude Prompt ===\nLength: %d\nFirst 500 chars:\n%s\n=================", len(prompt), prompt[:500])
+        
+        # Calculate tokens
+        response_tokens = 2500  # Reserve tokens for response
+        if not max_tokens or max_tokens > response_tokens:
+            max_tokens = response_tokens
+        
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+            "messages": [{
+                "role": "user",
+                "content": self._message_content(prompt)
+            }]
+        }
+    
     def generate_content(self, prompt: str, max_tokens: int = None) -> str:
         try:
-            structured_prompt = f"""
-You are a professional blog writer. Generate content exactly following this structure:
-
-<metadata>
-title: [Blog post title]
-meta_description: [155 character meta description]
-</metadata>
-
-<content>
-[Full HTML blog post content]
-</content>
-
-Requirements:
-1. Respond ONLY with the above structure (no suggestions or additional sections)
-2. Use proper HTML tags (<h1>, <h2>, <h3>, <p>, <ul>, <li>)
-3. Include exactly one <h1> tag
-4. Include 2-3 <h2> tags
-5. Format all links as <a href="url" target="_blank">text</a>
-6. Ensure content is at least 2100 words
-
-Original Prompt:
-{prompt}
-"""
-            logger.debug(f"\n=== Claude Prompt ===\nLength: {len(structured_prompt)}\nFirst 500 chars:\n{structured_prompt[:500]}\n=================")
-            
-            # Calculate tokens
-            response_tokens = 2500  # Reserve tokens for response
-            if not max_tokens or max_tokens > response_tokens:
-                max_tokens = response_tokens
-                
             # Make API call
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                temperature=0.7,
-                messages=[{
-                    "role": "user",
-                    "content": structured_prompt
-                }]
-            )
+            start = time.monotonic()
+            response = self.client.messages.create(**self._request_kwargs(prompt, max_tokens))
+            self._report_usage(response.usage, time.monotonic() - start)
             
             result = response.content[0].text
-            logger.debug(f"\n=== Claude Response ===\nLength: {len(result)}\nFirst 500 chars:\n{result[:500]}\n=================")
+            logger.debug("\n=== Claude Response ===\nLength: %d\nFirst 500 chars:\n%s\n=================", len(result), result[:500])
             return result
             
         except Exception as e:
             logger.error(f"Error generating content with {self.model}: {str(e)}")
             raise
     
+    async def _agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        try:
+            start = time.monotonic()
+            response = await self.async_client.messages.create(**self._request_kwargs(prompt, max_tokens))
+            self._report_usage(response.usage, time.monotonic() - start)
+            return response.content[0].text
+            
+        except Exception as e:
+            logger.error(f"Error generating content with {self.model}: {str(e)}")
+            raise
+    
+    def stream_content(self, prompt: str, max_tokens: int = None) -> Iterator[str]:
+        try:
+            # Leaving the context manager early closes the connection
+            start = time.monotonic()
+            with self.client.messages.stream(**self._request_kwargs(prompt, max_tokens)) as stream:
+                chunks = []
+                usage = None
+                try:
+                    for text in stream.text_stream:
+                        chunks.append(text)
+                        yield text
+                    usage = stream.get_final_message().usage
+                finally:
+                    # Consumers close the stream once they have what they need,
+                    # so usage is reported from what arrived before that
+                    if usage is None:
+                        usage = self._partial_usage(stream, "".join(chunks))
+                    if usage is not None:
+                        self._report_usage(usage, time.monotonic() - start)
+                    else:
+                        self._record_partial_stream(prompt, "".join(chunks), time.monotonic() - start)
+                    
+        except Exception as e:
+            logger.error(f"Error streaming content with {self.model}: {str(e)}")
+            raise
+    
+    def _partial_usage(self, stream, streamed: str):
+        """Usage of a stream closed early: input counts from message_start, output estimated"""
+        snapshot = getattr(stream, "current_message_snapshot", None)
+        usage = getattr(snapshot, "usage", None)
+        if usage is None:
+            return None
+        return SimpleNamespace(
+            input_tokens=usage.input_tokens,
+            output_tokens=max(usage.output_tokens or 0, self.count_tokens(streamed)),
+            cache_creation_input_tokens=getattr(usage, "cache_creation_input_tokens", 0),
+            cache_read_input_tokens=getattr(usage, "cache_read_input_tokens", 0)
+        )
+    
+    def submit_batch(self, prompts: Dict[str, str], max_tokens: int = None) -> Dict:
+        """Submit prompts through the Message Batches API"""
+        try:
+            batch = self.client.messages.batches.create(
+                requests=[{
+                    "custom_id": custom_id,
+                    "params": self._request_kwargs(prompt, max_tokens)
+                } for custom_id, prompt in prompts.items()]
+            )
+            logger.info(f"Submitted message batch {batch.id} with {len(prompts)} requests")
+            
+            return {
+                "id": batch.id,
+                "mode": "anthropic"
+            }
+            
+        except Exception as e:
+            logger.error(f"Error submitting message batch: {str(e)}")
+            raise
+    
+    def get_batch_status(self, batch: Dict) -> str:
+        # processing_status is one of in_progress, canceling or ended
+        status = self.client.messages.batches.retrieve(batch["id"]).processing_status
+        return "ended" if status == "ended" else "in_progress"
+    
+    def iter_batch_results(self, batch: Dict) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        for entry in self.client.messages.batches.results(batch["id"]):
+            if entry.result.type == "succeeded":
+                self._report_usage(
+                    entry.result.message.usage,
+                    batch=True,
+                    keyword=batch.get("keywords", {}).get(entry.custom_id)
+                )
+                yield entry.custom_id, entry.result.message.content[0].text, None
+            elif entry.result.type == "errored":
+                yield entry.custom_id, None, str(entry.result.error)
+            else:
+                # canceled or expired
+                yield entry.custom_id, None, f"Request {entry.result.type}"
+    
     def get_model_name(self) -> str:
         return self.model
         
     @property
     def max_tokens_limit(self) -> int:
         """Get model's maximum token limit"""
-        return self._max_tokens_limit 
\ No newline at end of file
+        return self._max_tokens_limit 
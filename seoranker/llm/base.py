@@ -1,17 +1,143 @@
+import asyncio
+import uuid
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
+from seoranker.llm.concurrency import provider_slot
+from seoranker.llm.metering import usage_meter, usage_context
 from seoranker.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class PrefixedPrompt(str):
+    """Prompt split into a static, cacheable prefix and a per-call suffix
+    
+    Behaves as the full prompt string everywhere; providers that support
+    prompt caching use ``prefix`` and ``suffix`` to lay out the request.
+    """
+    
+    def __new__(cls, prefix: str, suffix: str):
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix = prefix
+        prompt.suffix = suffix
+        return prompt
+    
+    def __getnewargs__(self):
+        return (self.prefix, self.suffix)
+
+class StreamComplete(GeneratorExit):
+    """Thrown into a stream by a consumer that has all the output it needs"""
+    pass
+
+def finish_stream(stream: Iterator[str]):
+    """Close a stream whose output was accepted, so it counts as a successful call
+    
+    Plain ``close()`` means the consumer abandoned the output.
+    """
+    try:
+        stream.throw(StreamComplete())
+    except (StopIteration, StreamComplete):
+        pass
+
 class BaseLLM(ABC):
     """Base class for LLM implementations"""
     
+    provider: str = "default"  # Key into LLM_CONCURRENCY
+    chars_per_token: float = 4.0  # Tokenizer density used by count_tokens
+    
     @abstractmethod
     def generate_content(self, prompt: str, max_tokens: int = None) -> str:
         """Generate content from prompt"""
         pass
     
+    def _record_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        latency: float = 0.0,
+        batch: bool = False,
+        keyword: Optional[str] = None
+    ):
+        """Add a call's token counts and latency to the shared usage meter"""
+        usage_meter.record(
+            provider=self.provider,
+            model=self.get_model_name(),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_write_tokens=cache_write_tokens,
+            cache_read_tokens=cache_read_tokens,
+            latency=latency,
+            batch=batch,
+            keyword=keyword
+        )
+    
+    def _record_partial_stream(self, prompt: str, streamed: str, latency: float = 0.0):
+        """Meter a stream that ended before the provider reported usage, from estimated counts"""
+        input_tokens = self.count_tokens(prompt)
+        output_tokens = self.count_tokens(streamed)
+        logger.info(
+            f"{self.provider} stream ended without usage; estimated input={input_tokens} output={output_tokens}"
+        )
+        self._record_usage(input_tokens, output_tokens, latency=latency)
+    
+    def count_tokens(self, text: str) -> int:
+        """Estimate the number of tokens text uses with this provider's tokenizer"""
+        if not text:
+            return 0
+        return int(len(text) / self.chars_per_token) + 1
+    
+    async def agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        """Generate content from prompt without blocking the event loop
+        
+        Calls are limited by the provider's shared concurrency semaphore and
+        request-rate limit.
+        """
+        async with provider_slot(self.provider):
+            return await self._agenerate_content(prompt, max_tokens)
+    
+    async def _agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        """Provider async call; defaults to running the sync client in a thread"""
+        return await asyncio.to_thread(self.generate_content, prompt, max_tokens)
+    
+    def stream_content(self, prompt: str, max_tokens: int = None) -> Iterator[str]:
+        """Generate content from prompt, yielding text chunks as they arrive
+        
+        Providers without native streaming yield the whole response as one chunk.
+        Closing the iterator early stops the underlying request. Consumers
+        finish accepted output with ``finish_stream`` and throw an exception
+        into the iterator to report the output as unusable.
+        """
+        yield self.generate_content(prompt, max_tokens)
+    
+    def submit_batch(self, prompts: Dict[str, str], max_tokens: int = None) -> Dict:
+        """Submit prompts keyed by custom id for offline generation
+        
+        Returns a JSON-serializable batch record that can be persisted and passed
+        back to ``get_batch_status``/``iter_batch_results`` by a later process.
+        The default is a sequential fallback that generates on collection.
+        """
+        return {
+            "id": f"sequential-{uuid.uuid4().hex[:12]}",
+            "mode": "sequential",
+            "prompts": prompts,
+            "max_tokens": max_tokens
+        }
+    
+    def get_batch_status(self, batch: Dict) -> str:
+        """Get batch processing status ("in_progress" or "ended")"""
+        return "ended"
+    
+    def iter_batch_results(self, batch: Dict) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Yield (custom_id, text, error) for each request in the batch as it is available"""
+        for custom_id, prompt in batch.get("prompts", {}).items():
+            try:
+                with usage_context(keyword=batch.get("keywords", {}).get(custom_id)):
+                    text = self.generate_content(prompt, batch.get("max_tokens"))
+                yield custom_id, text, None
+            except Exception as e:
+                yield custom_id, None, str(e)
+    
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the model name"""
@@ -26,4 +152,4 @@ class BaseLLM(ABC):
     def handle_error(self, error: Exception) -> Optional[str]:
         """Handle model-specific errors"""
         logger.error(f"Error in {self.get_model_name()}: {str(error)}")
-        return None 
\ No newline at end of file
+        return None 
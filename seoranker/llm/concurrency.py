@@ -0,0 +1,57 @@
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from seoranker.config.settings import LLM_CONCURRENCY, LLM_RATE_LIMITS
+
+# asyncio primitives are bound to a loop, so keep one set of semaphores per loop
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+_rate_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, RateLimiter]]" = weakref.WeakKeyDictionary()
+
+class RateLimiter:
+    """Space request starts so no more than ``per_minute`` begin each minute"""
+    
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for the next free start slot"""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+def provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Get the shared semaphore limiting in-flight requests for a provider"""
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+    
+    if provider not in semaphores:
+        semaphores[provider] = asyncio.Semaphore(LLM_CONCURRENCY.get(provider, 1))
+    return semaphores[provider]
+
+def provider_rate_limiter(provider: str) -> Optional[RateLimiter]:
+    """Get the shared request-rate limiter for a provider, or None if unlimited"""
+    per_minute = LLM_RATE_LIMITS.get(provider)
+    if not per_minute:
+        return None
+    
+    loop = asyncio.get_running_loop()
+    limiters = _rate_limiters.setdefault(loop, {})
+    if provider not in limiters:
+        limiters[provider] = RateLimiter(per_minute)
+    return limiters[provider]
+
+@asynccontextmanager
+async def provider_slot(provider: str) -> AsyncIterator[None]:
+    """Hold one of the provider's concurrency slots, started within its rate limit"""
+    async with provider_semaphore(provider):
+        limiter = provider_rate_limiter(provider)
+        if limiter:
+            await limiter.acquire()
+        yield
@@ -1,38 +1,84 @@
-from groq import Groq
+import time
+from typing import Dict, Iterator
 from seoranker.llm.base import BaseLLM
 from seoranker.config.settings import GROQ_API_KEY
-from seoranker.utils.logger import setup_logger
+from seoranker.config.model_config import ModelProvider
+from seoranker.utils.logger import setup_logger, LogPayload
 
 logger = setup_logger(__name__)
 
 class GroqLLM(BaseLLM):
     """Groq LLM implementation"""
     
+    provider = ModelProvider.GROQ.value
+    chars_per_token = 3.7  # Mixtral (Llama tokenizer) averages ~3.7 chars/token
+    
     def __init__(self):
-        self.client = Groq(api_key=GROQ_API_KEY)
+        self._client = None
+        self._async_client = None
         self.model = "mixtral-8x7b-32768"
         self._max_tokens_limit = 32768  # Mixtral limit
     
-    def generate_content(self, prompt: str, max_tokens: int = None) -> str:
-        # Debug prompt
-        logger.debug(f"\n=== Groq Prompt ===\nLength: {len(prompt)}\nPrompt:\n{prompt}\n=================")
-        
+    @property
+    def client(self):
+        """Sync client, created (and the SDK imported) on first use"""
+        if self._client is None:
+            from groq import Groq
+            self._client = Groq(api_key=GROQ_API_KEY)
+        return self._client
+    
+    @property
+    def async_client(self):
+        """Async client, created (and the SDK imported) on first use"""
+        if self._async_client is None:
+            from groq import AsyncGroq
+            self._async_client = AsyncGroq(api_key=GROQ_API_KEY)
+        return self._async_client
+    
+    def _request_kwargs(self, prompt: str, max_tokens: int = None) -> Dict:
+        """Build chat completion arguments shared by sync, async and streaming calls"""
         # If max_tokens not specified or exceeds limit, use model's limit
         if not max_tokens or max_tokens > self._max_tokens_limit:
             max_tokens = self._max_tokens_limit
             
         logger.debug(f"Generating with {self.model}, max_tokens={max_tokens}")
         
+        return {
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }],
+            "model": self.model,
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+    
+    def _report_usage(self, usage, latency: float = 0.0):
+        """Log and meter token usage, including prompt tokens served from Groq's prompt cache"""
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) if details else 0) or 0
+        logger.info(
+            f"Groq usage: input={usage.prompt_tokens} output={usage.completion_tokens} "
+            f"cache_read={cached}"
+        )
+        # prompt_tokens includes cached tokens; meter them separately
+        self._record_usage(
+            usage.prompt_tokens - cached,
+            usage.completion_tokens,
+            cache_read_tokens=cached,
+            latency=latency
+        )
+    
+    def generate_content(self, prompt: str, max_tokens: int = None) -> str:
+        # Debug prompt
+        logger.debug("\n=== Groq Prompt ===\nLength: %d\nPrompt:\n%s\n=================", len(prompt), LogPayload(prompt))
+        
         try:
-            response = self.client.chat.completions.create(
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }],
-                model=self.model,
-                temperature=0.7,
-                max_tokens=max_tokens
-            )
+            start = time.monotonic()
+            response = self.client.chat.completions.create(**self._request_kwargs(prompt, max_tokens))
+            self._report_usage(response.usage, time.monotonic() - start)
             
             result = response.choices[0].message.content
             logger.debug(f"\n=== Groq Response ===\nLength: {len(result)}\nFirst 100 chars: {result[:100]}\n=================")
@@ -42,10 +88,59 @@ class GroqLLM(BaseLLM):
             logger.error(f"Groq API Error: {str(e)}")
             raise
     
+    async def _agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        logger.debug(f"\n=== Groq Async Prompt ===\nLength: {len(prompt)}\n=================")
+        
+        try:
+            start = time.monotonic()
+            response = await self.async_client.chat.completions.create(**self._request_kwargs(prompt, max_tokens))
+            self._report_usage(response.usage, time.monotonic() - start)
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            logger.error(f"Groq API Async Error: {str(e)}")
+            raise
+    
+    def stream_content(self, prompt: str, max_tokens: int = None) -> Iterator[str]:
+        logger.debug(f"\n=== Groq Stream Prompt ===\nLength: {len(prompt)}\n=================")
+        
+        response = None
+        chunks = []
+        reported = False
+        try:
+            start = time.monotonic()
+            response = self.client.chat.completions.create(
+                **self._request_kwargs(prompt, max_tokens),
+                stream=True
+            )
+            
+            for chunk in response:
+                # Groq sends usage on the final chunk under x_groq
+                usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+                if usage:
+                    self._report_usage(usage, time.monotonic() - start)
+                    reported = True
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+                    
+        except Exception as e:
+            logger.error(f"Groq API Stream Error: {str(e)}")
+            raise
+        finally:
+            # Stop the stream if the consumer bailed out early
+            if response is not None:
+                response.close()
+                if not reported:
+                    self._record_partial_stream(prompt, "".join(chunks), time.monotonic() - start)
+    
     def get_model_name(self) -> str:
         return self.model
         
     @property
     def max_tokens_limit(self) -> int:
         """Get model's maximum token limit"""
-        return self._max_tokens_limit 
\ No newline at end of file
+        return self._max_tokens_limit 
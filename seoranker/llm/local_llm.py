@@ -1,47 +1,330 @@
+import asyncio
+import json
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
 import requests
-from seoranker.llm.base import BaseLLM
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional
+from seoranker.llm.base import BaseLLM, PrefixedPrompt
+from seoranker.config.model_config import ModelProvider
+from seoranker.config.settings import (
+    LOCAL_LLM_BASE_URLS,
+    LOCAL_LLM_CONNECT_TIMEOUT,
+    LOCAL_LLM_READ_TIMEOUT,
+    LOCAL_LLM_POOL_SIZE,
+    LOCAL_LLM_RETRY_AFTER
+)
 from seoranker.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+class NoLocalServerError(ConnectionError):
+    """Every configured local LLM server is unreachable"""
+    pass
+
 class LocalLLM(BaseLLM):
     """Local LLM implementation using OpenAI-compatible API"""
     
-    def __init__(self, model: str = "llama-3.2-3b-instruct"):
-        self.base_url = "http://localhost:1234/v1"
+    provider = ModelProvider.LOCAL.value
+    chars_per_token = 3.7  # Llama tokenizer averages ~3.7 chars/token
+    
+    def __init__(self, model: str = "llama-3.2-3b-instruct", base_urls: Optional[List[str]] = None):
+        self.base_urls = [url.rstrip("/") for url in (base_urls or LOCAL_LLM_BASE_URLS)]
+        self.base_url = self.base_urls[0]
         self.model = model
         self._max_tokens_limit = 4096  # Default, adjust based on model
+        self.timeout = (LOCAL_LLM_CONNECT_TIMEOUT, LOCAL_LLM_READ_TIMEOUT)
+        
+        self._session = None
+        self._async_client = None
+        self._async_client_loop = None
+        self._lock = threading.Lock()
+        self._in_flight = {url: 0 for url in self.base_urls}
+        self._down_until = {url: 0.0 for url in self.base_urls}
+        self._next = 0
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session shared by every call, created on first use"""
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(self.base_urls), pool_maxsize=LOCAL_LLM_POOL_SIZE)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+    
+    @property
+    def async_client(self):
+        """Keep-alive async client for the running event loop, created on first use
+        
+        httpx connections belong to the loop that opened them, so a new
+        client is made when a later batch runs on a new loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            import httpx
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(LOCAL_LLM_READ_TIMEOUT, connect=LOCAL_LLM_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=LOCAL_LLM_POOL_SIZE * len(self.base_urls),
+                    max_keepalive_connections=LOCAL_LLM_POOL_SIZE * len(self.base_urls)
+                )
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def health_check(self, base_url: str = None) -> bool:
+        """Probe a server's /models endpoint"""
+        base_url = base_url or self.base_url
+        try:
+            response = self.session.get(f"{base_url}/models", timeout=LOCAL_LLM_CONNECT_TIMEOUT)
+            healthy = response.status_code == 200
+        except requests.RequestException:
+            healthy = False
+        
+        with self._lock:
+            self._down_until[base_url] = 0.0 if healthy else time.monotonic() + LOCAL_LLM_RETRY_AFTER
+        return healthy
+    
+    def _lease_available(self) -> Optional[str]:
+        """Lease the reachable server with the fewest in-flight requests, if any"""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [url for url in self.base_urls if self._down_until[url] <= now]
+            if not candidates:
+                return None
+            # Rotate the starting point so ties are spread round-robin
+            self._next = (self._next + 1) % len(self.base_urls)
+            order = self.base_urls[self._next:] + self.base_urls[:self._next]
+            url = min((u for u in order if u in candidates), key=lambda u: self._in_flight[u])
+            self._in_flight[url] += 1
+            return url
+    
+    def _lease(self, url: str) -> str:
+        with self._lock:
+            self._in_flight[url] += 1
+        return url
+    
+    def _no_server_error(self) -> NoLocalServerError:
+        return NoLocalServerError(f"No local LLM server reachable: {', '.join(self.base_urls)}")
+    
+    def _pick_server(self) -> str:
+        """Pick the reachable server with the fewest in-flight requests"""
+        url = self._lease_available()
+        if url:
+            return url
+        
+        # Every server was marked down; re-probe before giving up
+        for url in self.base_urls:
+            if self.health_check(url):
+                return self._lease(url)
+        raise self._no_server_error()
+    
+    async def _apick_server(self) -> str:
+        """Async _pick_server; health probes run off the event loop"""
+        url = self._lease_available()
+        if url:
+            return url
+        
+        for url in self.base_urls:
+            if await asyncio.to_thread(self.health_check, url):
+                return self._lease(url)
+        raise self._no_server_error()
+    
+    def _mark_down(self, url: str):
+        logger.warning(f"Local LLM server unreachable, skipping for {LOCAL_LLM_RETRY_AFTER}s: {url}")
+        with self._lock:
+            self._down_until[url] = time.monotonic() + LOCAL_LLM_RETRY_AFTER
+    
+    def _release(self, url: str):
+        with self._lock:
+            self._in_flight[url] -= 1
+    
+    @contextmanager
+    def _server(self):
+        """Lease a server for one request, marking it down on connection failures"""
+        url = self._pick_server()
+        try:
+            yield url
+        except (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError):
+            self._mark_down(url)
+            raise
+        finally:
+            self._release(url)
+    
+    @asynccontextmanager
+    async def _aserver(self):
+        """Async _server"""
+        url = await self._apick_server()
+        try:
+            yield url
+        except (ConnectionError, TimeoutError):
+            self._mark_down(url)
+            raise
+        finally:
+            self._release(url)
+    
+    def _build_payload(self, prompt: str, max_tokens: int = None) -> Dict:
+        """Build chat completion payload shared by sync, async and streaming calls"""
+        if not max_tokens or max_tokens > self._max_tokens_limit:
+            max_tokens = self._max_tokens_limit
+        
+        payload = {
+            "model": self.model,
+            "messages": [{
+                "role": "user",
+                "content": prompt
+            }],
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+        
+        if isinstance(prompt, PrefixedPrompt) and prompt.prefix:
+            # Keeping the static prefix first lets llama.cpp reuse its KV cache
+            payload["messages"] = [
+                {"role": "system", "content": prompt.prefix},
+                {"role": "user", "content": prompt.suffix}
+            ]
+            payload["cache_prompt"] = True
+        
+        return payload
+    
+    def _report_usage(self, result: Dict, latency: float = 0.0):
+        """Log and meter token usage, including prompt tokens served from the server's cache"""
+        usage = result.get("usage") or {}
+        if not usage:
+            return
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached is None and "timings" in result:
+            # llama.cpp reports how many prompt tokens it actually evaluated
+            cached = max(usage.get("prompt_tokens", 0) - result["timings"].get("prompt_n", 0), 0)
+        cached = cached or 0
+        logger.info(
+            f"Local usage: input={usage.get('prompt_tokens', 0)} "
+            f"output={usage.get('completion_tokens', 0)} cache_read={cached}"
+        )
+        self._record_usage(
+            usage.get("prompt_tokens", 0) - cached,
+            usage.get("completion_tokens", 0),
+            cache_read_tokens=cached,
+            latency=latency
+        )
     
     def generate_content(self, prompt: str, max_tokens: int = None) -> str:
+        payload = self._build_payload(prompt, max_tokens)
+        
+        # Try each server once if connections fail
+        for attempt in range(len(self.base_urls)):
+            try:
+                start = time.monotonic()
+                with self._server() as base_url:
+                    response = self.session.post(
+                        f"{base_url}/chat/completions",
+                        json=payload,
+                        timeout=self.timeout
+                    )
+                    response.raise_for_status()
+                
+                data = response.json()
+                self._report_usage(data, time.monotonic() - start)
+                result = data["choices"][0]["message"]["content"]
+                return result
+                
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == len(self.base_urls) - 1:
+                    logger.error(f"Local LLM Error: {str(e)}")
+                    raise
+                    
+            except Exception as e:
+                logger.error(f"Local LLM Error: {str(e)}")
+                raise
+    
+    async def _agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        import httpx
+        
+        payload = self._build_payload(prompt, max_tokens)
+        
+        # Try each server once if connections fail
+        for attempt in range(len(self.base_urls)):
+            try:
+                start = time.monotonic()
+                async with self._aserver() as base_url:
+                    try:
+                        response = await self.async_client.post(f"{base_url}/chat/completions", json=payload)
+                    except httpx.TransportError as e:
+                        # Surface as a connection failure so the server is marked down
+                        raise ConnectionError(str(e)) from e
+                    response.raise_for_status()
+                
+                data = response.json()
+                self._report_usage(data, time.monotonic() - start)
+                return data["choices"][0]["message"]["content"]
+                
+            except NoLocalServerError as e:
+                # Every server was just re-probed; retrying won't find one
+                logger.error(f"Local LLM Async Error: {str(e)}")
+                raise
+                
+            except (ConnectionError, TimeoutError) as e:
+                if attempt == len(self.base_urls) - 1:
+                    logger.error(f"Local LLM Async Error: {str(e)}")
+                    raise
+                
+            except Exception as e:
+                logger.error(f"Local LLM Async Error: {str(e)}")
+                raise
+    
+    def stream_content(self, prompt: str, max_tokens: int = None) -> Iterator[str]:
+        response = None
         try:
-            url = f"{self.base_url}/chat/completions"
-            
-            if not max_tokens or max_tokens > self._max_tokens_limit:
-                max_tokens = self._max_tokens_limit
-            
-            payload = {
-                "model": self.model,
-                "messages": [{
-                    "role": "user",
-                    "content": prompt
-                }],
-                "max_tokens": max_tokens,
-                "temperature": 0.7
-            }
-            
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
-            
-            result = response.json()["choices"][0]["message"]["content"]
-            return result
+            payload = self._build_payload(prompt, max_tokens)
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+            start = time.monotonic()
+            chunks = []
+            final_event = {}
             
+            with self._server() as base_url:
+                response = self.session.post(
+                    f"{base_url}/chat/completions",
+                    json=payload,
+                    stream=True,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                
+                # OpenAI-compatible servers send server-sent events: "data: {...}"
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    event = json.loads(data)
+                    if event.get("usage"):
+                        final_event = event
+                    choices = event.get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+                    
         except Exception as e:
-            logger.error(f"Local LLM Error: {str(e)}")
+            logger.error(f"Local LLM Stream Error: {str(e)}")
             raise
+        finally:
+            if response is not None:
+                response.close()
+                # Usage arrives last, so streams closed early are estimated
+                if final_event:
+                    self._report_usage(final_event, time.monotonic() - start)
+                else:
+                    self._record_partial_stream(prompt, "".join(chunks), time.monotonic() - start)
     
     def get_model_name(self) -> str:
         return self.model
     
     @property
     def max_tokens_limit(self) -> int:
-        return self._max_tokens_limit 
\ No newline at end of file
+        return self._max_tokens_limit 
@@ -0,0 +1,154 @@
+import json
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from seoranker.config.settings import LLM_PRICES, BATCH_PRICE_DISCOUNT, USAGE_REPORT_DIR
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_keyword: ContextVar[Optional[str]] = ContextVar("usage_keyword", default=None)
+_task: ContextVar[Optional[str]] = ContextVar("usage_task", default=None)
+
+USAGE_FIELDS = ("calls", "input_tokens", "output_tokens", "cache_write_tokens", "cache_read_tokens", "latency", "cost")
+
+@contextmanager
+def usage_context(keyword: Optional[str] = None, task: Optional[str] = None) -> Iterator[None]:
+    """Attribute LLM calls made inside the block to a keyword and/or task"""
+    tokens = []
+    if keyword is not None:
+        tokens.append((_keyword, _keyword.set(keyword)))
+    if task is not None:
+        tokens.append((_task, _task.set(task)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+class UsageMeter:
+    """Running token, latency and cost totals for LLM calls
+
+    Totals are kept for the whole run and per keyword, task and model. Costs
+    come from ``LLM_PRICES`` (USD per million tokens); unpriced models count
+    tokens at zero cost.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._unpriced = set()
+        self.reset()
+
+    def reset(self):
+        """Start a new run"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self.total = self._empty()
+            self.by_keyword = defaultdict(self._empty)
+            self.by_task = defaultdict(self._empty)
+            self.by_model = defaultdict(self._empty)
+
+    @staticmethod
+    def _empty() -> Dict:
+        return {field: 0 for field in USAGE_FIELDS}
+
+    def _cost(self, model: str, input_tokens: int, output_tokens: int,
+              cache_write_tokens: int, cache_read_tokens: int, batch: bool) -> float:
+        prices = LLM_PRICES.get(model)
+        if prices is None:
+            if model not in self._unpriced:
+                self._unpriced.add(model)
+                logger.warning(f"No price configured for {model}; counting tokens at zero cost")
+            return 0.0
+
+        cost = (
+            input_tokens * prices["input"]
+            + output_tokens * prices["output"]
+            + cache_write_tokens * prices.get("cache_write", prices["input"])
+            + cache_read_tokens * prices.get("cache_read", prices["input"])
+        ) / 1_000_000
+        return cost * BATCH_PRICE_DISCOUNT if batch else cost
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        latency: float = 0.0,
+        batch: bool = False,
+        keyword: Optional[str] = None
+    ) -> Dict:
+        """Record one call's usage against the current keyword and task
+
+        ``input_tokens`` excludes cache writes and reads, matching how the
+        providers bill them.
+        """
+        entry = {
+            "calls": 1,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "latency": latency,
+        }
+        keyword = keyword or _keyword.get()
+        task = _task.get() or "untagged"
+
+        with self._lock:
+            entry["cost"] = self._cost(model, input_tokens, output_tokens, cache_write_tokens, cache_read_tokens, batch)
+            buckets = [self.total, self.by_task[task], self.by_model[f"{provider}:{model}"]]
+            if keyword:
+                buckets.append(self.by_keyword[keyword])
+            for bucket in buckets:
+                for field, value in entry.items():
+                    bucket[field] += value
+
+        return entry
+
+    def summary(self) -> Dict:
+        """Get run totals and per keyword/task/model breakdowns"""
+        def rounded(bucket: Dict) -> Dict:
+            return {
+                **bucket,
+                "latency": round(bucket["latency"], 3),
+                "cost": round(bucket["cost"], 6)
+            }
+
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(),
+                "finished_at": datetime.now().isoformat(),
+                "total": rounded(self.total),
+                "by_task": {name: rounded(b) for name, b in self.by_task.items()},
+                "by_model": {name: rounded(b) for name, b in self.by_model.items()},
+                "by_keyword": {name: rounded(b) for name, b in self.by_keyword.items()}
+            }
+
+    def dump(self, path: Optional[Path] = None) -> Path:
+        """Write the run summary as JSON and log the totals"""
+        summary = self.summary()
+        if path is None:
+            path = Path(USAGE_REPORT_DIR) / f"usage_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+        total = summary["total"]
+        logger.info(
+            f"LLM usage: {total['calls']} calls, input={total['input_tokens']} "
+            f"output={total['output_tokens']} cache_write={total['cache_write_tokens']} "
+            f"cache_read={total['cache_read_tokens']}, cost=${total['cost']:.4f}"
+        )
+        for task, bucket in summary["by_task"].items():
+            logger.info(f"- {task}: {bucket['calls']} calls, ${bucket['cost']:.4f}")
+        logger.info(f"Usage report saved to: {path}")
+        return path
+
+usage_meter = UsageMeter()
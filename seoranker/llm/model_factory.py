@@ -1,30 +1,52 @@
-from typing import Dict
+from typing import Dict, List
 from seoranker.llm.base import BaseLLM
-from seoranker.llm.anthropic_llm import AnthropicLLM
-from seoranker.llm.groq_llm import GroqLLM
-from seoranker.llm.local_llm import LocalLLM
+from seoranker.llm.router import RoutingLLM
 from seoranker.config.model_config import ModelProvider
 from seoranker.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 class ModelFactory:
+    @staticmethod
+    def _create_provider(provider: str, model: str, options: Dict = None) -> BaseLLM:
+        # Provider modules are imported only when that provider is configured
+        if provider == ModelProvider.ANTHROPIC.value:
+            from seoranker.llm.anthropic_llm import AnthropicLLM
+            return AnthropicLLM()
+        elif provider == ModelProvider.GROQ.value:
+            from seoranker.llm.groq_llm import GroqLLM
+            return GroqLLM()
+        elif provider == ModelProvider.LOCAL.value:
+            from seoranker.llm.local_llm import LocalLLM
+            return LocalLLM(model=model, base_urls=(options or {}).get("base_urls"))
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+    
+    @staticmethod
+    def _provider_chain(config: Dict) -> List[Dict]:
+        """Get primary provider followed by configured fallbacks"""
+        fallback = config.get("fallback") or []
+        if isinstance(fallback, dict):
+            fallback = [fallback]
+        return [config] + list(fallback)
+    
     @staticmethod
     def create_llm(config: Dict) -> BaseLLM:
-        provider = config["provider"]
-        model = config["model"]
+        llms = []
+        for entry in ModelFactory._provider_chain(config):
+            provider = entry["provider"]
+            try:
+                llms.append(ModelFactory._create_provider(provider, entry["model"], entry))
+            except Exception as e:
+                logger.warning(f"Failed to initialize {provider} LLM: {str(e)}")
         
-        try:
-            if provider == ModelProvider.ANTHROPIC.value:
-                return AnthropicLLM()
-            elif provider == ModelProvider.GROQ.value:
-                return GroqLLM()
-            elif provider == ModelProvider.LOCAL.value:
-                return LocalLLM(model=model)
-            else:
-                raise ValueError(f"Unknown provider: {provider}")
-                
-        except Exception as e:
-            logger.warning(f"Failed to initialize {provider} LLM: {str(e)}")
+        if not llms:
             logger.info("Falling back to local LLM")
-            return LocalLLM(model="llama-3.2-3b-instruct") 
\ No newline at end of file
+            from seoranker.llm.local_llm import LocalLLM
+            return LocalLLM(model="llama-3.2-3b-instruct")
+        
+        if len(llms) == 1:
+            return llms[0]
+        
+        # Route across the chain at runtime
+        return RoutingLLM(llms)
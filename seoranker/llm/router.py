@@ -0,0 +1,258 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+from seoranker.llm.base import BaseLLM, StreamComplete
+from seoranker.config.settings import (
+    ROUTER_WINDOW,
+    ROUTER_MIN_CALLS,
+    ROUTER_ERROR_THRESHOLD,
+    ROUTER_COOLDOWN,
+    ROUTER_SLOW_LATENCY
+)
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class ProviderHealth:
+    """Rolling error rate, latency and circuit breaker state for one provider"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._outcomes = deque(maxlen=ROUTER_WINDOW)  # (succeeded, latency)
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, succeeded: bool, latency: float):
+        """Record a call outcome and open or close the circuit"""
+        with self._lock:
+            self.calls += 1
+            if not succeeded:
+                self.errors += 1
+            self._outcomes.append((succeeded, latency))
+            self._trial_in_flight = False
+
+            if succeeded and self._opened_at is not None:
+                logger.info(f"Circuit closed for {self.name}")
+                self._opened_at = None
+                self._outcomes.clear()
+            elif not succeeded and self._should_open():
+                if self._opened_at is None:
+                    logger.warning(f"Circuit opened for {self.name} (error rate {self._error_rate():.0%})")
+                self._opened_at = time.monotonic()
+
+    def release(self):
+        """End a call without recording an outcome, freeing a half-open trial slot"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _should_open(self) -> bool:
+        if self._opened_at is not None:
+            # A failed half-open trial re-opens immediately
+            return True
+        return len(self._outcomes) >= ROUTER_MIN_CALLS and self._error_rate() >= ROUTER_ERROR_THRESHOLD
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok, _ in self._outcomes if not ok) / len(self._outcomes)
+
+    def _avg_latency(self) -> float:
+        latencies = [latency for ok, latency in self._outcomes if ok]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+    @property
+    def state(self) -> str:
+        """Circuit state: closed, open or half_open"""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= ROUTER_COOLDOWN:
+                return "half_open"
+            return "open"
+
+    def acquire(self) -> bool:
+        """Check whether a call may go to this provider now"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open":
+            with self._lock:
+                # Let a single trial call through after the cooldown
+                if not self._trial_in_flight:
+                    self._trial_in_flight = True
+                    return True
+        return False
+
+    @property
+    def is_slow(self) -> bool:
+        with self._lock:
+            return self._avg_latency() > ROUTER_SLOW_LATENCY
+
+    def snapshot(self) -> Dict:
+        """Get current stats for metrics"""
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "calls": self.calls,
+                "errors": self.errors,
+                "rolling_error_rate": round(self._error_rate(), 3),
+                "rolling_avg_latency": round(self._avg_latency(), 3)
+            }
+
+class RoutingLLM(BaseLLM):
+    """Route calls across a provider fallback chain
+
+    Providers are tried in chain order, skipping ones whose circuit is open and
+    trying slow ones after healthy ones.
+    """
+
+    provider = "router"
+
+    def __init__(self, llms: List[BaseLLM]):
+        if not llms:
+            raise ValueError("RoutingLLM needs at least one provider")
+        self.llms = llms
+        self.health = [ProviderHealth(self._label(llm)) for llm in llms]
+        self._lock = threading.Lock()
+        self.routed: Dict[str, int] = {self._label(llm): 0 for llm in llms}
+        self.fallbacks = 0
+        self.skipped_open = 0
+        self.exhausted = 0
+
+    @staticmethod
+    def _label(llm: BaseLLM) -> str:
+        return f"{llm.provider}:{llm.get_model_name()}"
+
+    def _route(self) -> Iterator[Tuple[int, BaseLLM, ProviderHealth]]:
+        """Yield (attempt, llm, health) in routing order, skipping open circuits"""
+        healthy, slow = [], []
+        for llm, health in zip(self.llms, self.health):
+            (slow if health.is_slow else healthy).append((llm, health))
+        
+        attempt = 0
+        for llm, health in healthy + slow:
+            # Acquire lazily so a half-open trial slot is only taken when used
+            if not health.acquire():
+                with self._lock:
+                    self.skipped_open += 1
+                continue
+            self._record_route(attempt, llm)
+            yield attempt, llm, health
+            attempt += 1
+
+    def _record_route(self, attempt: int, llm: BaseLLM):
+        with self._lock:
+            self.routed[self._label(llm)] += 1
+            if attempt > 0:
+                self.fallbacks += 1
+        if attempt > 0:
+            logger.warning(f"Routed to fallback provider {self._label(llm)}")
+        else:
+            logger.debug(f"Routed to {self._label(llm)}")
+
+    def _no_provider_error(self, last_error: Optional[Exception]) -> Exception:
+        with self._lock:
+            self.exhausted += 1
+        if last_error:
+            return last_error
+        return RuntimeError("No healthy LLM provider available")
+
+    def generate_content(self, prompt: str, max_tokens: int = None) -> str:
+        last_error = None
+        for attempt, llm, health in self._route():
+            start = time.monotonic()
+            try:
+                result = llm.generate_content(prompt, max_tokens)
+                health.record(True, time.monotonic() - start)
+                return result
+            except Exception as e:
+                health.record(False, time.monotonic() - start)
+                logger.warning(f"{self._label(llm)} failed: {str(e)}")
+                last_error = e
+        raise self._no_provider_error(last_error)
+
+    async def agenerate_content(self, prompt: str, max_tokens: int = None) -> str:
+        # Each provider applies its own concurrency semaphore
+        last_error = None
+        for attempt, llm, health in self._route():
+            start = time.monotonic()
+            try:
+                result = await llm.agenerate_content(prompt, max_tokens)
+                health.record(True, time.monotonic() - start)
+                return result
+            except Exception as e:
+                health.record(False, time.monotonic() - start)
+                logger.warning(f"{self._label(llm)} failed: {str(e)}")
+                last_error = e
+        raise self._no_provider_error(last_error)
+
+    def stream_content(self, prompt: str, max_tokens: int = None) -> Iterator[str]:
+        last_error = None
+        for attempt, llm, health in self._route():
+            start = time.monotonic()
+            started = False
+            stream = llm.stream_content(prompt, max_tokens)
+            try:
+                for chunk in stream:
+                    started = True
+                    yield chunk
+                health.record(True, time.monotonic() - start)
+                return
+            except StreamComplete:
+                # Consumer has the complete output and stopped reading
+                health.record(True, time.monotonic() - start)
+                return
+            except GeneratorExit:
+                # Consumer abandoned the stream; that says nothing about provider
+                # health. Consumers rejecting the output throw the error in instead
+                health.release()
+                raise
+            except Exception as e:
+                health.record(False, time.monotonic() - start)
+                logger.warning(f"{self._label(llm)} stream failed: {str(e)}")
+                if started:
+                    # Output already emitted can't be replayed from another provider
+                    raise
+                last_error = e
+            finally:
+                stream.close()
+        raise self._no_provider_error(last_error)
+
+    # Batches stay with the primary provider so a restarted process can collect them
+    def submit_batch(self, prompts: Dict[str, str], max_tokens: int = None) -> Dict:
+        return self.llms[0].submit_batch(prompts, max_tokens)
+
+    def get_batch_status(self, batch: Dict) -> str:
+        return self.llms[0].get_batch_status(batch)
+
+    def iter_batch_results(self, batch: Dict) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        return self.llms[0].iter_batch_results(batch)
+
+    def count_tokens(self, text: str) -> int:
+        return self.llms[0].count_tokens(text)
+
+    def get_metrics(self) -> Dict:
+        """Get routing decisions and per-provider health"""
+        with self._lock:
+            routing = {
+                "routed": dict(self.routed),
+                "fallbacks": self.fallbacks,
+                "skipped_open_circuit": self.skipped_open,
+                "exhausted": self.exhausted
+            }
+        return {
+            "routing": routing,
+            "providers": {health.name: health.snapshot() for health in self.health}
+        }
+
+    def get_model_name(self) -> str:
+        return self.llms[0].get_model_name()
+
+    @property
+    def max_tokens_limit(self) -> int:
+        return self.llms[0].max_tokens_limit
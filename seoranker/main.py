@@ -1,16 +1,15 @@
 from pathlib import Path
+import asyncio
 import csv
-from typing import List
-from seoranker.content.blog_generator import BlogGenerator
-from seoranker.content.content_archive import ContentArchive
+import json
+from typing import Dict, List
 from seoranker.utils.logger import setup_logger
 import logging
-from seoranker.utils.archive_manager import ArchiveManager
-import time
+from seoranker.config.settings import BATCH_CONCURRENCY
 import re
 
-# Set up root logger
-logging.basicConfig(level=logging.DEBUG)
+# Third-party libraries log through the root logger; seoranker loggers use the shared queue
+logging.basicConfig(level=logging.WARNING)
 logger = setup_logger(__name__)
 
 def get_unique_keywords() -> List[str]:
@@ -69,6 +68,7 @@ def generate_content():
         print(f"\nGenerating content for: {selected_keyword}")
         
         # Initialize generators
+        from seoranker.content.blog_generator import BlogGenerator
         blog_generator = BlogGenerator()
         
         # Generate content
@@ -78,10 +78,10 @@ def generate_content():
             print("\n✓ Content generated successfully!")
             print(f"Blog ID: {result.get('blog_id')}")
             print("\nVersions generated:")
-            versions = result.get("versions", {})
-            print(f"- Blog post: {'✓' if versions.get('blog') else '✗'}")
-            print(f"- LinkedIn: {'✓' if versions.get('linkedin') else '✗'}")
-            print(f"- Twitter: {'✓' if versions.get('twitter') else '✗'}")
+            files = result.get("files") or {}
+            print(f"- Blog post: {'✓' if files.get('blog') else '✗'}")
+            print(f"- LinkedIn: {'✓' if files.get('linkedin') else '✗'}")
+            print(f"- Twitter: {'✓' if files.get('twitter') else '✗'}")
         else:
             print(f"\n✗ Error generating content: {result.get('error', 'Unknown error')}")
             
@@ -93,6 +93,7 @@ def update_archive():
     """Update blog archive from output directory"""
     try:
         print("\n=== Updating Blog Archive ===")
+        from seoranker.utils.archive_manager import ArchiveManager
         manager = ArchiveManager()
         result = manager.update_archive()
         
@@ -233,18 +234,18 @@ def sanitize_filename(keyword: str) -> str:
     sanitized = re.sub(r'[^\w\s-]', '', keyword.lower())
     return re.sub(r'[-\s]+', '_', sanitized)
 
-def get_existing_content() -> set:
-    """Get set of existing content keywords"""
-    output_dir = Path("output")
-    existing = set()
+def get_pending_keywords(keywords: List[str]) -> List[str]:
+    """Get keywords without generated content according to the generation manifest"""
+    from seoranker.content.manifest import GenerationManifest
     
-    if output_dir.exists():
-        for file in output_dir.glob("*.html"):
-            # Convert filename back to keyword format
-            keyword = file.stem.replace('_', ' ').lower()
-            existing.add(keyword)
+    manifest = GenerationManifest()
+    pending = manifest.pending(keywords)
     
-    return existing
+    # Blogs generated before the manifest existed are recorded on first sight
+    if pending and manifest.backfill(pending):
+        pending = manifest.pending(pending)
+    
+    return pending
 
 def get_valid_keywords() -> dict:
     """Get dictionary of valid keywords from content database with their normalized form"""
@@ -268,6 +269,90 @@ def get_valid_keywords() -> dict:
         logger.error(f"Error reading valid keywords: {str(e)}")
         return {}
 
+class BatchProgress:
+    """Print per-keyword results in keyword order as concurrent workers finish them"""
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self.results: Dict[int, Dict] = {}
+        self.next_index = 0
+        self.succeeded = 0
+    
+    def complete(self, index: int, result: Dict):
+        """Record a finished keyword and print any results now in order"""
+        self.results[index] = result
+        while self.next_index in self.results:
+            self._print(self.next_index, self.results[self.next_index])
+            self.next_index += 1
+        
+        waiting = len(self.results) - self.next_index
+        if waiting:
+            print(f"  ({waiting} finished, waiting on {self.keywords[self.next_index]})")
+    
+    def _print(self, index: int, result: Dict):
+        keyword = self.keywords[index]
+        total = len(self.keywords)
+        if result["status"] == "success":
+            self.succeeded += 1
+            files = result.get("files") or {}
+            print(f"\n[{index + 1}/{total}] ✓ {keyword} (Blog ID: {result.get('blog_id')})")
+            print(f"- Blog post: {'✓' if files.get('blog') else '✗'}")
+            print(f"- LinkedIn: {'✓' if files.get('linkedin') else '✗'}")
+            print(f"- Twitter: {'✓' if files.get('twitter') else '✗'}")
+        else:
+            print(f"\n[{index + 1}/{total}] ✗ {keyword}: {result.get('error', 'Unknown error')}")
+
+async def _agenerate_batch(blog_generator: "BlogGenerator", keywords: List[str], workers: int = BATCH_CONCURRENCY) -> List[Dict]:
+    """Generate blogs for keywords with a pool of concurrent workers
+    
+    Workers share one BlogGenerator, so reference databases are parsed once;
+    provider semaphores and rate limits cap each API. A failing keyword is
+    recorded and the worker moves on to the next one.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(keywords):
+        queue.put_nowait(item)
+    
+    progress = BatchProgress(keywords)
+    results: List[Dict] = [{}] * len(keywords)
+    
+    async def worker():
+        while True:
+            try:
+                index, keyword = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await blog_generator.agenerate_blog(keyword)
+            except Exception as e:
+                logger.error(f"Error generating content for {keyword}: {str(e)}", exc_info=True)
+                result = {"keyword": keyword, "error": str(e), "status": "failed"}
+            results[index] = result
+            progress.complete(index, result)
+    
+    workers = max(1, min(workers, len(keywords)))
+    print(f"\nGenerating {len(keywords)} keywords with {workers} workers...")
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    print(f"\n{progress.succeeded}/{len(keywords)} keywords generated successfully")
+    return results
+
+def _ask_worker_count() -> int:
+    """Prompt for the number of concurrent workers, defaulting to BATCH_CONCURRENCY"""
+    choice = input(f"Concurrent workers (default {BATCH_CONCURRENCY}): ").strip()
+    try:
+        return max(1, int(choice)) if choice else BATCH_CONCURRENCY
+    except ValueError:
+        print(f"Invalid number, using {BATCH_CONCURRENCY} workers")
+        return BATCH_CONCURRENCY
+
+def _log_routing_metrics(blog_generator: "BlogGenerator"):
+    """Log provider routing decisions for the blog and social LLMs"""
+    from seoranker.llm.router import RoutingLLM
+    
+    for task, llm in (("blog", blog_generator.blog_llm), ("social", blog_generator.social_generator.llm)):
+        if isinstance(llm, RoutingLLM):
+            logger.info(f"Routing metrics ({task}): {json.dumps(llm.get_metrics())}")
+
 def generate_content_batch():
     """Generate content for all keywords in database that don't have existing output"""
     try:
@@ -280,14 +365,8 @@ def generate_content_batch():
             print("No keywords found in database. Please build knowledge base first.")
             return
             
-        # Filter out keywords that already have content
-        existing_content = get_existing_content()
-        pending_keywords = []
-        
-        # Use normalized keywords for comparison but keep original case
-        for normalized, original in valid_keywords.items():
-            if normalized not in existing_content:
-                pending_keywords.append(original)
+        # Filter out keywords that already have content, keeping original case
+        pending_keywords = get_pending_keywords(list(valid_keywords.values()))
         
         if not pending_keywords:
             print("\nℹ All keywords already have content generated")
@@ -303,28 +382,25 @@ def generate_content_batch():
             print("Operation cancelled")
             return
             
+        # Batch API mode trades latency for price and rate-limit headroom
+        use_batch_api = input("Use provider batch API (cheaper, results may take hours)? (y/n): ")
+        workers = _ask_worker_count() if use_batch_api.lower() != 'y' else BATCH_CONCURRENCY
+            
         # Initialize generators
+        from seoranker.content.blog_generator import BlogGenerator
+        from seoranker.llm.metering import usage_meter
         blog_generator = BlogGenerator()
+        usage_meter.reset()
         
-        # Process each keyword
-        for i, keyword in enumerate(pending_keywords, 1):
-            print(f"\n[{i}/{len(pending_keywords)}] Generating content for: {keyword}")
-            
-            result = blog_generator.generate_blog(keyword)
-            
-            if result["status"] == "success":
-                print(f"✓ Content generated successfully!")
-                print(f"Blog ID: {result.get('blog_id')}")
-                versions = result.get("versions", {})
-                print(f"- Blog post: {'✓' if versions.get('blog') else '✗'}")
-                print(f"- LinkedIn: {'✓' if versions.get('linkedin') else '✗'}")
-                print(f"- Twitter: {'✓' if versions.get('twitter') else '✗'}")
-            else:
-                print(f"✗ Error: {result.get('error', 'Unknown error')}")
-            
-            # Add delay between keywords
-            if i < len(pending_keywords):
-                time.sleep(2)
+        if use_batch_api.lower() == 'y':
+            from seoranker.content.batch_generator import BatchBlogGenerator
+            BatchBlogGenerator(blog_generator).run(pending_keywords)
+        else:
+            # Workers keep several keywords in flight; provider limits cap each API
+            asyncio.run(_agenerate_batch(blog_generator, pending_keywords, workers))
+        
+        _log_routing_metrics(blog_generator)
+        usage_meter.dump()
                 
         print("\n=== Batch Generation Complete ===")
         print(f"Processed {len(pending_keywords)} keywords")
@@ -0,0 +1,68 @@
+import argparse
+from datetime import datetime
+from pathlib import Path
+from seoranker.config.settings import PIPELINE_DB_PATH, PIPELINE_STAGES
+from seoranker.pipeline.queue import JobQueue
+from seoranker.pipeline.worker import run_workers
+
+def print_status(queue: JobQueue):
+    print(f"\n{'stage':<10}" + "".join(f"{status:>9}" for status in ("pending", "leased", "done", "dead")))
+    for stage, counts in queue.stats().items():
+        print(f"{stage:<10}" + "".join(f"{counts.get(status, 0):>9}" for status in ("pending", "leased", "done", "dead")))
+
+    dead = queue.dead_jobs()
+    if dead:
+        print("\nDead-lettered jobs:")
+        for job in dead:
+            failed_at = datetime.fromtimestamp(job["updated_at"]).strftime("%Y-%m-%d %H:%M")
+            print(f"- {job['keyword']} at {job['stage']} ({failed_at}): {job['last_error']}")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m seoranker.pipeline",
+                                     description="Keyword-to-publish job queue")
+    parser.add_argument("--db", default=PIPELINE_DB_PATH, help="Queue database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="Queue keywords")
+    enqueue.add_argument("keywords", nargs="*", help="Keywords to queue")
+    enqueue.add_argument("--file", type=Path, help="File with one keyword per line")
+    enqueue.add_argument("--stage", choices=PIPELINE_STAGES, default=PIPELINE_STAGES[0],
+                         help="Stage to start at (e.g. blog for keywords already researched)")
+
+    worker = commands.add_parser("worker", help="Run workers")
+    worker.add_argument("--stage", choices=PIPELINE_STAGES, action="append",
+                        help="Stage to serve; repeat for several (default: all)")
+    worker.add_argument("--processes", type=int, default=1, help="Worker processes to run")
+    worker.add_argument("--max-jobs", type=int, help="Exit after this many jobs per process")
+    worker.add_argument("--drain", action="store_true", help="Exit once no job is ready")
+
+    commands.add_parser("status", help="Show job counts and dead-lettered jobs")
+
+    retry = commands.add_parser("retry", help="Requeue dead-lettered jobs")
+    retry.add_argument("keywords", nargs="*", help="Keywords to retry (default: all dead jobs)")
+
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        run_workers(args.stage or PIPELINE_STAGES, args.processes, args.db, args.max_jobs, args.drain)
+        return
+
+    queue = JobQueue(args.db)
+    try:
+        if args.command == "enqueue":
+            keywords = [k.lower().strip() for k in args.keywords]
+            if args.file:
+                with open(args.file, 'r', encoding='utf-8') as f:
+                    keywords.extend(line.lower().strip() for line in f)
+            keywords = list(dict.fromkeys(k for k in keywords if k))
+            ids = queue.enqueue(keywords, args.stage)
+            print(f"Queued {len(ids)} of {len(keywords)} keywords")
+        elif args.command == "status":
+            print_status(queue)
+        elif args.command == "retry":
+            print(f"Requeued {queue.retry_dead(args.keywords)} dead jobs")
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    main()
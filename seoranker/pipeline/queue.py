@@ -0,0 +1,236 @@
+import json
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from seoranker.config.settings import (
+    PIPELINE_DB_PATH,
+    PIPELINE_STAGES,
+    PIPELINE_LEASE_SECONDS,
+    PIPELINE_MAX_ATTEMPTS,
+    PIPELINE_BACKOFF_BASE,
+    PIPELINE_BACKOFF_MAX
+)
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    payload TEXT NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    run_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, stage, run_at);
+CREATE INDEX IF NOT EXISTS jobs_keyword ON jobs (keyword);
+"""
+
+class JobQueue:
+    """Durable SQLite job queue moving keywords through the pipeline stages
+
+    Each job is one keyword. A worker leases a job for one of its stages, runs
+    the stage and completes it, which advances the job to the next stage with
+    the stage's output as payload. Statuses:
+
+    - ``pending``: waiting for a worker once ``run_at`` has passed
+    - ``leased``: being worked on until ``lease_expires``; an expired lease
+      (crashed or hung worker) makes the job available again
+    - ``done``: every stage finished
+    - ``dead``: a stage failed ``max_attempts`` times; kept for inspection
+      and ``retry_dead``
+
+    Every process opens its own connection; leases are taken inside
+    ``BEGIN IMMEDIATE`` so two workers never get the same job.
+    """
+
+    def __init__(self, path: str = PIPELINE_DB_PATH, lease_seconds: int = PIPELINE_LEASE_SECONDS,
+                 max_attempts: int = PIPELINE_MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction taking the database lock up front"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def enqueue(self, keywords: List[str], stage: str = PIPELINE_STAGES[0]) -> List[int]:
+        """Add keywords at a stage, skipping keywords already queued or in progress"""
+        if stage not in PIPELINE_STAGES:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+
+        now = time.time()
+        ids = []
+        with self._transaction():
+            for keyword in keywords:
+                active = self.conn.execute(
+                    "SELECT 1 FROM jobs WHERE keyword = ? AND status IN ('pending', 'leased')",
+                    (keyword,)
+                ).fetchone()
+                if active:
+                    logger.debug(f"Keyword already queued: {keyword}")
+                    continue
+                cursor = self.conn.execute(
+                    "INSERT INTO jobs (keyword, stage, run_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (keyword, stage, now, now, now)
+                )
+                ids.append(cursor.lastrowid)
+
+        logger.info(f"Queued {len(ids)}/{len(keywords)} keywords at stage '{stage}'")
+        return ids
+
+    def lease(self, stages: List[str], worker_id: str) -> Optional[Dict]:
+        """Lease the next ready job at one of stages, or None if there is none"""
+        now = time.time()
+        placeholders = ", ".join("?" for _ in stages)
+        with self._transaction():
+            # Jobs whose last lease expired on their final attempt are dead
+            self.conn.execute(
+                "UPDATE jobs SET status = 'dead', last_error = 'lease expired', "
+                "lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires <= ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            row = self.conn.execute(
+                f"SELECT * FROM jobs WHERE stage IN ({placeholders}) AND ("
+                "(status = 'pending' AND run_at <= ?) OR (status = 'leased' AND lease_expires <= ?)"
+                ") ORDER BY run_at, id LIMIT 1",
+                (*stages, now, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row["status"] == "leased":
+                logger.warning(f"Reclaiming expired lease on job {row['id']} from {row['lease_owner']}")
+            self.conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row["id"])
+            )
+            job = self._job(row)
+
+        job.update(status="leased", lease_owner=worker_id, attempts=job["attempts"] + 1)
+        return job
+
+    def extend(self, job_id: int, worker_id: str) -> bool:
+        """Renew a lease; False if the worker no longer holds it"""
+        now = time.time()
+        cursor = self.conn.execute(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (now + self.lease_seconds, now, job_id, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, payload: Dict) -> bool:
+        """Finish the job's current stage and advance it to the next one
+
+        Returns False, discarding the result, if the lease was lost meanwhile.
+        """
+        now = time.time()
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT stage FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                logger.warning(f"Job {job_id} is no longer leased by {worker_id}; dropping result")
+                return False
+
+            index = PIPELINE_STAGES.index(row["stage"])
+            if index + 1 < len(PIPELINE_STAGES):
+                stage, status = PIPELINE_STAGES[index + 1], "pending"
+            else:
+                stage, status = row["stage"], "done"
+            self.conn.execute(
+                "UPDATE jobs SET stage = ?, status = ?, payload = ?, attempts = 0, run_at = ?, "
+                "lease_owner = NULL, lease_expires = NULL, last_error = NULL, updated_at = ? WHERE id = ?",
+                (stage, status, json.dumps(payload), now, now, job_id)
+            )
+        return True
+
+    def _backoff(self, attempts: int) -> float:
+        """Exponential backoff with jitter for the given attempt number"""
+        delay = min(PIPELINE_BACKOFF_BASE * 2 ** (attempts - 1), PIPELINE_BACKOFF_MAX)
+        return delay * random.uniform(0.8, 1.2)
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> Optional[str]:
+        """Record a failed attempt; retry later or dead-letter after max_attempts
+
+        Returns the job's new status, or None if the lease was lost meanwhile.
+        """
+        now = time.time()
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT attempts FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row["attempts"] >= self.max_attempts:
+                status, run_at = "dead", now
+            else:
+                status, run_at = "pending", now + self._backoff(row["attempts"])
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, last_error = ?, "
+                "lease_owner = NULL, lease_expires = NULL, updated_at = ? WHERE id = ?",
+                (status, run_at, error[:2000], now, job_id)
+            )
+        return status
+
+    def retry_dead(self, keywords: Optional[List[str]] = None) -> int:
+        """Requeue dead jobs at the stage they failed, with fresh attempts"""
+        now = time.time()
+        query = "UPDATE jobs SET status = 'pending', attempts = 0, run_at = ?, updated_at = ? WHERE status = 'dead'"
+        params = [now, now]
+        if keywords:
+            query += f" AND keyword IN ({', '.join('?' for _ in keywords)})"
+            params.extend(keywords)
+        with self._transaction():
+            return self.conn.execute(query, params).rowcount
+
+    def dead_jobs(self) -> List[Dict]:
+        """Get dead-lettered jobs, most recent first"""
+        rows = self.conn.execute("SELECT * FROM jobs WHERE status = 'dead' ORDER BY updated_at DESC")
+        return [self._job(row) for row in rows]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Job counts per stage and status"""
+        counts = {stage: {} for stage in PIPELINE_STAGES}
+        rows = self.conn.execute("SELECT stage, status, COUNT(*) AS n FROM jobs GROUP BY stage, status")
+        for row in rows:
+            counts.setdefault(row["stage"], {})[row["status"]] = row["n"]
+        return counts
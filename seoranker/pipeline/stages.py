@@ -0,0 +1,110 @@
+from typing import Callable, Dict
+from seoranker.content.blog_generator import BlogGenerator
+from seoranker.config.model_config import TaskType
+from seoranker.llm.metering import usage_context
+from seoranker.utils.tracing import span
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class StageError(Exception):
+    """A stage could not finish; the job is retried with backoff"""
+
+class PipelineStages:
+    """Stage handlers run by pipeline workers
+
+    Each handler takes the job's keyword and the payload produced by the
+    previous stage and returns the payload for the next one, so a stage can
+    run in any worker process. Tools are created on first use, once per
+    worker, so a worker only pays for the stages it serves.
+    """
+
+    def __init__(self):
+        self._blog_generator = None
+        self._exa_tool = None
+        self._publisher = None
+
+    @property
+    def blog_generator(self) -> BlogGenerator:
+        if self._blog_generator is None:
+            self._blog_generator = BlogGenerator()
+        return self._blog_generator
+
+    @property
+    def exa_tool(self):
+        if self._exa_tool is None:
+            from seoranker.tools.exa_search import ExaSearchTool
+            self._exa_tool = ExaSearchTool()
+        return self._exa_tool
+
+    @property
+    def publisher(self):
+        if self._publisher is None:
+            from seoranker.shopify import ShopifyPublisher
+            self._publisher = ShopifyPublisher()
+        return self._publisher
+
+    def handler(self, stage: str) -> Callable[[str, Dict], Dict]:
+        return getattr(self, f"_{stage}")
+
+    def run(self, stage: str, keyword: str, payload: Dict) -> Dict:
+        """Run one stage for keyword and return the next stage's payload"""
+        with span(f"pipeline_{stage}", keyword=keyword), usage_context(keyword=keyword):
+            return self.handler(stage)(keyword, payload)
+
+    def _research(self, keyword: str, payload: Dict) -> Dict:
+        """Gather reference content into the knowledge base"""
+        if self.exa_tool._keyword_exists(keyword):
+            logger.info(f"Keyword '{keyword}' already researched")
+            return payload
+
+        results = self.exa_tool.gather_content_insights(keyword)
+        if not results:
+            raise StageError(f"No content gathered for '{keyword}'")
+        return {**payload, "sources": len(results)}
+
+    def _blog(self, keyword: str, payload: Dict) -> Dict:
+        """Generate the blog post and save its HTML"""
+        generator = self.blog_generator
+        prompt = generator._prepare_blog_prompt(keyword)
+        with usage_context(task=TaskType.BLOG.value):
+            if generator.stream:
+                metadata = generator._stream_blog_content(keyword, prompt)
+            else:
+                metadata = generator._extract_metadata(generator.blog_llm.generate_content(prompt))
+
+        content = generator._build_content_dict(metadata)
+        files = generator._save_content_files(keyword, content)
+        if not files:
+            raise StageError(f"Could not save blog files for '{keyword}'")
+        return {**payload, "content": content, "files": files}
+
+    def _social(self, keyword: str, payload: Dict) -> Dict:
+        """Generate the social versions of the blog post"""
+        social = self.blog_generator.social_generator.generate_all(payload["content"])
+        return {**payload, "social": social}
+
+    def _archive(self, keyword: str, payload: Dict) -> Dict:
+        """Add the blog post to the archive as a draft"""
+        content, files = payload["content"], payload["files"]
+        result = self.blog_generator._archive_blog(keyword, content, files)
+        if result.get("blog_id") is None:
+            raise StageError(f"Could not archive '{keyword}'")
+        self.blog_generator._attach_social(content, files, payload.get("social", {}))
+        return {**payload, "content": content, "files": files, "blog_id": result["blog_id"]}
+
+    def _publish(self, keyword: str, payload: Dict) -> Dict:
+        """Publish the archived draft to Shopify"""
+        from seoranker.content.content_archive import ContentArchive
+
+        entry = ContentArchive().get_entry(keyword)
+        if entry is None:
+            raise StageError(f"No archive entry for '{keyword}'")
+        if entry.get("status") == "published":
+            logger.info(f"'{keyword}' is already published")
+            return payload
+
+        article = self.publisher.create_article(entry)
+        if not article:
+            raise StageError(f"Shopify rejected '{keyword}'")
+        return {**payload, "article_id": article["id"]}
@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import socket
+import threading
+import uuid
+from typing import Dict, List, Optional
+from seoranker.config.settings import PIPELINE_DB_PATH, PIPELINE_POLL_INTERVAL
+from seoranker.pipeline.queue import JobQueue
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class PipelineWorker:
+    """Lease jobs at the given stages and run them until stopped
+
+    While a stage runs, a heartbeat thread renews the lease every third of
+    the lease period, so long generations keep their job and a crashed
+    worker's job is picked up by another worker once the lease runs out.
+    """
+
+    def __init__(self, stages: List[str], db_path: str = PIPELINE_DB_PATH,
+                 poll_interval: float = PIPELINE_POLL_INTERVAL):
+        from seoranker.pipeline.stages import PipelineStages
+
+        self.stages = stages
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.queue = JobQueue(db_path)
+        self.handlers = PipelineStages()
+        self.stopped = threading.Event()
+
+    def _heartbeat(self, job_id: int, done: threading.Event):
+        """Renew the job's lease until done is set or the lease is lost"""
+        queue = JobQueue(self.db_path)  # SQLite connections stay in their thread
+        try:
+            while not done.wait(queue.lease_seconds / 3):
+                if not queue.extend(job_id, self.worker_id):
+                    logger.warning(f"Lost lease on job {job_id}")
+                    return
+        finally:
+            queue.close()
+
+    def process(self, job: Dict) -> bool:
+        """Run one leased job's stage and record the outcome"""
+        logger.info(f"[{self.worker_id}] {job['stage']} '{job['keyword']}' (attempt {job['attempts']})")
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job["id"], done), daemon=True)
+        heartbeat.start()
+        try:
+            payload = self.handlers.run(job["stage"], job["keyword"], job["payload"])
+        except Exception as e:
+            logger.error(f"Error in {job['stage']} stage for '{job['keyword']}': {str(e)}", exc_info=True)
+            status = self.queue.fail(job["id"], self.worker_id, f"{type(e).__name__}: {str(e)}")
+            if status == "dead":
+                logger.error(f"Job {job['id']} ('{job['keyword']}') dead-lettered at {job['stage']}")
+            return False
+        finally:
+            done.set()
+            heartbeat.join()
+
+        return self.queue.complete(job["id"], self.worker_id, payload)
+
+    def run(self, max_jobs: Optional[int] = None, drain: bool = False) -> int:
+        """Process jobs until stopped, max_jobs are done, or (drain) none are ready"""
+        processed = 0
+        logger.info(f"Worker {self.worker_id} serving stages: {', '.join(self.stages)}")
+        try:
+            while not self.stopped.is_set() and (max_jobs is None or processed < max_jobs):
+                job = self.queue.lease(self.stages, self.worker_id)
+                if job is None:
+                    if drain:
+                        break
+                    self.stopped.wait(self.poll_interval)
+                    continue
+                self.process(job)
+                processed += 1
+        finally:
+            self.queue.close()
+        return processed
+
+def _run_worker(stages: List[str], db_path: str, max_jobs: Optional[int], drain: bool):
+    try:
+        PipelineWorker(stages, db_path).run(max_jobs, drain)
+    except KeyboardInterrupt:
+        pass
+
+def run_workers(stages: List[str], processes: int = 1, db_path: str = PIPELINE_DB_PATH,
+                max_jobs: Optional[int] = None, drain: bool = False):
+    """Run worker processes for stages and wait for them to exit"""
+    if processes <= 1:
+        _run_worker(stages, db_path, max_jobs, drain)
+        return
+
+    workers = [
+        multiprocessing.Process(target=_run_worker, args=(stages, db_path, max_jobs, drain))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        logger.info("Stopping pipeline workers...")
+        for worker in workers:
+            worker.join(timeout=30)
@@ -5,6 +5,8 @@ from pathlib import Path
 import csv
 from typing import Dict, Optional, List, Any
 from seoranker.utils.logger import setup_logger
+from seoranker.utils.storage import CSVStore
+from seoranker.content.content_archive import ARCHIVE_FIELDS
 import os
 from bs4 import BeautifulSoup
 
@@ -22,6 +24,7 @@ class ShopifyPublisher:
             raise ValueError("Missing required Shopify environment variables")
             
         self.archive_path = Path("knowledge_base/blog_archive.csv")
+        self.archive_store = CSVStore(self.archive_path, ARCHIVE_FIELDS)
         self.author = "Shubham Attri"
         
         # Get or create blog
@@ -93,13 +96,7 @@ class ShopifyPublisher:
     
     def _update_archive_status(self, entry: Dict, new_status: str):
         """Update article status in archive"""
-        try:
-            # Read current archive
-            with open(self.archive_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                entries = list(reader)
-                fieldnames = reader.fieldnames
-
+        def set_status(entries: List[Dict]):
             # Update status for matching entry
             for e in entries:
                 if e["title"] == entry["title"]:
@@ -107,11 +104,9 @@ class ShopifyPublisher:
                     logger.debug(f"Updated status for '{entry['title']}' to {new_status}")
                     break
 
-            # Write updated archive
-            with open(self.archive_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(entries)
+        try:
+            # Read, update and atomically replace the archive under one lock
+            self.archive_store.update(set_status)
 
         except Exception as e:
             logger.error(f"Error updating archive status: {str(e)}")
@@ -1,18 +1,46 @@
 from string import Template
+from seoranker.llm.base import PrefixedPrompt
 
 class BlogPromptTemplate:
-    """Blog generation prompt template"""
+    """Blog generation prompt template
+    
+    The prompt is split into a static prefix (output format, brand voice,
+    structure, HTML rules) that is identical on every call, and a per-keyword dynamic suffix, so
+    providers can cache the prefix.
+    """
     
     @staticmethod
-    def get_template() -> str:
+    def get_output_format() -> str:
+        """Response structure every provider must follow; parsed by BlogGenerator"""
         return """
-Generate a comprehensive, SEO-optimized blog post about ${keyword}.
+You are a professional blog writer. Generate content exactly following this structure:
+
+<metadata>
+title: [Blog post title]
+meta_description: [155 character meta description]
+</metadata>
+
+<content>
+[Full HTML blog post content]
+</content>
+
+Requirements:
+1. Respond ONLY with the above structure (no suggestions or additional sections)
+2. Use proper HTML tags (<h1>, <h2>, <h3>, <p>, <ul>, <li>)
+3. Include exactly one <h1> tag
+4. Include 2-3 <h2> tags
+5. Format all links as <a href="url" target="_blank">text</a>
+6. Ensure content is at least 2100 words
+"""
 
-Reference Article Analysis:
-${h2_analysis}
+    @staticmethod
+    def get_static_prefix() -> str:
+        return BlogPromptTemplate.get_output_format() + """
+You write comprehensive, SEO-optimized blog posts for Bestia Brisk. The keyword,
+reference analysis and research for this post follow these guidelines.
 
 Suggested H2 Structure:
-Create 2-3 H2 sections based on the reference articles above, but ensure they:
+Create 2-3 H2 sections based on the reference articles provided, but ensure they:
 1. Follow our brand voice and premium positioning
 2. Include at least one section about quality/premium aspects
 3. Include "The Bestia Brisk Difference" section
@@ -30,11 +58,11 @@ Brand Voice Requirements:
 
 Content Structure:
 1. Introduction:
-   - Hook with a bold statement about ${keyword}
+   - Hook with a bold statement about the primary keyword
    - Establish authority and premium positioning
    - Preview the value for ambitious professionals
 
-2. Main Sections (Use 2-3 H2s based on analysis above):
+2. Main Sections (Use 2-3 H2s based on the reference analysis):
    - Each section should flow naturally
    - Include expert insights
    - Reference scientific/industry sources
@@ -59,6 +87,29 @@ HTML Format Requirements:
 - Use <ul> and <li> tags for lists
 - Use proper <a> tags for links with target="_blank"
 
+SEO Guidelines:
+- Include the primary keyword naturally throughout content
+- Include the internal blog links provided
+- Include 2-3 external authority links (only for scientific/educational content)
+- Minimum length: 2000 words
+- Include meta description (155 characters)
+
+Remember to:
+1. Analyze and incorporate successful elements from reference articles
+2. Maintain consistent premium positioning
+3. Focus on value for ambitious professionals
+4. Naturally integrate Bestia Brisk's unique selling points
+"""
+
+    @staticmethod
+    def get_template() -> str:
+        """Get the per-keyword dynamic suffix template"""
+        return """
+Generate a comprehensive, SEO-optimized blog post about ${keyword}.
+
+Reference Article Analysis:
+${h2_analysis}
+
 Content Requirements:
 1. Include these product references naturally:
 ${product_info}
@@ -74,17 +125,6 @@ ${sources}
 
 SEO Requirements:
 - Primary keyword: ${keyword}
-- Include keyword naturally throughout content
-- Include the internal blog links provided above
-- Include 2-3 external authority links (only for scientific/educational content)
-- Minimum length: 2000 words
-- Include meta description (155 characters)
-
-Remember to:
-1. Analyze and incorporate successful elements from reference articles
-2. Maintain consistent premium positioning
-3. Focus on value for ambitious professionals
-4. Naturally integrate Bestia Brisk's unique selling points
 """
 
     @staticmethod
@@ -95,14 +135,15 @@ Remember to:
         questions: str,
         internal_links: str,
         sources: str
-    ) -> str:
+    ) -> PrefixedPrompt:
         """Format prompt template with provided values"""
         template = Template(BlogPromptTemplate.get_template())
-        return template.safe_substitute(
+        suffix = template.safe_substitute(
             keyword=keyword,
             h2_analysis=h2_analysis,
             product_info=product_info,
             questions=questions,
             internal_links=internal_links,
             sources=sources
-        ) 
\ No newline at end of file
+        )
+        return PrefixedPrompt(BlogPromptTemplate.get_static_prefix(), suffix)
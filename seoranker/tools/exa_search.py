@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import http.client
 import json
 import time
@@ -7,7 +7,11 @@ import os
 from pathlib import Path
 from exa_py import Exa
 from seoranker.config.settings import EXA_API_KEY, SERPER_API_KEY, MAX_SEARCH_RESULTS
-from seoranker.utils.logger import setup_logger
+from seoranker.utils.logger import setup_logger, LogPayload
+from seoranker.utils.tracing import span
+from seoranker.utils.storage import CSVStore
+from seoranker.tools.outline import OUTLINE_DB_PATH, OUTLINE_FIELDS, outline_row
+from seoranker.tools.summarizer import SUMMARY_DB_PATH, SUMMARY_FIELDS, summarize, summary_row
 
 logger = setup_logger(__name__)
 
@@ -22,73 +26,46 @@ class ExaSearchTool:
     
     def _init_databases(self):
         """Initialize both databases if they don't exist"""
-        # Content database
-        if not self.content_db_path.parent.exists():
-            self.content_db_path.parent.mkdir(parents=True)
-        
-        if not self.content_db_path.exists():
-            with open(self.content_db_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['keyword', 'url', 'title', 'content'])
-        
-        # Suggestions database
-        if not self.suggestions_db_path.exists():
-            with open(self.suggestions_db_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['source_keyword', 'question', 'title', 'url'])
+        self.content_store = CSVStore(self.content_db_path, ['keyword', 'url', 'title', 'content'])
+        self.suggestions_store = CSVStore(self.suggestions_db_path, ['source_keyword', 'question', 'title', 'url'])
+        self.outline_store = CSVStore(OUTLINE_DB_PATH, OUTLINE_FIELDS)
+        self.summary_store = CSVStore(SUMMARY_DB_PATH, SUMMARY_FIELDS)
+        self.content_store.ensure()
+        self.suggestions_store.ensure()
     
-    def _url_exists(self, keyword: str, url: str) -> bool:
-        """Check if URL already exists in database for this keyword"""
-        try:
-            if not self.content_db_path.exists():
-                return False
-            
-            with open(self.content_db_path, 'r', encoding='utf-8') as f:
-                # Skip empty files
-                if f.readline().strip() == '':
-                    return False
-                
-                # Go back to start of file
-                f.seek(0)
-                reader = csv.DictReader(f)
-                
-                # Handle missing columns
-                if not reader.fieldnames or 'keyword' not in reader.fieldnames:
-                    return False
-                
-                return any(row.get('keyword') == keyword and row.get('url') == url 
-                          for row in reader)
-                          
-        except Exception as e:
-            logger.error(f"Error checking URL existence: {str(e)}")
-            return False
-    
-    def _save_content(self, keyword: str, url: str, title: str, content: str):
-        """Save content to CSV database"""
+    def _save_content(self, keyword: str, url: str, title: str, content: str) -> Optional[List[Tuple[int, str]]]:
+        """Save content to CSV database with its outline and key sentences
+        
+        Returns the page's key sentences, or None if it was already stored.
+        """
         try:
-            # Create file with headers if it doesn't exist
-            if not self.content_db_path.exists():
-                with open(self.content_db_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['keyword', 'url', 'title', 'content'])
-            
-            if not self._url_exists(keyword, url):
-                with open(self.content_db_path, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([keyword, url, title, content])
-                    logger.debug(f"Saved new content from {url} for keyword '{keyword}'")
-            else:
-                logger.debug(f"URL already exists in database for keyword '{keyword}': {url}")
+            # Duplicate check and append happen under one lock
+            row = {'keyword': keyword, 'url': url, 'title': title, 'content': content}
+            if self.content_store.append_rows([row], unique=('keyword', 'url')):
+                logger.debug(f"Saved new content from {url} for keyword '{keyword}'")
+                # Outline and key sentences are derived once here, only for
+                # new pages, so prompts never rescan the page
+                self.outline_store.append_rows([outline_row(keyword, url, content)], unique=('keyword', 'url'))
+                key_sentences = summarize(content)
+                self.summary_store.append_rows([summary_row(keyword, url, key_sentences)], unique=('keyword', 'url'))
+                return key_sentences
+            
+            logger.debug(f"URL already exists in database for keyword '{keyword}': {url}")
+            return None
             
         except Exception as e:
             logger.error(f"Error saving content: {str(e)}")
             logger.debug("Exception details:", exc_info=True)
+            return None
     
-    def _save_suggestion(self, source_keyword: str, question: str, title: str, url: str):
-        """Save a suggestion to the suggestions database"""
-        with open(self.suggestions_db_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([source_keyword, question, title, url])
+    def _save_suggestions(self, source_keyword: str, questions: List[Dict[str, Any]]):
+        """Save a search's "People Also Ask" questions to the suggestions database"""
+        self.suggestions_store.append_rows([{
+            'source_keyword': source_keyword,
+            'question': qa['question'],
+            'title': qa.get('title', ''),
+            'url': qa.get('link', '')
+        } for qa in questions])
     
     def _get_serp_results(self, keyword: str) -> List[Dict[str, Any]]:
         """Get search results from Serper API"""
@@ -114,12 +91,14 @@ class ExaSearchTool:
                 'Content-Type': 'application/json'
             }
             
-            conn.request("POST", "/search", payload, headers)
-            response = conn.getresponse()
-            data = json.loads(response.read().decode("utf-8"))
+            with span("serper.search", keyword=keyword) as call:
+                conn.request("POST", "/search", payload, headers)
+                response = conn.getresponse()
+                body = response.read().decode("utf-8")
+                call.add_bytes(sent=payload, received=body)
+            data = json.loads(body)
             
-            logger.debug("\nParsed Response:")
-            logger.debug(json.dumps(data, indent=2))
+            logger.debug("\nParsed Response:\n%s", LogPayload(data))
             
             content_urls = []
             
@@ -182,14 +161,9 @@ class ExaSearchTool:
             # Process "People Also Ask" content
             if "peopleAlsoAsk" in data:
                 logger.debug("\nProcessing People Also Ask section")
+                # Always save to suggestions database
+                self._save_suggestions(keyword, data["peopleAlsoAsk"])
                 for qa in data["peopleAlsoAsk"]:
-                    # Always save to suggestions database
-                    self._save_suggestion(
-                        source_keyword=keyword,
-                        question=qa['question'],
-                        title=qa.get('title', ''),
-                        url=qa.get('link', '')
-                    )
                     logger.debug(f"✓ Added Q&A: {qa['question']}")
                     
                     # Add to content URLs if not from skipped domains
@@ -222,13 +196,17 @@ class ExaSearchTool:
             logger.debug(f"\n{'='*50}\nExa Content Scraping\n{'='*50}")
             logger.debug(f"Scraping URL: {url}")
             
-            result = self.exa.get_contents([url], text=True)
+            with span("exa.get_contents", url=url) as call:
+                result = self.exa.get_contents([url], text=True)
+                if result and getattr(result, 'results', None):
+                    call.add_bytes(received=result.results[0].text)
             
             if result and hasattr(result, 'results') and result.results:
                 content = result.results[0]  # First result
                 
-                # Save to database with keyword
-                self._save_content(
+                # Save to database with keyword; key sentences are ranked
+                # only for pages not already stored
+                key_sentences = self._save_content(
                     keyword=keyword,
                     url=content.url,
                     title=content.title,
@@ -238,6 +216,7 @@ class ExaSearchTool:
                 return {
                     'title': content.title,
                     'content': content.text,
+                    'key_sentences': key_sentences,
                     'type': 'article',
                     'metadata': {
                         'url': content.url,
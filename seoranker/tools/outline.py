@@ -0,0 +1,122 @@
+import argparse
+import csv
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+from seoranker.utils.storage import CSVStore
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+OUTLINE_DB_PATH = Path("knowledge_base/source_outlines.csv")
+OUTLINE_FIELDS = ['keyword', 'url', 'outline']
+MAX_HEADINGS = 40
+
+_MARKDOWN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_HTML = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r'<[^>]+>')
+_SETEXT = re.compile(r'^(=+|-+)\s*$')
+_LIST_ITEM = re.compile(r'^([-*+•]|\d+[.)])\s')
+_WORD = re.compile(r'\S+')
+
+def _clean(heading: str) -> str:
+    heading = _TAG.sub('', heading).strip().strip('*_').strip()
+    return heading[:120]
+
+def _looks_like_heading(line: str, next_line: str) -> bool:
+    """Plain-text heading: a short line without sentence punctuation that opens a longer paragraph"""
+    words = len(_WORD.findall(line))
+    return (
+        1 <= words <= 12
+        and len(line) <= 90
+        and line[0].isupper()
+        and not line.endswith(('.', ',', ';', '!'))
+        and not _LIST_ITEM.match(line)
+        and len(_WORD.findall(next_line)) >= 15
+    )
+
+def extract_outline(text: str) -> List[Dict]:
+    """Derive a page's outline: headings with their level and section word counts
+
+    Markdown (``#``, setext) and HTML headings are used when the page has
+    them; otherwise short standalone lines that introduce a paragraph are
+    taken as level-2 headings. Each heading's ``words`` counts the text up to
+    the next heading.
+    """
+    if not text:
+        return []
+
+    if _HTML.search(text):
+        outline = []
+        matches = list(_HTML.finditer(text))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            body = _TAG.sub(' ', text[match.end():end])
+            outline.append({"level": int(match.group(1)), "heading": _clean(match.group(2)),
+                            "words": len(_WORD.findall(body))})
+        return [entry for entry in outline if entry["heading"]][:MAX_HEADINGS]
+
+    lines = [line.strip() for line in text.splitlines()]
+    outline = []
+    section: Optional[Dict] = None
+    structured = any(_MARKDOWN.match(line) for line in lines)
+    skip = False
+
+    for i, line in enumerate(lines):
+        if skip:
+            skip = False
+            continue
+        next_line = next((l for l in lines[i + 1:i + 4] if l), "")
+        heading = None
+
+        markdown = _MARKDOWN.match(line)
+        if markdown:
+            heading = (len(markdown.group(1)), markdown.group(2))
+        elif line and i + 1 < len(lines) and _SETEXT.match(lines[i + 1]) and len(lines[i + 1]) >= 3:
+            heading = (1 if lines[i + 1].startswith('=') else 2, line)
+            skip = True
+        elif not structured and line and (i == 0 or not lines[i - 1]) and _looks_like_heading(line, next_line):
+            heading = (2, line)
+
+        if heading and _clean(heading[1]):
+            section = {"level": heading[0], "heading": _clean(heading[1]), "words": 0}
+            outline.append(section)
+        elif section is not None:
+            section["words"] += len(_WORD.findall(line))
+
+    return outline[:MAX_HEADINGS]
+
+def format_outline(outline: List[Dict]) -> str:
+    """Indented heading list with section lengths for prompts"""
+    if not outline:
+        return ""
+    top = min(entry["level"] for entry in outline)
+    return "\n".join(
+        f"{'  ' * (entry['level'] - top)}- {entry['heading']} ({entry['words']} words)"
+        for entry in outline
+    )
+
+def outline_row(keyword: str, url: str, text: str) -> Dict:
+    return {"keyword": keyword, "url": url, "outline": json.dumps(extract_outline(text))}
+
+def backfill(content_db_path: Path = Path("knowledge_base/content_database.csv")) -> int:
+    """Compute outlines for stored pages ingested before outlines existed"""
+    store = CSVStore(OUTLINE_DB_PATH, OUTLINE_FIELDS)
+    known = {(row["keyword"], row["url"]) for row in store.read_rows()}
+    with open(content_db_path, 'r', encoding='utf-8') as f:
+        rows = [
+            outline_row(row["keyword"], row["url"], row["content"])
+            for row in csv.DictReader(f)
+            if (row["keyword"], row["url"]) not in known
+        ]
+    added = store.append_rows(rows, unique=("keyword", "url"))
+    logger.info(f"Stored outlines for {added} pages")
+    return added
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Page outlines stored next to the content database")
+    parser.add_argument("command", choices=["backfill"], help="backfill: outline pages that have none")
+    parser.add_argument("--content-db", type=Path, default=Path("knowledge_base/content_database.csv"))
+    args = parser.parse_args()
+    backfill(args.content_db)
@@ -0,0 +1,118 @@
+import argparse
+import csv
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+from seoranker.utils.storage import CSVStore
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SUMMARY_DB_PATH = Path("knowledge_base/source_summaries.csv")
+SUMMARY_FIELDS = ['keyword', 'url', 'key_sentences']
+KEY_SENTENCES = 25  # Ranked sentences stored per page
+MAX_SENTENCES = 500  # Candidate sentences ranked per page, from the top
+MIN_WORDS = 6  # Shorter lines are mostly navigation, captions and headings
+MAX_WORDS = 80
+DAMPING = 0.85
+
+_PARAGRAPH = re.compile(r'\n+')
+_SENTENCE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"“(])')
+_WORD = re.compile(r'[a-z0-9]+')
+_STOPWORDS = frozenset("""
+a about after all also an and any are as at be because been but by can could did do does for from
+had has have how if in into is it its just more most no not of on or other our out over so some such
+than that the their them then there these they this those through to up very was we were what when
+where which while who will with would you your
+""".split())
+
+def split_sentences(text: str) -> List[str]:
+    """Candidate sentences of a page, skipping fragments too short or long to summarize with"""
+    sentences = []
+    seen = set()
+    for paragraph in _PARAGRAPH.split(text):
+        for sentence in _SENTENCE.split(paragraph.strip()):
+            sentence = " ".join(sentence.split())
+            words = len(sentence.split())
+            if MIN_WORDS <= words <= MAX_WORDS and sentence.lower() not in seen:
+                seen.add(sentence.lower())
+                sentences.append(sentence)
+                if len(sentences) == MAX_SENTENCES:
+                    return sentences
+    return sentences
+
+def _tfidf(sentences: List[str]) -> np.ndarray:
+    """Row-normalized TF-IDF matrix, one row per sentence"""
+    vocabulary: Dict[str, int] = {}
+    rows = []
+    for sentence in sentences:
+        terms = [t for t in _WORD.findall(sentence.lower()) if len(t) > 2 and t not in _STOPWORDS]
+        rows.append([vocabulary.setdefault(term, len(vocabulary)) for term in terms])
+
+    matrix = np.zeros((len(sentences), max(len(vocabulary), 1)))
+    for i, columns in enumerate(rows):
+        np.add.at(matrix[i], columns, 1.0)
+
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((len(sentences) + 1) / (document_frequency + 1)) + 1
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+def textrank(sentences: List[str], iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    """TextRank score per sentence over the cosine-similarity graph"""
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0)
+
+    vectors = _tfidf(sentences)
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+
+    # Sentences similar to nothing spread their rank evenly
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1.0 / count), where=out_weight > 0)
+
+    scores = np.full(count, 1.0 / count)
+    for _ in range(iterations):
+        updated = (1 - DAMPING) / count + DAMPING * (transition.T @ scores)
+        converged = np.abs(updated - scores).sum() < tolerance
+        scores = updated
+        if converged:
+            break
+    return scores
+
+def summarize(text: str, limit: int = KEY_SENTENCES) -> List[Tuple[int, str]]:
+    """Key sentences of a page as (position, sentence), most central first"""
+    sentences = split_sentences(text or "")
+    if not sentences:
+        return []
+    scores = textrank(sentences)
+    # Stable sort keeps earlier sentences first among equal scores
+    ranked = np.argsort(-scores, kind="stable")[:limit]
+    return [(int(i), sentences[i]) for i in ranked]
+
+def summary_row(keyword: str, url: str, key_sentences: List[Tuple[int, str]]) -> Dict:
+    return {"keyword": keyword, "url": url, "key_sentences": json.dumps(key_sentences)}
+
+def backfill(content_db_path: Path = Path("knowledge_base/content_database.csv")) -> int:
+    """Summarize stored pages ingested before summaries existed"""
+    store = CSVStore(SUMMARY_DB_PATH, SUMMARY_FIELDS)
+    known = {(row["keyword"], row["url"]) for row in store.read_rows()}
+    with open(content_db_path, 'r', encoding='utf-8') as f:
+        rows = [
+            summary_row(row["keyword"], row["url"], summarize(row["content"]))
+            for row in csv.DictReader(f)
+            if (row["keyword"], row["url"]) not in known
+        ]
+    added = store.append_rows(rows, unique=("keyword", "url"))
+    logger.info(f"Stored key sentences for {added} pages")
+    return added
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extractive page summaries stored next to the content database")
+    parser.add_argument("command", choices=["backfill"], help="backfill: summarize pages that have no summary")
+    parser.add_argument("--content-db", type=Path, default=Path("knowledge_base/content_database.csv"))
+    args = parser.parse_args()
+    backfill(args.content_db)
@@ -1,10 +1,9 @@
-import csv
 from pathlib import Path
-from bs4 import BeautifulSoup
 from datetime import datetime
 import re
 from typing import Optional, Dict, List
 from seoranker.utils.logger import setup_logger
+from seoranker.utils.storage import CSVStore
 
 logger = setup_logger(__name__)
 
@@ -23,10 +22,13 @@ class ArchiveManager:
             "word_count",      # Article word count
             "body"             # Full HTML content
         ]
+        self.store = CSVStore(self.archive_path, self.headers)
     
     def extract_metadata_from_html(self, html_path: Path) -> Optional[Dict]:
         """Extract metadata from HTML file"""
         try:
+            from bs4 import BeautifulSoup
+            
             with open(html_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 soup = BeautifulSoup(content, 'html.parser')
@@ -77,16 +79,12 @@ class ArchiveManager:
     def update_archive(self) -> Optional[Dict]:
         """Update blog archive from output directory"""
         try:
-            existing_keywords = set()
-            existing_entries = []
-            
-            # Read existing entries if archive exists
-            if self.archive_path.exists():
-                with open(self.archive_path, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    existing_entries = list(reader)
-                    existing_keywords = {entry["keyword"] for entry in existing_entries}
-                    logger.info(f"Found {len(existing_entries)} existing entries")
+            # Snapshot of existing entries; HTML is parsed without holding the lock
+            self.store.ensure()
+            existing_entries = self.store.read_rows()
+            existing_keywords = {entry["keyword"] for entry in existing_entries}
+            if existing_entries:
+                logger.info(f"Found {len(existing_entries)} existing entries")
             
             # Process new HTML files
             html_files = list(self.output_dir.glob("*.html"))
@@ -106,20 +104,15 @@ class ArchiveManager:
                     new_entries.append(metadata)
                     existing_keywords.add(keyword)
             
-            # Combine existing and new entries
-            all_entries = existing_entries + new_entries
-            
-            # Write updated archive
-            with open(self.archive_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
-                writer.writerows(all_entries)
+            # Append in one locked write; keywords another writer added meanwhile are skipped
+            added = self.store.append_rows(new_entries, unique=("keyword",))
+            skipped_count = len(skipped) + len(new_entries) - added
             
             # Log summary
             logger.info("\nArchive Update Summary:")
             logger.info(f"Existing entries: {len(existing_entries)}")
-            logger.info(f"New entries added: {len(new_entries)}")
-            logger.info(f"Skipped (duplicates): {len(skipped)}")
+            logger.info(f"New entries added: {added}")
+            logger.info(f"Skipped (duplicates): {skipped_count}")
             
             if skipped:
                 logger.debug("\nSkipped keywords:")
@@ -127,9 +120,9 @@ class ArchiveManager:
                     logger.debug(f"- {keyword}")
             
             return {
-                "entries": len(all_entries),
-                "new": len(new_entries),
-                "skipped": len(skipped)
+                "entries": len(existing_entries) + added,
+                "new": added,
+                "skipped": skipped_count
             }
             
         except Exception as e:
@@ -1,20 +1,37 @@
 import os
+import argparse
 import json
+import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from seoranker.config.settings import CONTENT_BUNDLE_MODE, CONTENT_BUNDLE_DIR
 from seoranker.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 class ContentHandler:
-    """Handler for saving and managing generated content"""
+    """Handler for saving and managing generated content
     
-    def __init__(self):
+    By default every article gets its own directory of markdown files. In
+    bundle mode each record is appended to one JSONL segment per run under
+    ``CONTENT_BUNDLE_DIR``, with its offset recorded in ``index.jsonl``;
+    ``export_bundles`` expands them back into the directory layout.
+    """
+    
+    def __init__(self, bundle: bool = CONTENT_BUNDLE_MODE):
         self.base_dir = Path("generated_content")
         self.knowledge_base_dir = Path("knowledge_base")
         # Create both directories
         self.base_dir.mkdir(exist_ok=True)
         self.knowledge_base_dir.mkdir(exist_ok=True)
+        
+        self.bundle = bundle
+        self.bundle_dir = Path(CONTENT_BUNDLE_DIR)
+        self.index_path = self.bundle_dir / "index.jsonl"
+        self._segment_path: Optional[Path] = None
+        self._bundle_lock = threading.Lock()
     
     def _extract_title(self, content: str) -> str:
         """Extract title from blog content"""
@@ -40,138 +57,292 @@ class ContentHandler:
         # If no title found, use first non-empty line
         return lines[0] if lines else "blog-post"
     
+    @staticmethod
+    def _safe_title(blog_title: str) -> str:
+        """Create safe filename from title"""
+        safe_title = "".join(c for c in blog_title if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_title = safe_title.replace(' ', '-').lower()[:100]  # Limit length and make URL-friendly
+        return safe_title or "blog-post"  # Fallback if no valid title found
+    
+    def _content_metadata(self, keyword: str, timestamp: str, blog_title: str, content: dict,
+                          files: Optional[dict] = None) -> dict:
+        metadata = {
+            "title": blog_title,
+            "keyword": keyword,
+            "timestamp": timestamp
+        }
+        if files is not None:
+            metadata["files"] = files
+        return {
+            **metadata,
+            "content_stats": {
+                "blog_length": len(content.get("blog_post", "")),
+                "linkedin_length": len(content.get("linkedin_post", "")),
+                "twitter_thread_length": len(content.get("twitter_thread", "")),
+                "hashtags_count": len(content.get("hashtags", "").split("#")) - 1
+            },
+            **content.get("metadata", {})
+        }
+    
+    # --- Bundle storage ---------------------------------------------------
+    
+    def _segment(self) -> Path:
+        """This run's bundle segment, named on first write"""
+        if self._segment_path is None:
+            self.bundle_dir.mkdir(parents=True, exist_ok=True)
+            run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+            self._segment_path = self.bundle_dir / f"segment_{run_id}.jsonl"
+        return self._segment_path
+    
+    def _append_record(self, record: dict) -> dict:
+        """Append a record to this run's segment and index it by byte offset"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._bundle_lock:
+            segment = self._segment()
+            with open(segment, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+            entry = {
+                "id": record["id"],
+                "kind": record["kind"],
+                "keyword": record["keyword"],
+                "title": record.get("title"),
+                "timestamp": record["timestamp"],
+                "segment": segment.name,
+                "offset": offset,
+                "length": len(line)
+            }
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry
+    
+    def iter_index(self) -> Iterator[dict]:
+        """Yield index entries for every bundled record"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    def load_record(self, entry: dict) -> dict:
+        """Read one bundled record using its index entry"""
+        with open(self.bundle_dir / entry["segment"], "rb") as f:
+            f.seek(entry["offset"])
+            return json.loads(f.read(entry["length"]))
+    
+    def _iter_segment(self, segment: Path) -> Iterator[dict]:
+        with open(segment, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    # --- Directory layout -------------------------------------------------
+    
+    def _write_content_dir(self, keyword: str, timestamp: str, content: dict) -> dict:
+        """Write one article as a directory of markdown files plus metadata.json"""
+        # Create directory for this keyword
+        content_dir = self.base_dir / f"{keyword}_{timestamp}"
+        content_dir.mkdir(exist_ok=True)
+        
+        # Extract title from blog post content
+        blog_content = content.get("blog_post", "")
+        blog_title = self._extract_title(blog_content)
+        safe_title = self._safe_title(blog_title)
+        
+        logger.debug(f"Extracted title: '{blog_title}'")
+        logger.debug(f"Safe filename: '{safe_title}'")
+        
+        saved_files = {}
+        
+        # Save blog post
+        blog_path = content_dir / f"{safe_title}.md"
+        with open(blog_path, "w", encoding="utf-8") as f:
+            f.write(blog_content)
+        saved_files['blog'] = str(blog_path)
+        
+        # Save LinkedIn post
+        linkedin_path = content_dir / "linkedin_post.md"
+        with open(linkedin_path, "w", encoding="utf-8") as f:
+            f.write("# LinkedIn Post\n\n")
+            f.write(content.get("linkedin_post", ""))
+        saved_files['linkedin'] = str(linkedin_path)
+        
+        # Save Twitter thread
+        twitter_path = content_dir / "twitter_thread.md"
+        with open(twitter_path, "w", encoding="utf-8") as f:
+            f.write("# Twitter Thread\n\n")
+            f.write(content.get("twitter_thread", ""))
+        saved_files['twitter'] = str(twitter_path)
+        
+        # Save hashtags
+        hashtags_path = content_dir / "hashtags.md"
+        with open(hashtags_path, "w", encoding="utf-8") as f:
+            f.write("# Key Hashtags\n\n")
+            f.write(content.get("hashtags", ""))
+        saved_files['hashtags'] = str(hashtags_path)
+        
+        # Save metadata with more details
+        meta_path = content_dir / "metadata.json"
+        metadata = self._content_metadata(keyword, timestamp, blog_title, content, saved_files)
+        
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        
+        return {
+            "content_dir": str(content_dir),
+            "title": blog_title,
+            "files": saved_files,
+            "meta_path": str(meta_path)
+        }
+    
+    def _write_search_dir(self, keyword: str, timestamp: str, results: list) -> dict:
+        """Write search results as one markdown file per source plus metadata"""
+        # Create directory for this keyword in knowledge base
+        kb_dir = self.knowledge_base_dir / keyword
+        kb_dir.mkdir(exist_ok=True)
+        
+        # Save each result as a separate markdown file
+        saved_files = []
+        for i, result in enumerate(results, 1):
+            # Create filename from title or index if title is not available
+            title = result.get('title', f'result_{i}')
+            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:50]
+            filename = f"{timestamp}_{safe_title}.md"
+            
+            file_path = kb_dir / filename
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(f"# {result.get('title', 'Untitled')}\n\n")
+                f.write(f"Source: {result.get('metadata', {}).get('url', 'Unknown')}\n")
+                f.write(f"Type: {result.get('type', 'Unknown')}\n")
+                f.write(f"Date: {result.get('metadata', {}).get('published_date', 'Unknown')}\n")
+                f.write("\n---\n\n")
+                f.write(result.get('content', ''))
+            
+            saved_files.append(str(file_path))
+        
+        # Save metadata about this search
+        meta_path = kb_dir / f"{timestamp}_metadata.json"
+        metadata = {
+            "keyword": keyword,
+            "timestamp": timestamp,
+            "num_results": len(results),
+            "sources": [r.get('metadata', {}).get('url') for r in results],
+            "saved_files": saved_files
+        }
+        
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        
+        return {
+            "knowledge_base_dir": str(kb_dir),
+            "saved_files": saved_files,
+            "metadata_file": str(meta_path)
+        }
+    
+    # --- Public API -------------------------------------------------------
+    
     def save_content(self, keyword: str, content: dict) -> dict:
         """Save generated content in appropriate formats"""
         try:
-            # Create directory for this keyword
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            content_dir = self.base_dir / f"{keyword}_{timestamp}"
-            content_dir.mkdir(exist_ok=True)
-            
-            # Extract title from blog post content
-            blog_content = content.get("blog_post", "")
-            blog_title = self._extract_title(blog_content)
-            
-            # Create safe filename from title
-            safe_title = "".join(c for c in blog_title if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_title = safe_title.replace(' ', '-').lower()[:100]  # Limit length and make URL-friendly
-            
-            if not safe_title:  # Fallback if no valid title found
-                safe_title = "blog-post"
-            
-            logger.debug(f"Extracted title: '{blog_title}'")
-            logger.debug(f"Safe filename: '{safe_title}'")
-            
-            saved_files = {}
-            
-            # Save blog post
-            blog_path = content_dir / f"{safe_title}.md"
-            with open(blog_path, "w", encoding="utf-8") as f:
-                f.write(blog_content)
-            saved_files['blog'] = str(blog_path)
             
-            # Save LinkedIn post
-            linkedin_path = content_dir / "linkedin_post.md"
-            with open(linkedin_path, "w", encoding="utf-8") as f:
-                f.write("# LinkedIn Post\n\n")
-                f.write(content.get("linkedin_post", ""))
-            saved_files['linkedin'] = str(linkedin_path)
+            if self.bundle:
+                blog_title = self._extract_title(content.get("blog_post", ""))
+                entry = self._append_record({
+                    "id": uuid.uuid4().hex,
+                    "kind": "content",
+                    "keyword": keyword,
+                    "timestamp": timestamp,
+                    "title": blog_title,
+                    "content": {
+                        field: content.get(field, "")
+                        for field in ("blog_post", "linkedin_post", "twitter_thread", "hashtags")
+                    },
+                    "metadata": self._content_metadata(keyword, timestamp, blog_title, content)
+                })
+                segment = self.bundle_dir / entry["segment"]
+                logger.info(f"Content appended to bundle: {segment} (offset {entry['offset']})")
+                return {
+                    "content_dir": str(segment),
+                    "title": blog_title,
+                    "files": {"bundle": f"{segment}@{entry['offset']}"},
+                    "meta_path": str(self.index_path)
+                }
             
-            # Save Twitter thread
-            twitter_path = content_dir / "twitter_thread.md"
-            with open(twitter_path, "w", encoding="utf-8") as f:
-                f.write("# Twitter Thread\n\n")
-                f.write(content.get("twitter_thread", ""))
-            saved_files['twitter'] = str(twitter_path)
+            result = self._write_content_dir(keyword, timestamp, content)
             
-            # Save hashtags
-            hashtags_path = content_dir / "hashtags.md"
-            with open(hashtags_path, "w", encoding="utf-8") as f:
-                f.write("# Key Hashtags\n\n")
-                f.write(content.get("hashtags", ""))
-            saved_files['hashtags'] = str(hashtags_path)
-            
-            # Save metadata with more details
-            meta_path = content_dir / "metadata.json"
-            metadata = {
-                "title": blog_title,
-                "keyword": keyword,
-                "timestamp": timestamp,
-                "files": saved_files,
-                "content_stats": {
-                    "blog_length": len(blog_content),
-                    "linkedin_length": len(content.get("linkedin_post", "")),
-                    "twitter_thread_length": len(content.get("twitter_thread", "")),
-                    "hashtags_count": len(content.get("hashtags", "").split("#")) - 1
-                },
-                **content.get("metadata", {})
-            }
-            
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
-            
-            logger.info(f"Content saved in directory: {content_dir}")
-            logger.info(f"Blog title: {blog_title}")
-            logger.info(f"Generated files: {list(saved_files.keys())}")
-            
-            return {
-                "content_dir": str(content_dir),
-                "title": blog_title,
-                "files": saved_files,
-                "meta_path": str(meta_path)
-            }
+            logger.info(f"Content saved in directory: {result['content_dir']}")
+            logger.info(f"Blog title: {result['title']}")
+            logger.info(f"Generated files: {list(result['files'].keys())}")
             
+            return result
+        
         except Exception as e:
             logger.error(f"Error saving content: {str(e)}")
-            return {"error": str(e)} 
+            return {"error": str(e)}
     
     def save_search_results(self, keyword: str, results: list) -> dict:
         """Save raw search results to knowledge base"""
         try:
-            # Create directory for this keyword in knowledge base
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            kb_dir = self.knowledge_base_dir / keyword
-            kb_dir.mkdir(exist_ok=True)
             
-            # Save each result as a separate markdown file
-            saved_files = []
-            for i, result in enumerate(results, 1):
-                # Create filename from title or index if title is not available
-                title = result.get('title', f'result_{i}')
-                safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:50]
-                filename = f"{timestamp}_{safe_title}.md"
-                
-                file_path = kb_dir / filename
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(f"# {result.get('title', 'Untitled')}\n\n")
-                    f.write(f"Source: {result.get('metadata', {}).get('url', 'Unknown')}\n")
-                    f.write(f"Type: {result.get('type', 'Unknown')}\n")
-                    f.write(f"Date: {result.get('metadata', {}).get('published_date', 'Unknown')}\n")
-                    f.write("\n---\n\n")
-                    f.write(result.get('content', ''))
-                
-                saved_files.append(str(file_path))
-            
-            # Save metadata about this search
-            meta_path = kb_dir / f"{timestamp}_metadata.json"
-            metadata = {
-                "keyword": keyword,
-                "timestamp": timestamp,
-                "num_results": len(results),
-                "sources": [r.get('metadata', {}).get('url') for r in results],
-                "saved_files": saved_files
-            }
-            
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
-            
-            logger.info(f"Saved {len(saved_files)} results to knowledge base: {kb_dir}")
-            return {
-                "knowledge_base_dir": str(kb_dir),
-                "saved_files": saved_files,
-                "metadata_file": str(meta_path)
-            }
+            if self.bundle:
+                entry = self._append_record({
+                    "id": uuid.uuid4().hex,
+                    "kind": "search",
+                    "keyword": keyword,
+                    "timestamp": timestamp,
+                    "results": results
+                })
+                segment = self.bundle_dir / entry["segment"]
+                logger.info(f"Saved {len(results)} results to bundle: {segment}")
+                return {
+                    "knowledge_base_dir": str(segment),
+                    "saved_files": [f"{segment}@{entry['offset']}"],
+                    "metadata_file": str(self.index_path)
+                }
             
+            result = self._write_search_dir(keyword, timestamp, results)
+            logger.info(f"Saved {len(result['saved_files'])} results to knowledge base: {result['knowledge_base_dir']}")
+            return result
+        
         except Exception as e:
             logger.error(f"Error saving to knowledge base: {str(e)}")
-            return {"error": str(e)} 
\ No newline at end of file
+            return {"error": str(e)}
+    
+    def export_bundles(self, segments: Optional[List[Path]] = None) -> Dict[str, int]:
+        """Expand bundled records into the per-article directory layout
+        
+        Exports every segment in the bundle directory unless ``segments`` is given.
+        """
+        if segments is None:
+            segments = sorted(self.bundle_dir.glob("segment_*.jsonl"))
+        
+        counts = {"content": 0, "search": 0}
+        for segment in segments:
+            for record in self._iter_segment(segment):
+                try:
+                    if record["kind"] == "content":
+                        self._write_content_dir(
+                            record["keyword"],
+                            record["timestamp"],
+                            {**record["content"], "metadata": record.get("metadata", {})}
+                        )
+                    else:
+                        self._write_search_dir(record["keyword"], record["timestamp"], record["results"])
+                    counts[record["kind"]] += 1
+                except Exception as e:
+                    logger.error(f"Error exporting {record.get('kind')} record for {record.get('keyword')}: {str(e)}")
+            logger.info(f"Exported {segment}")
+        
+        return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Expand content bundles into per-article directories")
+    parser.add_argument("command", choices=["export"])
+    parser.add_argument("segments", nargs="*", type=Path, help="Segments to export (default: all)")
+    args = parser.parse_args()
+    
+    counts = ContentHandler(bundle=False).export_bundles(args.segments or None)
+    print(f"Exported {counts['content']} articles and {counts['search']} search results")
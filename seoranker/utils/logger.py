@@ -1,28 +1,96 @@
+import atexit
+import json
 import logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from seoranker.config.settings import LOG_LEVEL, LOG_FORMAT
+from typing import Any, Optional
+from seoranker.config.settings import (
+    LOG_LEVEL,
+    LOG_FORMAT,
+    LOG_FILE,
+    LOG_MAX_BYTES,
+    LOG_BACKUP_COUNT,
+    LOG_PAYLOAD_LIMIT,
+    LOG_PAYLOAD_SAMPLE_RATE
+)
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records without formatting them in the calling thread
+
+    Records never leave the process, so message formatting (including any
+    payloads) is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+class LogPayload:
+    """Large log argument that is serialized and truncated only when written
+
+    Pass as a ``%s`` argument so nothing is formatted for records that are
+    filtered out. A sampled fraction of payloads is written in full.
+    """
+
+    def __init__(self, value: Any, limit: int = LOG_PAYLOAD_LIMIT):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        text = self.value if isinstance(self.value, str) else json.dumps(self.value, indent=2, default=str)
+        if len(text) <= self.limit or random.random() < LOG_PAYLOAD_SAMPLE_RATE:
+            return text
+        return f"{text[:self.limit]}... [truncated {len(text) - self.limit} of {len(text)} chars]"
+
+def _file_level() -> int:
+    level = logging.getLevelName(LOG_LEVEL.upper())
+    return level if isinstance(level, int) else logging.DEBUG
+
+def _get_queue_handler() -> QueueHandler:
+    """Start the shared listener that owns the console and file handlers"""
+    global _queue_handler, _listener
+
+    with _lock:
+        if _queue_handler is None:
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)  # Only INFO and above to console
+            console_handler.setFormatter(logging.Formatter('%(message)s'))  # Simplified console format
+
+            # Rotating file handler for debug logs
+            Path(LOG_FILE).parent.mkdir(exist_ok=True)
+            file_handler = RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8'
+            )
+            file_handler.setLevel(_file_level())
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+            log_queue = queue.SimpleQueue()
+            _queue_handler = _DeferredQueueHandler(log_queue)
+            _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+            _listener.start()
+            atexit.register(_listener.stop)
+
+        return _queue_handler
 
 def setup_logger(name: str) -> logging.Logger:
-    """Set up logger with proper formatting"""
+    """Set up logger that writes through the shared logging queue"""
     logger = logging.getLogger(name)
-    
+
     # Only add handlers if none exist
     if not logger.handlers:
-        logger.setLevel(logging.DEBUG)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)  # Only INFO and above to console
-        console_format = logging.Formatter('%(message)s')  # Simplified console format
-        console_handler.setFormatter(console_format)
-        
-        # File handler for debug logs
-        file_handler = logging.FileHandler('logs/debug.log')
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(file_format)
-        
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-    
-    return logger 
\ No newline at end of file
+        # Records below every handler's level are dropped before any formatting
+        logger.setLevel(min(_file_level(), logging.INFO))
+        logger.addHandler(_get_queue_handler())
+        logger.propagate = False
+
+    return logger
@@ -0,0 +1,136 @@
+import csv
+import fcntl
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class CSVStore:
+    """Shared CSV file safe to write from several threads and processes
+
+    Writers take an advisory lock (``fcntl.flock``) on a ``<file>.lock``
+    sidecar, so the lock survives the data file being replaced. Appends
+    write all of their rows with one ``write`` on an ``O_APPEND`` descriptor,
+    so rows never interleave; rewrites go to a temp file that is renamed
+    over the original, so readers see either the old or the new file, never
+    a partial one. Pass every row of a batch to one call to take the lock
+    once.
+    """
+
+    def __init__(self, path: Path, fieldnames: Sequence[str]):
+        self.path = Path(path)
+        self.fieldnames = list(fieldnames)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    @contextmanager
+    def locked(self, shared: bool = False) -> Iterator[None]:
+        """Hold the file's lock; shared for readers, exclusive for writers"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Tuple[List[str], List[Dict]]:
+        """Header and rows of the file; caller holds the lock"""
+        if not self.path.exists():
+            return self.fieldnames, []
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            return reader.fieldnames or self.fieldnames, rows
+
+    def _format(self, rows: Iterable[Dict], fieldnames: Sequence[str], header: bool) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+
+    def read_rows(self) -> List[Dict]:
+        """All rows, read under a shared lock"""
+        with self.locked(shared=True):
+            return self._read()[1]
+
+    def ensure(self):
+        """Create the file with its header if it is missing or empty"""
+        with self.locked():
+            if not self.path.exists() or self.path.stat().st_size == 0:
+                self._append(b"", header=True)
+
+    def _append(self, data: bytes, header: bool):
+        if header:
+            data = self._format([], self.fieldnames, header=True) + data
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def append_rows(self, rows: List[Dict], unique: Optional[Sequence[str]] = None) -> int:
+        """Append rows under one lock; returns the number of rows written
+
+        With ``unique``, rows whose values for those fields already appear in
+        the file (or earlier in ``rows``) are skipped, checked under the same
+        lock so concurrent writers cannot both add them.
+        """
+        if not rows:
+            return 0
+
+        with self.locked():
+            new_file = not self.path.exists() or self.path.stat().st_size == 0
+            if unique:
+                seen = {tuple(row.get(field, "") for field in unique) for row in self._read()[1]}
+                kept = []
+                for row in rows:
+                    key = tuple(str(row.get(field, "")) for field in unique)
+                    if key not in seen:
+                        seen.add(key)
+                        kept.append(row)
+                rows = kept
+            if rows:
+                self._append(self._format(rows, self.fieldnames, header=False), header=new_file)
+
+        return len(rows)
+
+    def _rewrite(self, rows: List[Dict], fieldnames: Optional[Sequence[str]] = None):
+        """Replace the file's rows via a temp file and rename; caller holds the lock"""
+        data = self._format(rows, fieldnames or self.fieldnames, header=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the original's mode
+            os.chmod(temp_path, self.path.stat().st_mode if self.path.exists() else 0o644)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def update(self, func: Callable[[List[Dict]], Optional[List[Dict]]]) -> List[Dict]:
+        """Read, modify and atomically rewrite the rows under one lock
+
+        ``func`` gets the current rows and changes them in place or returns
+        replacements; the written rows are returned.
+        """
+        with self.locked():
+            fieldnames, rows = self._read()
+            result = func(rows)
+            if result is not None:
+                rows = result
+            self._rewrite(rows, fieldnames)
+            logger.debug(f"Rewrote {self.path} ({len(rows)} rows)")
+            return rows
@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+import atexit
+import json
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO
+from seoranker.config.settings import TRACE_SPANS, SPANS_FILE
+from seoranker.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_write_lock = threading.Lock()
+_spans_file: Optional[TextIO] = None
+
+class Span:
+    """Timing record for one pipeline stage or external call"""
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attrs):
+        self.name = name
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:12]
+        self.attrs = attrs
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def add_bytes(self, sent: Optional[str] = None, received: Optional[str] = None):
+        """Count UTF-8 bytes sent to and received from a stage or service"""
+        if sent:
+            self.bytes_in += len(sent.encode("utf-8"))
+        if received:
+            self.bytes_out += len(received.encode("utf-8"))
+
+def _close_spans_file():
+    global _spans_file
+    with _write_lock:
+        if _spans_file is not None:
+            _spans_file.close()
+            _spans_file = None
+
+atexit.register(_close_spans_file)
+
+def _write(record: Dict):
+    """Append a span record, keeping the file open between spans"""
+    global _spans_file
+    # Resolved per write so a process that changes directory gets its own file
+    path = Path(SPANS_FILE).absolute()
+    with _write_lock:
+        if _spans_file is None or _spans_file.name != str(path):
+            if _spans_file is not None:
+                _spans_file.close()
+            path.parent.mkdir(exist_ok=True)
+            _spans_file = open(path, 'a', encoding='utf-8')
+        # One flushed write per record keeps lines whole across processes
+        _spans_file.write(json.dumps(record) + "\n")
+        _spans_file.flush()
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Span]:
+    """Record wall time, CPU time and bytes in/out for the enclosed block
+
+    Spans nest through a context variable, so stages run in ``asyncio.to_thread``
+    or awaited tasks keep their parent. CPU time is for the current thread, so
+    it is left out (``cpu_ms`` is None) for spans entered on an event loop,
+    where it would include every other coroutine running meanwhile.
+    """
+    current = Span(name, parent=_current_span.get(), **attrs)
+    token = _current_span.set(current)
+    status = "ok"
+    wall_start = time.perf_counter()
+    cpu_start = None if _in_event_loop() else time.thread_time()
+
+    try:
+        yield current
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        cpu_ms = None if cpu_start is None else (time.thread_time() - cpu_start) * 1000
+        _current_span.reset(token)
+
+        if TRACE_SPANS:
+            try:
+                _write({
+                    "trace": current.trace_id,
+                    "span": name,
+                    "parent": current.parent.name if current.parent else None,
+                    "wall_ms": round(wall_ms, 3),
+                    "cpu_ms": None if cpu_ms is None else round(cpu_ms, 3),
+                    "bytes_in": current.bytes_in,
+                    "bytes_out": current.bytes_out,
+                    "status": status,
+                    "ts": datetime.now().isoformat(),
+                    **current.attrs
+                })
+            except Exception as e:
+                logger.error(f"Error writing span {name}: {str(e)}")
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+def load_runs(root: str = "generate_blog", runs: int = 20, path: str = SPANS_FILE) -> List[List[Dict]]:
+    """Get the spans of the last ``runs`` traces whose root span is ``root``"""
+    spans_path = Path(path)
+    if not spans_path.exists():
+        return []
+
+    traces = defaultdict(list)
+    finished = deque(maxlen=runs)
+    with open(spans_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            traces[record["trace"]].append(record)
+            # Root spans are written last, when the whole run has finished
+            if record["parent"] is None and record["span"] == root:
+                finished.append(record["trace"])
+
+    return [traces[trace_id] for trace_id in finished]
+
+def stage_report(root: str = "generate_blog", runs: int = 20, path: str = SPANS_FILE) -> Dict[str, Dict]:
+    """Get p50/p95 wall and CPU time per span name over the last runs"""
+    samples = defaultdict(lambda: {"wall_ms": [], "cpu_ms": [], "bytes_in": 0, "bytes_out": 0})
+    for trace in load_runs(root, runs, path):
+        for record in trace:
+            stats = samples[record["span"]]
+            stats["wall_ms"].append(record["wall_ms"])
+            if record.get("cpu_ms") is not None:
+                stats["cpu_ms"].append(record["cpu_ms"])
+            stats["bytes_in"] += record["bytes_in"]
+            stats["bytes_out"] += record["bytes_out"]
+
+    return {
+        name: {
+            "count": len(stats["wall_ms"]),
+            "wall_p50": _percentile(stats["wall_ms"], 50),
+            "wall_p95": _percentile(stats["wall_ms"], 95),
+            "cpu_p50": _percentile(stats["cpu_ms"], 50),
+            "cpu_p95": _percentile(stats["cpu_ms"], 95),
+            "bytes_in": stats["bytes_in"],
+            "bytes_out": stats["bytes_out"]
+        }
+        for name, stats in samples.items()
+    }
+
+def _cell(value: Optional[float]) -> str:
+    """CPU column; spans timed on the event loop have no CPU time"""
+    return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+def print_report(root: str = "generate_blog", runs: int = 20, path: str = SPANS_FILE):
+    """Print per-stage percentiles, slowest p95 first"""
+    report = stage_report(root, runs, path)
+    if not report:
+        print(f"No completed '{root}' runs in {path}")
+        return
+
+    print(f"\nStage timings over the last {runs} '{root}' runs (ms)")
+    print(f"{'span':<28}{'n':>5}{'wall p50':>11}{'wall p95':>11}{'cpu p50':>10}{'cpu p95':>10}{'KB in':>9}{'KB out':>9}")
+    for name, stats in sorted(report.items(), key=lambda item: item[1]["wall_p95"], reverse=True):
+        print(
+            f"{name:<28}{stats['count']:>5}"
+            f"{stats['wall_p50']:>11.1f}{stats['wall_p95']:>11.1f}"
+            f"{_cell(stats['cpu_p50'])}{_cell(stats['cpu_p95'])}"
+            f"{stats['bytes_in'] / 1024:>9.1f}{stats['bytes_out'] / 1024:>9.1f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report per-stage span timings")
+    parser.add_argument("--runs", type=int, default=20, help="Number of most recent runs to include")
+    parser.add_argument("--root", default="generate_blog", help="Root span that marks one run")
+    parser.add_argument("--path", default=SPANS_FILE)
+    args = parser.parse_args()
+    print_report(args.root, args.runs, args.path)
@@ -0,0 +1,5 @@
+import os
+
+# seoranker.config.settings refuses to import without these; parser tests never call the APIs
+for name in ("SERPER_API_KEY", "EXA_API_KEY", "ANTHROPIC_API_KEY", "GROQ_API_KEY"):
+    os.environ.setdefault(name, "test")
@@ -0,0 +1,76 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from seoranker.agents.section_parser import SECTIONS, SectionParser
+
+DATA = Path(__file__).parent / "data" / "research_responses"
+RESPONSES = sorted(DATA.glob("*.txt"))
+
+
+def _parse(text, chunk_sizes=None):
+    parser = SectionParser()
+    if chunk_sizes is None:
+        parser.feed(text)
+    else:
+        position = 0
+        while position < len(text):
+            size = next(chunk_sizes)
+            parser.feed(text[position:position + size])
+            position += size
+    return parser.close()
+
+
+@pytest.mark.parametrize("path", RESPONSES, ids=lambda path: path.stem)
+def test_all_sections_found(path):
+    parsed = _parse(path.read_text(encoding="utf-8"))
+
+    assert set(parsed) == set(SECTIONS)
+    assert all(parsed[name] for name in SECTIONS)
+    assert parsed["blog_post"].startswith(("Title:", "#"))
+
+
+@pytest.mark.parametrize("path", RESPONSES, ids=lambda path: path.stem)
+@pytest.mark.parametrize("seed", range(5))
+def test_chunked_feed_matches_whole_text(path, seed):
+    text = path.read_text(encoding="utf-8")
+    rng = random.Random(seed)
+    sizes = iter(lambda: rng.randint(1, 40), None)
+
+    assert _parse(text, sizes) == _parse(text)
+
+
+def test_single_character_chunks_match_whole_text():
+    text = (DATA / "markdown_headers.txt").read_text(encoding="utf-8")
+
+    assert _parse(text, iter(lambda: 1, None)) == _parse(text)
+
+
+def test_marker_phrase_inside_paragraph_stays_content():
+    parsed = _parse((DATA / "bold_markers_inline_hashtags.txt").read_text(encoding="utf-8"))
+
+    assert "LinkedIn Post style summary" in parsed["blog_post"]
+    assert "heavier body" in parsed["blog_post"]
+    assert parsed["linkedin_post"].startswith("Cold brew isn't just iced coffee")
+
+    parsed = _parse((DATA / "numbered_sections.txt").read_text(encoding="utf-8"))
+
+    assert "Twitter Thread we published last month" in parsed["blog_post"]
+
+
+def test_text_after_marker_colon_is_kept():
+    parsed = _parse((DATA / "bold_markers_inline_hashtags.txt").read_text(encoding="utf-8"))
+
+    assert parsed["hashtags"] == "#ColdBrew #IcedCoffee #CoffeeScience"
+
+    parsed = _parse((DATA / "numbered_sections.txt").read_text(encoding="utf-8"))
+
+    assert parsed["hashtags"] == "#CoffeeRoasting #LightRoast #DarkRoast\n#CoffeeFacts"
+
+
+def test_preamble_before_first_marker_is_dropped():
+    parsed = _parse((DATA / "markdown_headers.txt").read_text(encoding="utf-8"))
+
+    assert "I'll research" not in "".join(parsed.values())
+    assert parsed["blog_post"].startswith("Title: Instant Coffee Done Right")